@@ -4,39 +4,55 @@ WebSocket-based game server for LLM vs LLM battles.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import threading
 import time
+from typing import Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 # Core imports
-from core.llm.proxy import ProxyLLM
-from core.llm.gemini import GeminiLLM
 from core.game.player import Player
 from core.game.match import Match
 from core.storage import StatsManager
+from core import metrics
 from games.tictactoe.game import TicTacToe
 from games.tictactoe.prompt import PROMPT_TICTACTOE
 from games.tictactoe_plus.game import TicTacToePlus
-from games.tictactoe_plus.prompt import PROMPT_TICTACTOE_PLUS
+from games.tictactoe_plus.prompt import build_prompt
 from games.poker.game import PokerGame
 from games.poker.match import PokerMatch
 from games.poker.prompt import PROMPT_POKER
+from core.llm.cache import get_response_cache
+from core.llm.clients import aclose_clients
+from core.llm.factory import get_llm_instance
 from core.llm.human import HumanLLM
-from config.models import get_enabled_models, is_gemini_model
+from config.models import get_enabled_models, supports_game
+from config.settings import settings
 from core.constants import PLAYER_COLOR_NAMES
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("api")
 
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    lag_monitor = asyncio.create_task(metrics.monitor_event_loop_lag())
+    yield
+    lag_monitor.cancel()
+    # Provider clients are shared by all matches; close their pools on shutdown
+    await aclose_clients()
+
+
 app = FastAPI(
     title="AI Games API",
     description="WebSocket-based game server for LLM vs LLM battles",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS configuration
@@ -50,14 +66,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Board sizes accepted for TicTacToePlus; larger boards blow up prompts and search
+MIN_BOARD_SIZE = 3
+MAX_BOARD_SIZE = 25
+
 
-def get_llm_instance(model_name: str):
-    """Factory function to get appropriate LLM instance based on model name."""
-    if model_name == "human":
-        return HumanLLM()
-    if is_gemini_model(model_name):
-        return GeminiLLM(model_name=model_name)
-    return ProxyLLM(model_name=model_name)
+def clamp(value: int, low: int, high: int) -> int:
+    return max(low, min(high, value))
 
 
 # === REST ENDPOINTS ===
@@ -70,12 +85,12 @@ def read_root():
 
 
 @app.get("/api/models")
-def get_models():
+def get_models(game: Optional[str] = None):
     """
-    Returns list of available models.
+    Returns list of available models, optionally only those that can play `game`.
     This is the single source of truth for model configuration.
     """
-    return get_enabled_models()
+    return get_enabled_models(game)
 
 
 @app.get("/api/stats")
@@ -91,6 +106,28 @@ def reset_stats():
     return {"status": "Stats reset"}
 
 
+@app.get("/metrics")
+def get_metrics():
+    """Prometheus metrics: LLM latency histograms, tokens, errors, server load."""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/api/cache")
+def get_cache_stats():
+    """Returns hit/miss counters of the LLM response cache."""
+    if not settings.LLM_CACHE:
+        return {"enabled": False}
+    return {"enabled": True, **get_response_cache().summary()}
+
+
+@app.post("/api/cache/reset")
+def reset_cache():
+    """Empties the LLM response cache and its counters."""
+    if settings.LLM_CACHE:
+        get_response_cache().clear()
+    return {"status": "Cache reset"}
+
+
 @app.get("/api/stats/export")
 def export_stats(game_type: str = None):
     """Exports all model statistics as a CSV file."""
@@ -180,6 +217,19 @@ async def websocket_endpoint(websocket: WebSocket, match_id: str):
         # Initialize game
         game_type = config.get("game_type", "tictactoe")
 
+        # Local engines only understand the prompts of their own game
+        requested = config.get("players", []) + [
+            config.get("player1"),
+            config.get("player2"),
+        ]
+        unsupported = [m for m in requested if m and not supports_game(m, game_type)]
+        if unsupported:
+            await websocket.send_json(
+                {"error": f"{unsupported[0]} cannot play {game_type}"}
+            )
+            await websocket.close()
+            return
+
         match_instance = None
         players = []
         model_stats = {}
@@ -227,8 +277,27 @@ async def websocket_endpoint(websocket: WebSocket, match_id: str):
         else:
             # Existing logic for TicTacToe
             if game_type == "tictactoe_plus":
-                game = TicTacToePlus()
-                sys_prompt = PROMPT_TICTACTOE_PLUS
+                # m,n,k settings; defaults give the classic 9x9 Connect 5
+                try:
+                    rows = clamp(
+                        int(config.get("rows", 9)), MIN_BOARD_SIZE, MAX_BOARD_SIZE
+                    )
+                    cols = clamp(
+                        int(config.get("cols", rows)), MIN_BOARD_SIZE, MAX_BOARD_SIZE
+                    )
+                    win_condition = clamp(
+                        int(config.get("win_condition", 5)),
+                        MIN_BOARD_SIZE,
+                        max(rows, cols),
+                    )
+                    game = TicTacToePlus(
+                        rows, cols, win_condition, sparse=config.get("sparse")
+                    )
+                except (TypeError, ValueError) as e:
+                    await websocket.send_json({"error": str(e)})
+                    await websocket.close()
+                    return
+                sys_prompt = build_prompt(rows, cols, win_condition)
             else:
                 game = TicTacToe()
                 sys_prompt = (
@@ -276,6 +345,14 @@ async def websocket_endpoint(websocket: WebSocket, match_id: str):
         loop = asyncio.get_running_loop()
         import copy
 
+        def send(message: dict):
+            """Queues a message for the client; safe to call from any thread."""
+            metrics.websocket_pending.inc()
+            future = asyncio.run_coroutine_threadsafe(
+                websocket.send_json(message), loop
+            )
+            future.add_done_callback(lambda _: metrics.websocket_pending.dec())
+
         def on_update(state_data: dict):
             """Callback for game state updates."""
             nonlocal final_winner, final_winner_idx, final_error_by, final_error_by_idx
@@ -306,42 +383,98 @@ async def websocket_endpoint(websocket: WebSocket, match_id: str):
             game_log.append(copy.deepcopy(state_data))
 
             # Send to frontend (thread-safe)
-            asyncio.run_coroutine_threadsafe(websocket.send_json(state_data), loop)
+            send(state_data)
 
-        # Run game in background thread
-        game_thread = threading.Thread(target=match_instance.run, args=(on_update,))
-        game_thread.start()
+        def on_delta(player, delta: str):
+            """Streams a player's reply as it is generated (not logged)."""
+            send(
+                {
+                    "type": "thinking_delta",
+                    "current_player": player.name,
+                    "delta": delta,
+                }
+            )
 
-        # Keep websocket open while game runs and listen for human moves
-        while game_thread.is_alive():
-            try:
-                # Use a small timeout to keep checking game_thread.is_alive()
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=0.5)
-                msg = json.loads(data)
-
-                # Check for human move
-                if msg.get("type") == "human_move":
-                    move = msg.get("move")
-                    logger.info(f"Received human move: {move}")
-
-                    # Fix for Poker "next" and "finish" commands
-                    if move in ["next", "finish"] and hasattr(
-                        match_instance, "process_command"
-                    ):
-                        match_instance.process_command(move)
-                        continue
+        def handle_client_message(data: str):
+            msg = json.loads(data)
 
-                    # Update all Human players
-                    for p in players:
-                        if isinstance(p.llm, HumanLLM):
-                            p.llm.set_move(move)
+            # Check for human move
+            if msg.get("type") == "human_move":
+                move = msg.get("move")
+                logger.info(f"Received human move: {move}")
 
-            except asyncio.TimeoutError:
-                # Just loop back and check game_thread again
-                continue
-            except Exception as e:
-                logger.error(f"WebSocket receive error: {e}")
-                break
+                # Fix for Poker "next" and "finish" commands
+                if move in ["next", "finish"] and hasattr(
+                    match_instance, "process_command"
+                ):
+                    match_instance.process_command(move)
+                    return
+
+                # Update all Human players
+                for p in players:
+                    if isinstance(p.llm, HumanLLM):
+                        p.llm.set_move(move)
+
+        metrics.active_matches.inc()
+        try:
+            if all(p.llm.supports_async for p in players):
+                # Run the game as a task on this event loop
+                game_task = asyncio.create_task(
+                    match_instance.run_async(
+                        on_update, on_delta if settings.STREAM_RESPONSES else None
+                    )
+                )
+                receive_task = None
+
+                # Keep websocket open while game runs and listen for human moves
+                while not game_task.done():
+                    if receive_task is None:
+                        receive_task = asyncio.create_task(websocket.receive_text())
+                    done, _ = await asyncio.wait(
+                        {game_task, receive_task}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if receive_task not in done:
+                        continue
+                    try:
+                        handle_client_message(receive_task.result())
+                    except Exception as e:
+                        logger.error(f"WebSocket receive error: {e}")
+                        # Nobody is listening any more; stop the game
+                        game_task.cancel()
+                        break
+                    finally:
+                        receive_task = None
+
+                if receive_task is not None:
+                    receive_task.cancel()
+                # Let a cancelled game unwind before the results are saved
+                (result,) = await asyncio.gather(game_task, return_exceptions=True)
+                if isinstance(result, Exception):
+                    logger.error(f"Match {match_id} failed: {result}")
+            else:
+                # Fallback for providers without async support: run the game in a
+                # background thread, so blocking LLM calls don't stall the loop
+                game_thread = threading.Thread(
+                    target=match_instance.run, args=(on_update,)
+                )
+                game_thread.start()
+
+                # Keep websocket open while game runs and listen for human moves
+                while game_thread.is_alive():
+                    try:
+                        # Use a small timeout to keep checking game_thread.is_alive()
+                        data = await asyncio.wait_for(
+                            websocket.receive_text(), timeout=0.5
+                        )
+                        handle_client_message(data)
+                    except asyncio.TimeoutError:
+                        # Just loop back and check game_thread again
+                        continue
+                    except Exception as e:
+                        logger.error(f"WebSocket receive error: {e}")
+                        break
+        finally:
+            metrics.active_matches.dec()
 
         try:
             await websocket.send_json({"message": "Session ended"})
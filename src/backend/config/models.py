@@ -3,7 +3,9 @@ Centralized model configuration for AI Games.
 This is the single source of truth for available models.
 """
 
-from typing import List, TypedDict
+from typing import List, NotRequired, Optional, TypedDict
+
+from config.settings import settings
 
 
 class ModelConfig(TypedDict):
@@ -13,6 +15,8 @@ class ModelConfig(TypedDict):
     name: str
     provider: str
     enabled: bool
+    # Game types the model can play; all of them if absent
+    games: NotRequired[List[str]]
 
 
 # === AVAILABLE MODELS ===
@@ -20,6 +24,40 @@ class ModelConfig(TypedDict):
 
 MODELS: List[ModelConfig] = [
     {"id": "human", "name": "Human", "provider": "User", "enabled": True},
+    # Local engines (no API calls), see core/llm/engine.py
+    {
+        "id": "engine-tictactoe",
+        "name": "TicTacToe Engine (Perfect Play)",
+        "provider": "Engine",
+        "enabled": True,
+        "games": ["tictactoe"],
+    },
+    {
+        "id": "engine-connect5",
+        "name": "Connect-5 Engine (Alpha-Beta)",
+        "provider": "Engine",
+        "enabled": True,
+        "games": ["tictactoe_plus"],
+    },
+    # Simulated providers for load testing (no API calls), see core/llm/mock.py
+    {
+        "id": "mock-random",
+        "name": "Mock (Random Moves)",
+        "provider": "Mock",
+        "enabled": settings.MOCK_MODELS,
+    },
+    {
+        "id": "mock-scripted",
+        "name": "Mock (Scripted Moves)",
+        "provider": "Mock",
+        "enabled": settings.MOCK_MODELS,
+    },
+    {
+        "id": "mock-engine",
+        "name": "Mock (Engine Moves)",
+        "provider": "Mock",
+        "enabled": settings.MOCK_MODELS,
+    },
     # Azure OpenAI Models / Proxy (Verified)
     {"id": "gpt-4o", "name": "GPT-4o", "provider": "Azure", "enabled": True},
     {"id": "gpt-4o-mini", "name": "GPT-4o Mini", "provider": "Azure", "enabled": True},
@@ -114,9 +152,13 @@ MODELS: List[ModelConfig] = [
 ]
 
 
-def get_enabled_models() -> List[ModelConfig]:
-    """Returns list of enabled models."""
-    return [m for m in MODELS if m["enabled"]]
+def get_enabled_models(game_type: Optional[str] = None) -> List[ModelConfig]:
+    """Returns list of enabled models, only those that can play game_type if given."""
+    return [
+        m
+        for m in MODELS
+        if m["enabled"] and (game_type is None or supports_game(m["id"], game_type))
+    ]
 
 
 def get_model_by_id(model_id: str) -> ModelConfig | None:
@@ -124,6 +166,12 @@ def get_model_by_id(model_id: str) -> ModelConfig | None:
     return next((m for m in MODELS if m["id"] == model_id), None)
 
 
+def supports_game(model_id: str, game_type: str) -> bool:
+    """Check if model can play game_type. Unknown models are not restricted."""
+    model = get_model_by_id(model_id)
+    return model is None or game_type in model.get("games", [game_type])
+
+
 def get_models_by_provider(provider: str) -> List[ModelConfig]:
     """Returns list of models for a given provider."""
     return [m for m in MODELS if m["provider"] == provider and m["enabled"]]
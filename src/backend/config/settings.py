@@ -1,3 +1,4 @@
+import json
 import os
 from dotenv import load_dotenv
 
@@ -15,6 +16,41 @@ class Settings:
     # Google Gemini
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
+    # Local engine players: thinking time per move in seconds
+    ENGINE_TIME_BUDGET = float(os.getenv("ENGINE_TIME_BUDGET", "1.0"))
+
+    # Shared HTTP pools of the provider clients (core.llm.clients)
+    LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+    LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "20"))
+    LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+
+    # Client-side rate limits per provider name or model id (config/models.py),
+    # e.g. {"Azure": {"rpm": 600, "tpm": 300000}, "gpt-4o": {"rpm": 60}}
+    RATE_LIMITS = json.loads(os.getenv("RATE_LIMITS") or "{}")
+    # Retries of a rate-limited call, and the reply size assumed before it is known
+    RATE_LIMIT_RETRIES = int(os.getenv("RATE_LIMIT_RETRIES", "3"))
+    RATE_LIMIT_COMPLETION_TOKENS = int(os.getenv("RATE_LIMIT_COMPLETION_TOKENS", "500"))
+
+    # Stream replies to the UI and stop reading once the action line is complete
+    STREAM_RESPONSES = os.getenv("STREAM_RESPONSES", "True").lower() == "true"
+
+    # Response cache for repeated LLM calls (core.llm.cache): LRU entries in
+    # memory and a SQLite file below it ("" keeps it in memory only)
+    LLM_CACHE = os.getenv("LLM_CACHE", "False").lower() == "true"
+    LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "data/cache/llm_responses.sqlite3")
+
+    # Record/replay of LLM calls (core.llm.cassette): "record", "replay" or "".
+    # Replay sleeps the recorded latency times LLM_CASSETTE_LATENCY.
+    LLM_CASSETTE = os.getenv("LLM_CASSETTE", "").lower()
+    LLM_CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", "data/cassettes/llm.jsonl")
+    LLM_CASSETTE_LATENCY = float(os.getenv("LLM_CASSETTE_LATENCY", "1.0"))
+
+    # Mock models for load testing (core.llm.mock): listed in the UI when
+    # MOCK_MODELS is set; MOCK_LLM configures latency, tokens and failures
+    MOCK_MODELS = os.getenv("MOCK_MODELS", "False").lower() == "true"
+    MOCK_LLM = json.loads(os.getenv("MOCK_LLM") or "{}")
+
     # App
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
 
@@ -76,3 +76,38 @@ class BaseGame(ABC):
             str: A text description of the game state tailored for the LLM player.
         """
         return self.get_board_state()
+
+    @abstractmethod
+    def snapshot(self) -> Any:
+        """
+        Capture the full game state so it can be restored later.
+
+        Used for search, rollouts and checkpoints, where state is branched many
+        times, so implementations copy only their mutable containers.
+
+        Returns:
+            Any: An opaque state object that is only meant for restore() of the
+                 same game class. One snapshot can be restored any number of times.
+        """
+        pass
+
+    @abstractmethod
+    def restore(self, state: Any) -> None:
+        """
+        Reset the game to a state captured by snapshot().
+
+        Args:
+            state (Any): A snapshot taken from an instance of the same game class.
+        """
+        pass
+
+    def clone(self) -> "BaseGame":
+        """
+        Create an independent copy of the game without going through __init__.
+
+        Returns:
+            BaseGame: A new game in the same state as this one.
+        """
+        game = self.__class__.__new__(self.__class__)
+        game.restore(self.snapshot())
+        return game
@@ -1,4 +1,4 @@
-from typing import List, Callable, Optional
+from typing import Any, Callable, Generator, List, NamedTuple, Optional
 from core.game.base import BaseGame
 from core.game.player import Player
 from core.llm.models import LLMResponse
@@ -7,6 +7,18 @@ from utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
+class MoveRequest(NamedTuple):
+    """Yielded by a match loop when it needs `player`'s response to `state`."""
+
+    player: Player
+    state: str
+
+
+# A match loop yields requests (e.g. MoveRequest) and is sent their results.
+# Exceptions raised while serving a request are thrown back into the loop.
+MatchLoop = Generator[Any, Any, None]
+
+
 class Match:
     def __init__(self, game: BaseGame, players: List[Player], system_prompt: str):
         self.game = game
@@ -14,6 +26,8 @@ class Match:
         self.system_prompt = system_prompt
         self.current_player_idx = 0
         self.is_running = False
+        # Set by run_async to stream LLM text while a player thinks
+        self._on_delta: Optional[Callable[[Player, str], None]] = None
 
     def _extract_action(self, text: str) -> str:
         """Parses the LLM response to find the action on the last line."""
@@ -38,8 +52,69 @@ class Match:
 
     def run(self, on_update: Optional[Callable[[dict], None]] = None):
         """
-        Runs the game loop.
+        Runs the game loop, blocking on every LLM call (use a thread).
+        :param on_update: Function called on every state change (for Frontend).
+        """
+        steps = self._play(on_update)
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    result = self._serve(request)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(result)
+        except StopIteration:
+            pass
+
+    async def run_async(
+        self,
+        on_update: Optional[Callable[[dict], None]] = None,
+        on_delta: Optional[Callable[[Player, str], None]] = None,
+    ):
+        """
+        Runs the game loop on the event loop, awaiting LLM calls.
         :param on_update: Function called on every state change (for Frontend).
+        :param on_delta: If given, responses are streamed and this is called
+            with the player and each new piece of text.
+        """
+        self._on_delta = on_delta
+        steps = self._play(on_update)
+        try:
+            request = next(steps)
+            while True:
+                try:
+                    result = await self._aserve(request)
+                except Exception as e:
+                    request = steps.throw(e)
+                else:
+                    request = steps.send(result)
+        except StopIteration:
+            pass
+
+    def _serve(self, request: Any) -> Any:
+        """Fulfils a request yielded by _play, blocking."""
+        if isinstance(request, MoveRequest):
+            return request.player.get_move(request.state, self.system_prompt)
+        raise TypeError(f"Unknown match request: {request!r}")
+
+    async def _aserve(self, request: Any) -> Any:
+        """Fulfils a request yielded by _play, awaiting."""
+        if isinstance(request, MoveRequest):
+            player = request.player
+            if self._on_delta is None:
+                return await player.aget_move(request.state, self.system_prompt)
+            on_delta = self._on_delta
+            return await player.astream_move(
+                request.state, self.system_prompt, lambda text: on_delta(player, text)
+            )
+        raise TypeError(f"Unknown match request: {request!r}")
+
+    def _play(self, on_update: Optional[Callable[[dict], None]]) -> MatchLoop:
+        """
+        The game loop. It yields a MoveRequest for every LLM call, so the same
+        loop runs blocking (run) or on an event loop (run_async).
         """
         self.is_running = True
         logger.info(f"Match starting: {self.players[0].name} vs {self.players[1].name}")
@@ -66,9 +141,7 @@ class Match:
             # Get move from LLM
             state = self.game.get_state_for_player(self.current_player_idx)
             try:
-                response: LLMResponse = current_player.get_move(
-                    state, self.system_prompt
-                )
+                response: LLMResponse = yield MoveRequest(current_player, state)
                 move_raw = self._extract_action(response.content)
                 metrics = response.metrics
 
@@ -1,5 +1,7 @@
 from core.llm.models import LLMResponse
 from core.llm.base import BaseLLM
+from core.llm.streaming import DeltaCallback
+from core.metrics import record_llm_response
 
 
 class Player:
@@ -37,4 +39,38 @@ class Player:
         user_prompt = game_state
 
         response: LLMResponse = self.llm.generate(system_prompt, user_prompt)
+        record_llm_response(response, self.llm)
+        return response
+
+    async def aget_move(self, game_state: str, system_prompt: str) -> LLMResponse:
+        """
+        Async version of get_move, for matches running on an event loop.
+
+        Args:
+            game_state (str): The current state of the game derived from get_state_for_player.
+            system_prompt (str): The system prompt defining the game rules and persona.
+
+        Returns:
+            LLMResponse: The full response from the LLM, including content and metrics.
+        """
+        response = await self.llm.agenerate(system_prompt, game_state)
+        record_llm_response(response, self.llm)
+        return response
+
+    async def astream_move(
+        self, game_state: str, system_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        """
+        Like aget_move, but passes the response text to on_delta as it streams in.
+
+        Args:
+            game_state (str): The current state of the game derived from get_state_for_player.
+            system_prompt (str): The system prompt defining the game rules and persona.
+            on_delta (DeltaCallback): Called with each new piece of text.
+
+        Returns:
+            LLMResponse: The full response from the LLM, including content and metrics.
+        """
+        response = await self.llm.astream(system_prompt, game_state, on_delta)
+        record_llm_response(response, self.llm)
         return response
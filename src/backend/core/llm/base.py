@@ -1,6 +1,8 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 from core.llm.models import LLMResponse
+from core.llm.streaming import DeltaCallback
 
 
 class BaseLLM(ABC):
@@ -9,6 +11,17 @@ class BaseLLM(ABC):
     Each provider (Azure Proxy, Gemini) must implement the generate method.
     """
 
+    # True if agenerate is implemented natively instead of in a worker thread.
+    # Matches whose players all support it run on the event loop.
+    supports_async: bool = False
+
+    # False for players answered locally (humans, engines, replays). Only
+    # remote calls are counted in the LLM request and latency metrics.
+    is_remote: bool = True
+
+    # Sampling temperature sent with requests (None: provider default)
+    temperature: Optional[float] = None
+
     def __init__(self, model_name: str, api_key: str, api_base: Optional[str] = None):
         self.model_name = model_name
         self.api_key = api_key
@@ -27,3 +40,39 @@ class BaseLLM(ABC):
             LLMResponse with content and metrics
         """
         pass
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        """
+        Async version of generate.
+
+        The default runs generate in a worker thread, so sync providers keep
+        working from async code. Providers with an async client override it.
+
+        Args:
+            system_prompt: System context/instructions
+            user_prompt: User message/query
+
+        Returns:
+            LLMResponse with content and metrics
+        """
+        return await asyncio.to_thread(self.generate, system_prompt, user_prompt)
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        """
+        Streaming version of agenerate.
+
+        Calls on_delta with text as it arrives and may stop early once the
+        response contains a complete "action : ..." line. The default does
+        not stream: it awaits agenerate without calling on_delta.
+
+        Args:
+            system_prompt: System context/instructions
+            user_prompt: User message/query
+            on_delta: Called with each new piece of text
+
+        Returns:
+            LLMResponse with content and metrics
+        """
+        return await self.agenerate(system_prompt, user_prompt)
@@ -0,0 +1,216 @@
+"""
+Response cache for LLM calls.
+
+The same (model, temperature, system prompt, game state) call comes up again
+and again, e.g. common TicTacToe positions across matches. CachedLLM wraps a
+provider and answers such calls from an in-memory LRU and, below it, a SQLite
+file that survives restarts, so reruns and stress tests do not spend provider
+quota. Enabled by settings.LLM_CACHE.
+
+Cached replies keep the metrics of the original call, so match statistics
+stay comparable; `cached` marks them. Error replies are never stored.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from config.settings import settings
+from core.llm.base import BaseLLM
+from core.llm.models import LLMResponse
+from core.llm.streaming import DeltaCallback
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0
+
+
+def cache_key(
+    model_name: str,
+    temperature: Optional[float],
+    system_prompt: str,
+    user_prompt: str,
+) -> str:
+    """Stable key of a call; a different temperature is a different call."""
+    payload = json.dumps([model_name, temperature, system_prompt, user_prompt])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier response store: an LRU of `max_entries` in memory in front of an
+    optional SQLite file. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int = 1024, path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self.model_stats: Dict[str, CacheStats] = {}
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, model TEXT, response TEXT, created REAL)"
+            )
+            self._db.commit()
+
+    def _count(self, model_name: str, field: str):
+        for stats in (
+            self.stats,
+            self.model_stats.setdefault(model_name, CacheStats()),
+        ):
+            setattr(stats, field, getattr(stats, field) + 1)
+
+    def _remember(self, key: str, data: str):
+        self._memory[key] = data
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str, model_name: str) -> Optional[LLMResponse]:
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self._count(model_name, "memory_hits")
+            elif self._db is not None:
+                row = self._db.execute(
+                    "SELECT response FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    data = row[0]
+                    self._remember(key, data)
+                    self._count(model_name, "disk_hits")
+            if data is None:
+                self._count(model_name, "misses")
+                return None
+        return LLMResponse.model_validate_json(data)
+
+    def put(self, key: str, response: LLMResponse):
+        # Prompts are part of the key; the caller puts them back on a hit
+        data = response.model_dump_json(exclude={"system_prompt", "user_prompt"})
+        with self._lock:
+            self._remember(key, data)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, response.model_name, data, time.time()),
+                )
+                self._db.commit()
+
+    def summary(self) -> dict:
+        """Hit/miss counters, overall and per model."""
+        with self._lock:
+            return {
+                "entries_in_memory": len(self._memory),
+                **asdict(self.stats),
+                "hit_rate": self.stats.hit_rate,
+                "models": {
+                    name: {**asdict(stats), "hit_rate": stats.hit_rate}
+                    for name, stats in self.model_stats.items()
+                },
+            }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self.stats = CacheStats()
+            self.model_stats.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """The process-wide cache configured by settings."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(settings.LLM_CACHE_SIZE, settings.LLM_CACHE_PATH)
+        return _cache
+
+
+class CachedLLM(BaseLLM):
+    """
+    Wraps another LLM and serves repeated calls from the response cache.
+    """
+
+    def __init__(self, llm: BaseLLM, cache: Optional[ResponseCache] = None):
+        super().__init__(llm.model_name, llm.api_key, llm.api_base)
+        self.llm = llm
+        self.cache = cache or get_response_cache()
+        self.supports_async = llm.supports_async
+        self.is_remote = llm.is_remote
+
+    def _key(self, system_prompt: str, user_prompt: str) -> str:
+        temperature = getattr(self.llm, "temperature", None)
+        return cache_key(self.model_name, temperature, system_prompt, user_prompt)
+
+    def _lookup(
+        self, key: str, system_prompt: str, user_prompt: str
+    ) -> Optional[LLMResponse]:
+        response = self.cache.get(key, self.model_name)
+        if response is not None:
+            response.cached = True
+            response.system_prompt = system_prompt
+            response.user_prompt = user_prompt
+        return response
+
+    def _store(self, key: str, response: LLMResponse):
+        if not response.content.startswith("ERROR:"):
+            self.cache.put(key, response)
+
+    def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        key = self._key(system_prompt, user_prompt)
+        response = self._lookup(key, system_prompt, user_prompt)
+        if response is None:
+            response = self.llm.generate(system_prompt, user_prompt)
+            self._store(key, response)
+        return response
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        key = self._key(system_prompt, user_prompt)
+        response = self._lookup(key, system_prompt, user_prompt)
+        if response is None:
+            response = await self.llm.agenerate(system_prompt, user_prompt)
+            self._store(key, response)
+        return response
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        key = self._key(system_prompt, user_prompt)
+        response = self._lookup(key, system_prompt, user_prompt)
+        if response is not None:
+            on_delta(response.content)
+            return response
+        response = await self.llm.astream(system_prompt, user_prompt, on_delta)
+        self._store(key, response)
+        return response
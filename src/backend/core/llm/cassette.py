@@ -0,0 +1,184 @@
+"""
+Record/replay of LLM traffic.
+
+With settings.LLM_CASSETTE = "record", every call of a provider is appended
+to a cassette file (JSON lines: model, a hash of the prompts and the
+response with its metrics). With "replay", providers are replaced by
+ReplayLLM, which answers from that file without any network, optionally
+sleeping for the recorded latency (settings.LLM_CASSETTE_LATENCY, a factor;
+0 answers at once). Whole tournaments and WebSocket sessions can so be rerun
+to benchmark engine or storage changes against realistic traffic.
+
+Calls are matched by model and prompts; repeated identical calls replay in
+recorded order and start over once used up. Games that deal or shuffle at
+random only replay exactly when their seed is fixed.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.settings import settings
+from core.llm.base import BaseLLM
+from core.llm.models import LLMMetrics, LLMResponse
+from core.llm.streaming import DeltaCallback
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def call_key(model_name: str, system_prompt: str, user_prompt: str) -> str:
+    payload = json.dumps([model_name, system_prompt, user_prompt])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class Cassette:
+    """An append-only file of recorded calls. Safe to share between threads."""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._tracks: Optional[Dict[str, List[str]]] = None
+        self._played: Dict[str, int] = defaultdict(int)
+
+    def record(self, key: str, response: LLMResponse):
+        # Prompts are only kept as part of the key
+        data = response.model_dump(exclude={"system_prompt", "user_prompt"})
+        line = json.dumps({"key": key, "model": response.model_name, "response": data})
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+
+    def _load(self) -> Dict[str, List[str]]:
+        tracks: Dict[str, List[str]] = defaultdict(list)
+        if self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        tracks[entry["key"]].append(json.dumps(entry["response"]))
+        logger.info(f"Loaded {sum(map(len, tracks.values()))} calls from {self.path}")
+        return tracks
+
+    def play(self, key: str) -> Optional[LLMResponse]:
+        """Next recorded response for this call, or None if it was never recorded."""
+        with self._lock:
+            if self._tracks is None:
+                self._tracks = self._load()
+            track = self._tracks.get(key)
+            if not track:
+                return None
+            data = track[self._played[key] % len(track)]
+            self._played[key] += 1
+        return LLMResponse.model_validate_json(data)
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: Optional[str] = None) -> Cassette:
+    """Shared cassette for a file (default: settings.LLM_CASSETTE_PATH)."""
+    path = path or settings.LLM_CASSETTE_PATH
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None:
+            cassette = Cassette(path)
+            _cassettes[path] = cassette
+        return cassette
+
+
+class RecordingLLM(BaseLLM):
+    """
+    Wraps another LLM and records each of its responses to a cassette.
+    """
+
+    def __init__(self, llm: BaseLLM, cassette: Optional[Cassette] = None):
+        super().__init__(llm.model_name, llm.api_key, llm.api_base)
+        self.llm = llm
+        self.cassette = cassette or get_cassette()
+        self.supports_async = llm.supports_async
+        self.is_remote = llm.is_remote
+        self.temperature = llm.temperature
+
+    def _record(self, system_prompt: str, user_prompt: str, response: LLMResponse):
+        key = call_key(self.model_name, system_prompt, user_prompt)
+        self.cassette.record(key, response)
+
+    def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        response = self.llm.generate(system_prompt, user_prompt)
+        self._record(system_prompt, user_prompt, response)
+        return response
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        response = await self.llm.agenerate(system_prompt, user_prompt)
+        self._record(system_prompt, user_prompt, response)
+        return response
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        response = await self.llm.astream(system_prompt, user_prompt, on_delta)
+        self._record(system_prompt, user_prompt, response)
+        return response
+
+
+class ReplayLLM(BaseLLM):
+    """
+    Answers from a cassette instead of a provider; needs no API key.
+    """
+
+    supports_async = True
+    is_remote = False
+
+    def __init__(
+        self,
+        model_name: str,
+        cassette: Optional[Cassette] = None,
+        latency: Optional[float] = None,
+    ):
+        super().__init__(model_name, "")
+        self.cassette = cassette or get_cassette()
+        self.latency = settings.LLM_CASSETTE_LATENCY if latency is None else latency
+
+    def _replay(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        key = call_key(self.model_name, system_prompt, user_prompt)
+        response = self.cassette.play(key)
+        if response is None:
+            logger.warning(f"No recorded response of {self.model_name} for this call")
+            response = LLMResponse(
+                content="ERROR: No recorded response for this call.",
+                metrics=LLMMetrics(
+                    latency_ms=0, prompt_tokens=0, completion_tokens=0, total_tokens=0
+                ),
+                model_name=self.model_name,
+            )
+        response.system_prompt = system_prompt
+        response.user_prompt = user_prompt
+        return response
+
+    def _delay(self, response: LLMResponse) -> float:
+        return response.metrics.latency_ms / 1000 * self.latency
+
+    def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        response = self._replay(system_prompt, user_prompt)
+        time.sleep(self._delay(response))
+        return response
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        response = self._replay(system_prompt, user_prompt)
+        await asyncio.sleep(self._delay(response))
+        return response
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        response = await self.agenerate(system_prompt, user_prompt)
+        on_delta(response.content)
+        return response
@@ -0,0 +1,118 @@
+"""
+Process-wide provider clients.
+
+Creating an SDK client per player means a new connection pool, and new
+TCP/TLS handshakes, for every match. Clients here are created once per
+credentials and shared by all LLM instances, with keep-alive pools sized by
+settings (LLM_MAX_CONNECTIONS, LLM_MAX_KEEPALIVE, LLM_KEEPALIVE_EXPIRY).
+
+Async clients belong to the event loop they are first used on, which is the
+server's loop in the API.
+
+SDK-level retries are off: core.llm.ratelimit.Throttle retries rate-limited
+calls itself, so every attempt is charged to the shared budgets.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from google import genai
+from google.genai import types
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from config.settings import settings
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_lock = threading.Lock()
+_openai_clients: Dict[Tuple[str, str], OpenAI] = {}
+_async_openai_clients: Dict[Tuple[str, str], AsyncOpenAI] = {}
+_genai_clients: Dict[str, genai.Client] = {}
+# The Gemini SDK does not close pools it was given, so they are kept here
+_genai_pools: List[Tuple[httpx.Client, httpx.AsyncClient]] = []
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.LLM_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_MAX_KEEPALIVE,
+        keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY,
+    )
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> OpenAI:
+    """Shared sync OpenAI-compatible client for these credentials."""
+    key = (api_key, base_url or "")
+    with _lock:
+        client = _openai_clients.get(key)
+        if client is None:
+            logger.info(f"Creating OpenAI client for {base_url or 'default URL'}")
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=0,
+                http_client=DefaultHttpxClient(limits=_limits()),
+            )
+            _openai_clients[key] = client
+        return client
+
+
+def get_async_openai_client(
+    api_key: str, base_url: Optional[str] = None
+) -> AsyncOpenAI:
+    """Shared async OpenAI-compatible client for these credentials."""
+    key = (api_key, base_url or "")
+    with _lock:
+        client = _async_openai_clients.get(key)
+        if client is None:
+            logger.info(f"Creating async OpenAI client for {base_url or 'default URL'}")
+            client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                max_retries=0,
+                http_client=DefaultAsyncHttpxClient(limits=_limits()),
+            )
+            _async_openai_clients[key] = client
+        return client
+
+
+def get_genai_client(api_key: str) -> genai.Client:
+    """Shared Gemini client; `client.aio` is its async counterpart."""
+    with _lock:
+        client = _genai_clients.get(api_key)
+        if client is None:
+            logger.info("Creating Gemini client")
+            pool = httpx.Client(limits=_limits()), httpx.AsyncClient(limits=_limits())
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    httpx_client=pool[0],
+                    httpx_async_client=pool[1],
+                    retry_options=types.HttpRetryOptions(attempts=1),
+                ),
+            )
+            _genai_clients[api_key] = client
+            _genai_pools.append(pool)
+        return client
+
+
+async def aclose_clients():
+    """Closes all shared clients and their pools (e.g. on server shutdown)."""
+    with _lock:
+        openai_clients = list(_openai_clients.values())
+        async_clients = list(_async_openai_clients.values())
+        genai_pools = list(_genai_pools)
+        _openai_clients.clear()
+        _async_openai_clients.clear()
+        _genai_clients.clear()
+        _genai_pools.clear()
+
+    for client in openai_clients:
+        client.close()
+    for client in async_clients:
+        await client.close()
+    for sync_pool, async_pool in genai_pools:
+        sync_pool.close()
+        await async_pool.aclose()
@@ -0,0 +1,83 @@
+"""
+Built-in game engines exposed as LLM players.
+
+An engine reads the same user prompt an LLM would get, computes a move locally
+and answers in the "action : <move>" format Match._extract_action expects.
+They cost no tokens, so they make cheap reference opponents.
+"""
+
+import time
+from typing import Callable, Dict, Tuple
+
+from config.settings import settings
+from core.llm.base import BaseLLM
+from core.llm.models import LLMMetrics, LLMResponse
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def _tictactoe_move(user_prompt: str) -> Tuple[str, str]:
+    from games.tictactoe.solver import best_move, position_from_prompt
+
+    symbol, me, opp = position_from_prompt(user_prompt)
+    move = best_move(me, opp)
+    if move is None:
+        raise ValueError("No move available, the game is over")
+    return f"{move[0]},{move[1]}", f"Perfect play as {symbol}"
+
+
+def _connect5_move(user_prompt: str) -> Tuple[str, str]:
+    from games.tictactoe_plus.search import board_from_prompt, choose_move
+
+    symbol, board, win_length = board_from_prompt(user_prompt)
+    (r, c), reason = choose_move(board, symbol, win_length, settings.ENGINE_TIME_BUDGET)
+    return f"{r},{c}", f"Playing {symbol}: {reason}"
+
+
+# Model id -> function mapping a user prompt to (move, explanation)
+ENGINES: Dict[str, Callable[[str], Tuple[str, str]]] = {
+    "engine-tictactoe": _tictactoe_move,
+    "engine-connect5": _connect5_move,
+}
+
+
+def is_engine_model(model_id: str) -> bool:
+    return model_id in ENGINES
+
+
+class EngineLLM(BaseLLM):
+    """Plays with a local engine from ENGINES instead of calling a model API."""
+
+    is_remote = False
+
+    def __init__(self, model_name: str):
+        if model_name not in ENGINES:
+            raise ValueError(f"Unknown engine: {model_name}")
+        # Engines don't need API keys
+        super().__init__(model_name=model_name, api_key="none")
+        self.engine = ENGINES[model_name]
+
+    def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        start_time = time.perf_counter()
+        try:
+            move, thinking = self.engine(user_prompt)
+            content = f"action : {move}"
+        except ValueError as e:
+            logger.error(f"Engine {self.model_name} could not move: {e}")
+            content = f"ERROR: {e}"
+            thinking = None
+
+        return LLMResponse(
+            content=content,
+            metrics=LLMMetrics(
+                latency_ms=(time.perf_counter() - start_time) * 1000,
+                prompt_tokens=0,
+                completion_tokens=0,
+                total_tokens=0,
+            ),
+            model_name=self.model_name,
+            thinking=thinking,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
@@ -0,0 +1,38 @@
+"""
+Builds the LLM player for a model id.
+
+Shared by the API server and the CLI so both pick providers and apply the
+cache and cassette wrappers the same way.
+"""
+
+from config.models import is_gemini_model
+from config.settings import settings
+from core.llm.base import BaseLLM
+from core.llm.cache import CachedLLM
+from core.llm.cassette import RecordingLLM, ReplayLLM
+from core.llm.engine import EngineLLM, is_engine_model
+from core.llm.gemini import GeminiLLM
+from core.llm.human import HumanLLM
+from core.llm.mock import MockLLM, is_mock_model
+from core.llm.proxy import ProxyLLM
+
+
+def get_llm_instance(model_name: str) -> BaseLLM:
+    """Factory function to get appropriate LLM instance based on model name."""
+    if model_name == "human":
+        return HumanLLM()
+    if is_engine_model(model_name):
+        return EngineLLM(model_name)
+    if is_mock_model(model_name):
+        return MockLLM(model_name)
+    if settings.LLM_CASSETTE == "replay":
+        return ReplayLLM(model_name)
+    if is_gemini_model(model_name):
+        llm = GeminiLLM(model_name=model_name)
+    else:
+        llm = ProxyLLM(model_name=model_name)
+    if settings.LLM_CACHE:
+        llm = CachedLLM(llm)
+    if settings.LLM_CASSETTE == "record":
+        llm = RecordingLLM(llm)
+    return llm
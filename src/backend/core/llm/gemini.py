@@ -1,7 +1,9 @@
-from google import genai
 from google.genai import types
 from core.llm.base import BaseLLM
+from core.llm.clients import get_genai_client
 from core.llm.models import LLMResponse, LLMMetrics
+from core.llm.ratelimit import Throttle
+from core.llm.streaming import ActionDetector, DeltaCallback
 from config.settings import settings
 import logging
 import time
@@ -9,11 +11,18 @@ import time
 logger = logging.getLogger(__name__)
 
 
+def _total_tokens(response) -> int | None:
+    usage = response.usage_metadata
+    return usage.total_token_count if usage else None
+
+
 class GeminiLLM(BaseLLM):
     """
     Implementation of LLM for Google Gemini using the new `google-genai` SDK.
     """
 
+    supports_async = True
+
     def __init__(self, model_name: str = "gemini-1.5-pro"):
         super().__init__(model_name, settings.GEMINI_API_KEY or "")
 
@@ -21,51 +30,154 @@ class GeminiLLM(BaseLLM):
             logger.warning("Missing Gemini API Key in configuration.")
             self.client = None
         else:
-            # New SDK Initialization
-            self.client = genai.Client(api_key=self.api_key)
+            # Shared per API key, so matches reuse open connections
+            self.client = get_genai_client(self.api_key)
+        self.throttle = Throttle(model_name, "Google")
+
+    def _generate_content(self, model: str, contents: str, config):
+        return self.throttle.call(
+            lambda: self.client.models.generate_content(
+                model=model, contents=contents, config=config
+            ),
+            Throttle.estimate_tokens(contents),
+            _total_tokens,
+        )
+
+    async def _agenerate_content(self, model: str, contents: str, config):
+        return await self.throttle.acall(
+            lambda: self.client.aio.models.generate_content(
+                model=model, contents=contents, config=config
+            ),
+            Throttle.estimate_tokens(contents),
+            _total_tokens,
+        )
+
+    async def _open_stream(self, model: str, contents: str, config):
+        """Starts a streamed generation; returns the stream and its first chunk."""
+
+        async def open_stream():
+            # The request is only sent once the stream is read, so errors
+            # (rate limits, unknown model) surface on the first chunk
+            stream = await self.client.aio.models.generate_content_stream(
+                model=model, contents=contents, config=config
+            )
+            try:
+                return stream, await anext(stream)
+            except BaseException:
+                await stream.aclose()
+                raise
+
+        return await self.throttle.acall(
+            open_stream, Throttle.estimate_tokens(contents), lambda _: None
+        )
+
+    def _missing_key_response(self) -> LLMResponse:
+        return LLMResponse(
+            content="ERROR: Missing Gemini API Key.",
+            metrics=LLMMetrics(
+                latency_ms=0, prompt_tokens=0, completion_tokens=0, total_tokens=0
+            ),
+            model_name=self.model_name,
+        )
+
+    def _generate_config(self) -> types.GenerateContentConfig:
+        # Safety settings (Updated for new SDK if needed, though defaults are often fine for games)
+        # In the new SDK, config is passed differently.
+        # Using basic config to disable blocking if possible.
+        # Note: The new SDK types structure is different.
+
+        # Simplified safety config with type ignores as the SDK types are strict Enums
+        # and we want to pass strings or would need to import exact Enums which might vary by version.
+        return types.GenerateContentConfig(
+            safety_settings=[
+                types.SafetySetting(
+                    category="HARM_CATEGORY_HARASSMENT",  # type: ignore
+                    threshold="BLOCK_NONE",  # type: ignore
+                ),
+                types.SafetySetting(
+                    category="HARM_CATEGORY_HATE_SPEECH",  # type: ignore
+                    threshold="BLOCK_NONE",  # type: ignore
+                ),
+                types.SafetySetting(
+                    category="HARM_CATEGORY_SEXUALLY_EXPLICIT",  # type: ignore
+                    threshold="BLOCK_NONE",  # type: ignore
+                ),
+                types.SafetySetting(
+                    category="HARM_CATEGORY_DANGEROUS_CONTENT",  # type: ignore
+                    threshold="BLOCK_NONE",  # type: ignore
+                ),
+            ]
+        )
+
+    def _parse_response(
+        self, response, start_time: float, system_prompt: str, user_prompt: str
+    ) -> LLMResponse:
+        content = response.text or ""
+
+        latency = (time.time() - start_time) * 1000
+
+        # Extract usage if available
+        prompt_tokens = 0
+        completion_tokens = 0
+        total_tokens = 0
+
+        # Usage metadata access might vary in new SDK, checking extraction
+        if response.usage_metadata:
+            prompt_tokens = response.usage_metadata.prompt_token_count or 0
+            completion_tokens = response.usage_metadata.candidates_token_count or 0
+            total_tokens = response.usage_metadata.total_token_count or 0
+
+        metrics = LLMMetrics(
+            latency_ms=latency,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+        )
+
+        return LLMResponse(
+            content=content,
+            metrics=metrics,
+            model_name=self.model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    def _error_response(
+        self, e: Exception, system_prompt: str, user_prompt: str
+    ) -> LLMResponse:
+        logger.error(f"Error generating response from Gemini ({self.model_name}): {e}")
+
+        # Provide helpful error message to UI
+        msg = str(e)
+        if "404" in msg:
+            msg += (
+                " (Model not found. Check availability in your Google AI Studio region)"
+            )
+        if "API_KEY" in msg or "403" in msg:
+            msg += " (Check your Google API Key)"
+
+        return LLMResponse(
+            content=f"ERROR: {msg}",
+            metrics=LLMMetrics(
+                latency_ms=0,
+                prompt_tokens=0,
+                completion_tokens=0,
+                total_tokens=0,
+            ),
+            model_name=self.model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
 
     def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
         start_time = time.time()
 
         if not self.client:
-            return LLMResponse(
-                content="ERROR: Missing Gemini API Key.",
-                metrics=LLMMetrics(
-                    latency_ms=0, prompt_tokens=0, completion_tokens=0, total_tokens=0
-                ),
-                model_name=self.model_name,
-            )
+            return self._missing_key_response()
 
         try:
             full_prompt = f"{system_prompt}\n\nUser Task: {user_prompt}"
-
-            # Safety settings (Updated for new SDK if needed, though defaults are often fine for games)
-            # In the new SDK, config is passed differently.
-            # Using basic config to disable blocking if possible.
-            # Note: The new SDK types structure is different.
-
-            # Simplified safety config with type ignores as the SDK types are strict Enums
-            # and we want to pass strings or would need to import exact Enums which might vary by version.
-            config = types.GenerateContentConfig(
-                safety_settings=[
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_HARASSMENT",  # type: ignore
-                        threshold="BLOCK_NONE",  # type: ignore
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_HATE_SPEECH",  # type: ignore
-                        threshold="BLOCK_NONE",  # type: ignore
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_SEXUALLY_EXPLICIT",  # type: ignore
-                        threshold="BLOCK_NONE",  # type: ignore
-                    ),
-                    types.SafetySetting(
-                        category="HARM_CATEGORY_DANGEROUS_CONTENT",  # type: ignore
-                        threshold="BLOCK_NONE",  # type: ignore
-                    ),
-                ]
-            )
+            config = self._generate_config()
 
             # --- GENERATION ---
             # Handling "models/" prefix logic inside the call
@@ -73,72 +185,131 @@ class GeminiLLM(BaseLLM):
 
             # Simple retry logic for 404s/naming
             try:
-                response = self.client.models.generate_content(
-                    model=target_model, contents=full_prompt, config=config
-                )
+                response = self._generate_content(target_model, full_prompt, config)
             except Exception as e:
                 # Retry with models/ prefix if missing
                 if "404" in str(e) and "models/" not in target_model:
                     target_model = f"models/{self.model_name}"
                     logger.info(f"Retrying with {target_model}")
-                    response = self.client.models.generate_content(
-                        model=target_model, contents=full_prompt, config=config
-                    )
+                    response = self._generate_content(target_model, full_prompt, config)
                 else:
                     raise e
             # ------------------
 
-            content = response.text or ""
+            return self._parse_response(
+                response, start_time, system_prompt, user_prompt
+            )
 
-            latency = (time.time() - start_time) * 1000
+        except Exception as e:
+            return self._error_response(e, system_prompt, user_prompt)
 
-            # Extract usage if available
-            prompt_tokens = 0
-            completion_tokens = 0
-            total_tokens = 0
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        start_time = time.time()
 
-            # Usage metadata access might vary in new SDK, checking extraction
-            if response.usage_metadata:
-                prompt_tokens = response.usage_metadata.prompt_token_count or 0
-                completion_tokens = response.usage_metadata.candidates_token_count or 0
-                total_tokens = response.usage_metadata.total_token_count or 0
+        if not self.client:
+            return self._missing_key_response()
 
-            metrics = LLMMetrics(
-                latency_ms=latency,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
-            )
+        try:
+            full_prompt = f"{system_prompt}\n\nUser Task: {user_prompt}"
+            config = self._generate_config()
+            target_model = self.model_name
 
-            return LLMResponse(
-                content=content,
-                metrics=metrics,
-                model_name=self.model_name,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
+            # Same "models/" prefix retry as generate
+            try:
+                response = await self._agenerate_content(
+                    target_model, full_prompt, config
+                )
+            except Exception as e:
+                if "404" in str(e) and "models/" not in target_model:
+                    target_model = f"models/{self.model_name}"
+                    logger.info(f"Retrying with {target_model}")
+                    response = await self._agenerate_content(
+                        target_model, full_prompt, config
+                    )
+                else:
+                    raise e
+
+            return self._parse_response(
+                response, start_time, system_prompt, user_prompt
             )
 
         except Exception as e:
-            logger.error(
-                f"Error generating response from Gemini ({self.model_name}): {e}"
-            )
+            return self._error_response(e, system_prompt, user_prompt)
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        start_time = time.time()
+
+        if not self.client:
+            return self._missing_key_response()
 
-            # Provide helpful error message to UI
-            msg = str(e)
-            if "404" in msg:
-                msg += " (Model not found. Check availability in your Google AI Studio region)"
-            if "API_KEY" in msg or "403" in msg:
-                msg += " (Check your Google API Key)"
+        try:
+            full_prompt = f"{system_prompt}\n\nUser Task: {user_prompt}"
+            config = self._generate_config()
+            target_model = self.model_name
+
+            # Same "models/" prefix retry as generate
+            try:
+                stream, chunk = await self._open_stream(
+                    target_model, full_prompt, config
+                )
+            except Exception as e:
+                if "404" in str(e) and "models/" not in target_model:
+                    target_model = f"models/{self.model_name}"
+                    logger.info(f"Retrying with {target_model}")
+                    stream, chunk = await self._open_stream(
+                        target_model, full_prompt, config
+                    )
+                else:
+                    raise e
+
+            detector = ActionDetector()
+            usage = None
+            try:
+                while True:
+                    if chunk.usage_metadata:
+                        usage = chunk.usage_metadata
+                    text = chunk.text
+                    if text:
+                        done = detector.feed(text)
+                        on_delta(detector.last)
+                        if done:
+                            # Move is complete: stop generating
+                            break
+                    chunk = await anext(stream, None)
+                    if chunk is None:
+                        break
+            finally:
+                await stream.aclose()
+
+            content = detector.text
+            prompt_tokens = (usage.prompt_token_count or 0) if usage else 0
+            completion_tokens = (usage.candidates_token_count or 0) if usage else 0
+            if not detector.found and usage:
+                total_tokens = usage.total_token_count or 0
+            else:
+                # Closed early: the last usage seen is partial, so estimate
+                # (~4 characters per token)
+                prompt_tokens = prompt_tokens or len(full_prompt) // 4
+                completion_tokens = max(completion_tokens, len(content) // 4)
+                total_tokens = prompt_tokens + completion_tokens
+            self.throttle.settle(
+                Throttle.estimate_tokens(full_prompt), total_tokens or None
+            )
 
             return LLMResponse(
-                content=f"ERROR: {msg}",
+                content=content,
                 metrics=LLMMetrics(
-                    latency_ms=0,
-                    prompt_tokens=0,
-                    completion_tokens=0,
-                    total_tokens=0,
+                    latency_ms=(time.time() - start_time) * 1000,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=total_tokens,
                 ),
                 model_name=self.model_name,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
             )
+
+        except Exception as e:
+            return self._error_response(e, system_prompt, user_prompt)
@@ -1,3 +1,4 @@
+import asyncio
 import threading
 from core.llm.base import BaseLLM
 from core.llm.models import LLMResponse, LLMMetrics
@@ -8,16 +9,39 @@ class HumanLLM(BaseLLM):
     Special LLM provider that waits for human input from the frontend.
     """
 
+    supports_async = True
+    is_remote = False
+
     def __init__(self, model_name: str = "human"):
         # Human player doesn't need API keys
         super().__init__(model_name=model_name, api_key="none")
         self.move_event = threading.Event()
         self.next_move: str | None = None
+        # Set while agenerate waits on an event loop
+        self._async_event: asyncio.Event | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     def set_move(self, move: str):
         """Called by the API/WebSocket layer when a human move is received."""
         self.next_move = move
         self.move_event.set()
+        if self._async_event is not None and self._loop is not None:
+            # asyncio events are not thread-safe; set it from its own loop
+            self._loop.call_soon_threadsafe(self._async_event.set)
+
+    def _response(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        move = self.next_move or ""
+
+        return LLMResponse(
+            content=move,
+            metrics=LLMMetrics(
+                latency_ms=0, prompt_tokens=0, completion_tokens=0, total_tokens=0
+            ),
+            model_name=self.model_name,
+            thinking="",
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
 
     def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
         """
@@ -31,15 +55,22 @@ class HumanLLM(BaseLLM):
         # We wait up to 5 minutes for a human move
         self.move_event.wait(timeout=300)
 
-        move = self.next_move or ""
+        return self._response(system_prompt, user_prompt)
 
-        return LLMResponse(
-            content=move,
-            metrics=LLMMetrics(
-                latency_ms=0, prompt_tokens=0, completion_tokens=0, total_tokens=0
-            ),
-            model_name=self.model_name,
-            thinking="",
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-        )
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        """
+        Wait for human input without blocking the event loop.
+        """
+        self.move_event.clear()
+        self.next_move = None
+
+        self._loop = asyncio.get_running_loop()
+        self._async_event = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._async_event.wait(), timeout=300)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._async_event = None
+
+        return self._response(system_prompt, user_prompt)
@@ -0,0 +1,278 @@
+"""
+Mock LLM provider for load testing.
+
+Mock models answer like a real provider (latency, token counts, errors and
+429s) without any network, so the WebSocket endpoint, matches and stats can
+be driven by hundreds of concurrent games. Behaviour is set by
+settings.MOCK_LLM, e.g.
+
+    {"latency": {"dist": "lognormal", "median_ms": 800, "sigma": 0.5},
+     "completion_tokens": [50, 400], "error_rate": 0.01,
+     "rate_limit_rate": 0.02, "retry_after_s": 1, "seed": 42,
+     "script": ["1,1", "0,0", "call"]}
+
+Latency distributions: fixed (ms), uniform (low_ms, high_ms), normal
+(mean_ms, std_ms), lognormal (median_ms, sigma) and exponential (mean_ms).
+
+Moves come from the model's policy, read off the user prompt:
+- mock-random: a random legal move
+- mock-scripted: the moves of "script" in turn, starting over at the end
+- mock-engine: the local engines (core/llm/engine.py); a calling station in poker
+
+Rate limits go through the shared Throttle as provider "Mock", so
+RATE_LIMITS can limit mock models like real ones.
+"""
+
+import asyncio
+import math
+import random
+import re
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from core.llm.base import BaseLLM
+from core.llm.engine import ENGINES
+from core.llm.models import LLMMetrics, LLMResponse
+from core.llm.ratelimit import Throttle
+from core.llm.streaming import DeltaCallback
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_POKER_BETS_PATTERN = re.compile(r"Chips: `(\d+)` \| Current Bet: `(\d+)`")
+_POKER_BIG_BLIND_PATTERN = re.compile(r"Big Blind: `(\d+)`")
+_FILLER = "Considering the position and the possible replies. "
+
+
+class MockProviderError(Exception):
+    """A simulated provider failure; status_code 429 for rate limits."""
+
+    def __init__(self, message: str, status_code: int, retry_after: float = 0):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        # Read by ratelimit.retry_after like an HTTP response
+        headers = {"retry-after": str(retry_after)} if retry_after else {}
+        self.response = SimpleNamespace(headers=headers)
+
+
+def sample_latency(spec: dict, rng: random.Random) -> float:
+    """Latency in seconds drawn from a distribution spec (see module docstring)."""
+    dist = spec.get("dist", "fixed")
+    if dist == "fixed":
+        ms = spec.get("ms", 0)
+    elif dist == "uniform":
+        ms = rng.uniform(spec["low_ms"], spec["high_ms"])
+    elif dist == "normal":
+        ms = rng.gauss(spec["mean_ms"], spec["std_ms"])
+    elif dist == "lognormal":
+        ms = rng.lognormvariate(math.log(spec["median_ms"]), spec["sigma"])
+    elif dist == "exponential":
+        ms = rng.expovariate(1 / spec["mean_ms"]) if spec["mean_ms"] else 0
+    else:
+        raise ValueError(f"Unknown latency distribution: {dist}")
+    return max(0.0, ms) / 1000
+
+
+# --- Move policies: (user prompt, rng, model) -> move ---
+
+
+def _grid_moves(user_prompt: str) -> List[str]:
+    """Empty cells of a TicTacToe or TicTacToePlus board as "row,col"."""
+    from games.tictactoe.solver import position_from_prompt
+    from games.tictactoe_plus.search import board_from_prompt
+
+    try:
+        _, me, opp = position_from_prompt(user_prompt)
+        return [f"{i // 3},{i % 3}" for i in range(9) if not (me | opp) >> i & 1]
+    except ValueError:
+        pass
+    _, rows, _ = board_from_prompt(user_prompt)
+    return [
+        f"{r},{c}"
+        for r, row in enumerate(rows)
+        for c, cell in enumerate(row)
+        if cell in (" ", "_", ".")
+    ]
+
+
+def _poker_position(user_prompt: str) -> Tuple[int, int, int]:
+    """(to call, own chips, big blind) read off a PokerGame prompt."""
+    players = user_prompt.split("- **Player ")[1:]
+    bets = [_POKER_BETS_PATTERN.search(p) for p in players]
+    mine = next((b for p, b in zip(players, bets) if "YOUR HAND" in p and b), None)
+    if mine is None:
+        raise ValueError("Prompt does not show our chips")
+    max_bet = max(int(b.group(2)) for b in bets if b)
+    big_blind = _POKER_BIG_BLIND_PATTERN.search(user_prompt)
+    return (
+        max_bet - int(mine.group(2)),
+        int(mine.group(1)),
+        int(big_blind.group(1)) if big_blind else 0,
+    )
+
+
+def _random_move(user_prompt: str, rng: random.Random, llm: "MockLLM") -> str:
+    if "Poker Table" in user_prompt:
+        to_call, chips, big_blind = _poker_position(user_prompt)
+        options = ["call" if to_call else "check"] * 3
+        if to_call:
+            options.append("fold")
+        if big_blind and chips >= to_call + big_blind:
+            options.append(f"raise {big_blind}")
+        return rng.choice(options)
+    moves = _grid_moves(user_prompt)
+    if not moves:
+        raise ValueError("No move available, the game is over")
+    return rng.choice(moves)
+
+
+def _scripted_move(user_prompt: str, rng: random.Random, llm: "MockLLM") -> str:
+    script = llm.config.get("script") or []
+    if not script:
+        raise ValueError("MOCK_LLM has no script")
+    move = script[llm.turn % len(script)]
+    llm.turn += 1
+    return move
+
+
+def _engine_move(user_prompt: str, rng: random.Random, llm: "MockLLM") -> str:
+    if "Poker Table" in user_prompt:
+        to_call, _, _ = _poker_position(user_prompt)
+        return "call" if to_call else "check"
+    try:
+        return ENGINES["engine-tictactoe"](user_prompt)[0]
+    except ValueError:
+        return ENGINES["engine-connect5"](user_prompt)[0]
+
+
+# Model id -> policy
+POLICIES: Dict[str, Callable[[str, random.Random, "MockLLM"], str]] = {
+    "mock-random": _random_move,
+    "mock-scripted": _scripted_move,
+    "mock-engine": _engine_move,
+}
+
+
+def is_mock_model(model_id: str) -> bool:
+    return model_id in POLICIES
+
+
+class MockLLM(BaseLLM):
+    """Simulates a provider with a move policy from POLICIES."""
+
+    supports_async = True
+    # Stands in for a provider, so load tests show up in the LLM metrics
+    is_remote = True
+
+    def __init__(self, model_name: str, config: Optional[dict] = None):
+        if model_name not in POLICIES:
+            raise ValueError(f"Unknown mock model: {model_name}")
+        # Mock models don't need API keys
+        super().__init__(model_name=model_name, api_key="none")
+        self.policy = POLICIES[model_name]
+        self.config = settings.MOCK_LLM if config is None else config
+        self.rng = random.Random(self.config.get("seed"))
+        self.turn = 0
+        self.throttle = Throttle(model_name, "Mock")
+        # Fail on a bad spec now rather than in the middle of a match
+        sample_latency(self.config.get("latency", {}), random.Random())
+
+    def _sample(self) -> Tuple[float, Optional[Exception]]:
+        """Latency of the next call and the error it fails with, if any."""
+        delay = sample_latency(self.config.get("latency", {}), self.rng)
+        roll = self.rng.random()
+        rate_limit_rate = self.config.get("rate_limit_rate", 0)
+        if roll < rate_limit_rate:
+            return delay, MockProviderError(
+                "Mock rate limit", 429, self.config.get("retry_after_s", 0)
+            )
+        if roll < rate_limit_rate + self.config.get("error_rate", 0):
+            return delay, MockProviderError("Mock provider error", 500)
+        return delay, None
+
+    def _request(self) -> float:
+        delay, error = self._sample()
+        time.sleep(delay)
+        if error:
+            raise error
+        return delay
+
+    async def _arequest(self) -> float:
+        delay, error = self._sample()
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return delay
+
+    def _response(
+        self, move: str, start_time: float, system_prompt: str, user_prompt: str
+    ) -> LLMResponse:
+        low, high = self.config.get("completion_tokens", [20, 200])
+        completion_tokens = self.rng.randint(low, high)
+        # Reasoning of roughly that many tokens (~4 characters each)
+        reasoning = (_FILLER * (completion_tokens * 4 // len(_FILLER) + 1))[
+            : completion_tokens * 4
+        ]
+        prompt_tokens = (len(system_prompt) + len(user_prompt)) // 4
+        return LLMResponse(
+            content=f"{reasoning}\naction : {move}",
+            metrics=LLMMetrics(
+                latency_ms=(time.time() - start_time) * 1000,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            ),
+            model_name=self.model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    def _error_response(
+        self, e: Exception, system_prompt: str, user_prompt: str
+    ) -> LLMResponse:
+        logger.error(f"Error generating response from Mock ({self.model_name}): {e}")
+        return LLMResponse(
+            content=f"ERROR: {e}",
+            metrics=LLMMetrics(
+                latency_ms=0, prompt_tokens=0, completion_tokens=0, total_tokens=0
+            ),
+            model_name=self.model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        start_time = time.time()
+        tokens = Throttle.estimate_tokens(system_prompt, user_prompt)
+        try:
+            self.throttle.call(self._request, tokens, lambda _: None)
+            move = self.policy(user_prompt, self.rng, self)
+            return self._response(move, start_time, system_prompt, user_prompt)
+        except Exception as e:
+            return self._error_response(e, system_prompt, user_prompt)
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        start_time = time.time()
+        tokens = Throttle.estimate_tokens(system_prompt, user_prompt)
+        try:
+            await self.throttle.acall(self._arequest, tokens, lambda _: None)
+            if self.policy is _engine_move:
+                # Engine search is CPU-bound; keep it off the event loop
+                move = await asyncio.to_thread(self.policy, user_prompt, self.rng, self)
+            else:
+                move = self.policy(user_prompt, self.rng, self)
+            return self._response(move, start_time, system_prompt, user_prompt)
+        except Exception as e:
+            return self._error_response(e, system_prompt, user_prompt)
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        response = await self.agenerate(system_prompt, user_prompt)
+        # Replay the reply in small pieces, yielding to the loop like a stream
+        for i in range(0, len(response.content), 64):
+            on_delta(response.content[i : i + 64])
+            await asyncio.sleep(0)
+        return response
@@ -24,3 +24,4 @@ class LLMResponse(BaseModel):
     )
     system_prompt: str | None = None  # System prompt sent to LLM
     user_prompt: str | None = None  # User prompt sent to LLM
+    cached: bool = False  # Served from the response cache (core.llm.cache)
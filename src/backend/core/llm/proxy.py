@@ -1,6 +1,9 @@
-from openai import OpenAI
 from core.llm.base import BaseLLM
+from core.llm.clients import get_async_openai_client, get_openai_client
 from core.llm.models import LLMResponse, LLMMetrics
+from core.llm.ratelimit import Throttle
+from core.llm.streaming import ActionDetector, DeltaCallback
+from config.models import get_model_by_id
 from config.settings import settings
 import logging
 import time
@@ -8,104 +11,205 @@ import time
 logger = logging.getLogger(__name__)
 
 
+def _total_tokens(response) -> int | None:
+    return response.usage.total_tokens if response.usage else None
+
+
 class ProxyLLM(BaseLLM):
     """
     Universal connector for your LLM Proxy.
     Can call GPT-5, Claude 3.7, Phi-4 etc. via OpenAI-compatible interface.
     """
 
+    supports_async = True
+
     def __init__(self, model_name: str):
         super().__init__(model_name, settings.OPENAI_API_KEY, settings.OPENAI_BASE_URL)
 
         if not self.api_key or not self.api_base:
             raise ValueError("Missing OpenAI API Key or Base URL in configuration.")
 
-        self.client = OpenAI(
-            api_key=self.api_key,
-            base_url=self.api_base,
+        # Shared per credentials, so matches reuse open connections
+        self.client = get_openai_client(self.api_key, self.api_base)
+        self.async_client = get_async_openai_client(self.api_key, self.api_base)
+
+        # O1/O3 models often don't support temperature
+        # Check if model starts with o1- or o3-
+        if not (model_name.startswith("o1-") or model_name.startswith("o3-")):
+            self.temperature = 0.7
+
+        model = get_model_by_id(model_name)
+        self.throttle = Throttle(model_name, model["provider"] if model else "Proxy")
+
+    def _request_kwargs(self, system_prompt: str, user_prompt: str) -> dict:
+        kwargs = {
+            "model": self.model_name,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+        }
+        if self.temperature is not None:
+            kwargs["temperature"] = self.temperature
+        return kwargs
+
+    def _parse_response(
+        self, response, start_time: float, system_prompt: str, user_prompt: str
+    ) -> LLMResponse:
+        # Helper to safely get usage
+        def get_usage_attr(usage, attr):
+            return getattr(usage, attr, 0) if usage else 0
+
+        # Calculate metrics
+        latency = (time.time() - start_time) * 1000  # ms
+        usage = response.usage
+        prompt_tokens = get_usage_attr(usage, "prompt_tokens")
+        completion_tokens = get_usage_attr(usage, "completion_tokens")
+        total_tokens = get_usage_attr(usage, "total_tokens")
+
+        metrics = LLMMetrics(
+            latency_ms=latency,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=total_tokens,
+        )
+
+        # Extract content and thinking blocks
+        message = response.choices[0].message
+        content = message.content or ""
+        thinking = None
+
+        # 1. Try to capture thinking/reasoning if available from API natively
+        if hasattr(message, "reasoning") and message.reasoning:
+            thinking = message.reasoning
+        elif hasattr(message, "content_blocks"):
+            for block in message.content_blocks:
+                if getattr(block, "type", None) == "thinking":
+                    thinking = getattr(block, "thinking", None)
+                elif getattr(block, "type", None) == "text":
+                    content = getattr(block, "text", content)
+
+        # 2. Heuristic extraction REMOVED.
+        # We rely on Match._extract_action to parse the move from the full content.
+        # This preserves the full raw response for debugging.
+
+        return LLMResponse(
+            content=content,
+            metrics=metrics,
+            model_name=self.model_name,
+            thinking=thinking,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+        )
+
+    def _error_response(
+        self, e: Exception, system_prompt: str, user_prompt: str
+    ) -> LLMResponse:
+        logger.error(f"Error generating response from Proxy ({self.model_name}): {e}")
+        # Return error response
+        return LLMResponse(
+            content=f"ERROR: {str(e)}",
+            metrics=LLMMetrics(
+                latency_ms=0,
+                prompt_tokens=0,
+                completion_tokens=0,
+                total_tokens=0,
+            ),
+            model_name=self.model_name,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
         )
 
     def generate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
         start_time = time.time()
         try:
-            # Prepare arguments
-            kwargs = {
-                "model": self.model_name,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-            }
-
-            # O1/O3 models often don't support temperature
-            # Check if model starts with o1- or o3-
-            if not (
-                self.model_name.startswith("o1-") or self.model_name.startswith("o3-")
-            ):
-                kwargs["temperature"] = 0.7
-
-            response = self.client.chat.completions.create(**kwargs)
-
-            # Helper to safely get usage
-            def get_usage_attr(usage, attr):
-                return getattr(usage, attr, 0) if usage else 0
-
-            # Calculate metrics
-            latency = (time.time() - start_time) * 1000  # ms
-            usage = response.usage
-            prompt_tokens = get_usage_attr(usage, "prompt_tokens")
-            completion_tokens = get_usage_attr(usage, "completion_tokens")
-            total_tokens = get_usage_attr(usage, "total_tokens")
-
-            metrics = LLMMetrics(
-                latency_ms=latency,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
+            kwargs = self._request_kwargs(system_prompt, user_prompt)
+            response = self.throttle.call(
+                lambda: self.client.chat.completions.create(**kwargs),
+                Throttle.estimate_tokens(system_prompt, user_prompt),
+                _total_tokens,
             )
-
-            # Extract content and thinking blocks
-            message = response.choices[0].message
-            content = message.content or ""
-            thinking = None
-
-            # 1. Try to capture thinking/reasoning if available from API natively
-            if hasattr(message, "reasoning") and message.reasoning:
-                thinking = message.reasoning
-            elif hasattr(message, "content_blocks"):
-                for block in message.content_blocks:
-                    if getattr(block, "type", None) == "thinking":
-                        thinking = getattr(block, "thinking", None)
-                    elif getattr(block, "type", None) == "text":
-                        content = getattr(block, "text", content)
-
-            # 2. Heuristic extraction REMOVED.
-            # We rely on Match._extract_action to parse the move from the full content.
-            # This preserves the full raw response for debugging.
-
-            return LLMResponse(
-                content=content,
-                metrics=metrics,
-                model_name=self.model_name,
-                thinking=thinking,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
+            return self._parse_response(
+                response, start_time, system_prompt, user_prompt
             )
+        except Exception as e:
+            return self._error_response(e, system_prompt, user_prompt)
 
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> LLMResponse:
+        start_time = time.time()
+        try:
+            kwargs = self._request_kwargs(system_prompt, user_prompt)
+            response = await self.throttle.acall(
+                lambda: self.async_client.chat.completions.create(**kwargs),
+                Throttle.estimate_tokens(system_prompt, user_prompt),
+                _total_tokens,
+            )
+            return self._parse_response(
+                response, start_time, system_prompt, user_prompt
+            )
         except Exception as e:
-            logger.error(
-                f"Error generating response from Proxy ({self.model_name}): {e}"
+            return self._error_response(e, system_prompt, user_prompt)
+
+    async def astream(
+        self, system_prompt: str, user_prompt: str, on_delta: DeltaCallback
+    ) -> LLMResponse:
+        start_time = time.time()
+        try:
+            kwargs = self._request_kwargs(system_prompt, user_prompt)
+            estimated = Throttle.estimate_tokens(system_prompt, user_prompt)
+            # Usage is only known once the stream ends, so it is settled below
+            stream = await self.throttle.acall(
+                lambda: self.async_client.chat.completions.create(
+                    **kwargs, stream=True, stream_options={"include_usage": True}
+                ),
+                estimated,
+                lambda _: None,
             )
-            # Return error response
+
+            detector = ActionDetector()
+            reasoning = []
+            usage = None
+            try:
+                async for chunk in stream:
+                    if chunk.usage:
+                        usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+                    if getattr(delta, "reasoning", None):
+                        reasoning.append(delta.reasoning)
+                        on_delta(delta.reasoning)
+                    if delta.content:
+                        done = detector.feed(delta.content)
+                        on_delta(detector.last)
+                        if done:
+                            # Move is complete: stop generating
+                            break
+            finally:
+                await stream.close()
+
+            content = detector.text
+            if usage:
+                prompt_tokens = usage.prompt_tokens or 0
+                completion_tokens = usage.completion_tokens or 0
+            else:
+                # Closed before the usage chunk: estimate (~4 characters per token)
+                prompt_tokens = (len(system_prompt) + len(user_prompt)) // 4
+                completion_tokens = (len(content) + len("".join(reasoning))) // 4
+            self.throttle.settle(estimated, prompt_tokens + completion_tokens)
+
             return LLMResponse(
-                content=f"ERROR: {str(e)}",
+                content=content,
                 metrics=LLMMetrics(
-                    latency_ms=0,
-                    prompt_tokens=0,
-                    completion_tokens=0,
-                    total_tokens=0,
+                    latency_ms=(time.time() - start_time) * 1000,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    total_tokens=prompt_tokens + completion_tokens,
                 ),
                 model_name=self.model_name,
+                thinking="".join(reasoning) or None,
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
             )
+        except Exception as e:
+            return self._error_response(e, system_prompt, user_prompt)
@@ -0,0 +1,270 @@
+"""
+Client-side rate limiting shared by all matches.
+
+Every provider and every model id can have a budget of requests and tokens
+per minute (settings.RATE_LIMITS). A call reserves one request and its
+estimated tokens from the budgets of its model and provider before it is
+sent. Reservations may overdraw a budget; the caller then waits until the
+debt is paid back. Every reservation queues behind the ones before it, so
+waiting calls go out first come, first served, from threads and from the
+event loop alike.
+
+When a provider still answers 429, its Retry-After pauses the budgets of that
+model and provider for every match, and the call is retried.
+"""
+
+import asyncio
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from config.settings import settings
+from core import metrics
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+_RETRY_DELAY_PATTERN = re.compile(r"retryDelay'?\"?:\s*'?\"?(\d+(?:\.\d+)?)s")
+
+
+class TokenBucket:
+    """Refills `per_minute` units per minute, holding at most one minute's worth."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Takes `amount` (possibly into debt); returns seconds until it is covered."""
+        self._refill(now)
+        self.level -= amount
+        return -self.level / self.rate if self.level < 0 else 0.0
+
+    def give_back(self, amount: float, now: float):
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimiter:
+    """Requests and tokens per minute for one provider or model; 0 is unlimited."""
+
+    def __init__(self, name: str, rpm: float = 0, tpm: float = 0):
+        self.name = name
+        self.requests = TokenBucket(rpm) if rpm > 0 else None
+        self.tokens = TokenBucket(tpm) if tpm > 0 else None
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int) -> float:
+        """Reserves one request and `tokens`; returns how long to wait before sending."""
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self.paused_until - now)
+            if self.requests:
+                delay = max(delay, self.requests.reserve(1, now))
+            if self.tokens:
+                delay = max(delay, self.tokens.reserve(tokens, now))
+            return delay
+
+    def adjust(self, tokens: int):
+        """Charges (positive) or refunds (negative) tokens after the actual usage is known."""
+        if not self.tokens or not tokens:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if tokens > 0:
+                self.tokens.reserve(tokens, now)
+            else:
+                self.tokens.give_back(-tokens, now)
+
+    def refund(self, tokens: int, request: bool = False):
+        """Gives back a reservation's tokens, and its request if it was never sent."""
+        with self._lock:
+            now = time.monotonic()
+            if request and self.requests:
+                self.requests.give_back(1, now)
+            if self.tokens:
+                self.tokens.give_back(tokens, now)
+
+    def pause(self, seconds: float):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str) -> Optional[RateLimiter]:
+    """Shared limiter for a provider or model id, or None if it has no budget."""
+    budget = settings.RATE_LIMITS.get(name)
+    if not budget:
+        return None
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            limiter = RateLimiter(name, budget.get("rpm", 0), budget.get("tpm", 0))
+            _limiters[name] = limiter
+        return limiter
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Seconds a rate-limit error asks us to wait.
+
+    Returns:
+        Optional[float]: The Retry-After delay (0.0 if the error does not say),
+        or None if the error is not a rate-limit error.
+    """
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    text = str(error)
+    if status != 429 and "RESOURCE_EXHAUSTED" not in text:
+        return None
+
+    # OpenAI-compatible APIs: Retry-After headers on the HTTP response
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    if headers.get("retry-after"):
+        value = headers["retry-after"]
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    # Gemini: RetryInfo in the error details, e.g. "retryDelay": "14s"
+    match = _RETRY_DELAY_PATTERN.search(text)
+    if match:
+        return float(match.group(1))
+    return 0.0
+
+
+class Throttle:
+    """
+    Rate limits the calls of one model: its own budget plus its provider's.
+    """
+
+    def __init__(self, model_id: str, provider: str):
+        self.model_id = model_id
+        self.provider = provider
+        self.limiters: List[RateLimiter] = [
+            limiter
+            for limiter in (get_limiter(model_id), get_limiter(provider))
+            if limiter is not None
+        ]
+
+    @staticmethod
+    def estimate_tokens(*prompts: str) -> int:
+        """Rough token count of a call: ~4 characters per prompt token plus the reply."""
+        return sum(len(p) for p in prompts) // 4 + settings.RATE_LIMIT_COMPLETION_TOKENS
+
+    def _reserve(self, tokens: int) -> float:
+        return max((limiter.reserve(tokens) for limiter in self.limiters), default=0.0)
+
+    def settle(self, estimated: int, used: Optional[int]):
+        """Corrects the token budgets once a call's actual usage is known."""
+        if used is not None:
+            for limiter in self.limiters:
+                limiter.adjust(used - estimated)
+
+    def _refund(self, tokens: int, sent: bool):
+        # A failed attempt used no tokens; one never sent used no request either
+        for limiter in self.limiters:
+            limiter.refund(tokens, request=not sent)
+
+    def _backoff(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying after `error`, or None to give up."""
+        delay = retry_after(error)
+        if delay is not None:
+            metrics.llm_rate_limited.inc(self.model_id, self.provider)
+        if delay is None or attempt >= settings.RATE_LIMIT_RETRIES:
+            return None
+        # No Retry-After given: back off exponentially
+        delay = delay or min(60.0, 2.0**attempt)
+        logger.warning(f"{self.model_id} rate limited, retrying in {delay:.1f}s")
+        for limiter in self.limiters:
+            limiter.pause(delay)
+        return delay
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        tokens: int,
+        usage: Callable[[T], Optional[int]],
+    ) -> T:
+        """
+        Runs `fn` when the budgets allow, retrying rate-limit errors.
+
+        Args:
+            fn: The API call.
+            tokens: Estimated tokens of the call.
+            usage: Reads the actual total tokens from the result (None if unknown).
+
+        Returns:
+            The result of `fn`.
+        """
+        attempt = 0
+        while True:
+            delay = self._reserve(tokens)
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                result = fn()
+            except Exception as e:
+                self._refund(tokens, sent=True)
+                backoff = self._backoff(e, attempt)
+                if backoff is None:
+                    raise
+                time.sleep(backoff)
+                attempt += 1
+                continue
+            self.settle(tokens, usage(result))
+            return result
+
+    async def acall(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        tokens: int,
+        usage: Callable[[T], Optional[int]],
+    ) -> T:
+        """Async version of call; `fn` returns an awaitable."""
+        attempt = 0
+        while True:
+            delay = self._reserve(tokens)
+            try:
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._refund(tokens, sent=False)
+                raise
+            try:
+                result = await fn()
+            except asyncio.CancelledError:
+                self._refund(tokens, sent=True)
+                raise
+            except Exception as e:
+                self._refund(tokens, sent=True)
+                backoff = self._backoff(e, attempt)
+                if backoff is None:
+                    raise
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+            self.settle(tokens, usage(result))
+            return result
@@ -0,0 +1,76 @@
+"""
+Helpers for streamed LLM responses.
+
+Streaming providers forward text to the UI as it arrives and stop reading as
+soon as the model has written a complete "action : ..." line, so the tokens
+a model would generate after committing to its move are never paid for.
+"""
+
+import re
+from typing import Callable, List
+
+# Called with each new piece of streamed text
+DeltaCallback = Callable[[str], None]
+
+
+# "action : <move>", allowing markdown such as "**Action:** 1,1"
+_ACTION_LINE_PATTERN = re.compile(r"^\W*action\W*:\W*(.*?)\W*$", re.IGNORECASE)
+# Moves the games accept: grid coordinates or a poker action
+_MOVE_PATTERN = re.compile(
+    r"^(\(?\d+[\s,]+\d+\)?|fold|check|call|allin|raise\s+\d+)$", re.IGNORECASE
+)
+
+
+def is_action_line(line: str) -> bool:
+    """
+    Whether a line is a final move in the format Match._extract_action reads.
+    Reasoning such as "Action plan: block the diagonal" does not count.
+    """
+    match = _ACTION_LINE_PATTERN.match(line.strip())
+    return bool(match and _MOVE_PATTERN.match(match.group(1)))
+
+
+class ActionDetector:
+    """
+    Collects streamed text and spots the first complete "action : ..." line.
+    A line counts once its newline has arrived; a final line without one is
+    seen when the stream ends.
+    """
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._line = ""
+        self.found = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    @property
+    def last(self) -> str:
+        """The text kept from the last feed."""
+        return self._parts[-1] if self._parts else ""
+
+    def feed(self, delta: str) -> bool:
+        """
+        Adds a piece of text.
+
+        Returns:
+            bool: True once an action line is complete; the stream can be closed.
+            Text after that line is dropped, so it stays the last line.
+        """
+        if self.found:
+            self._parts.append("")
+            return True
+        pending = self._line + delta
+        lines = pending.split("\n")
+        kept = 0
+        for line in lines[:-1]:
+            kept += len(line) + 1
+            if is_action_line(line):
+                self._parts.append(pending[len(self._line) : kept])
+                self.found = True
+                return True
+        self._parts.append(delta)
+        self._line = lines[-1]
+        return False
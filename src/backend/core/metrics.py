@@ -0,0 +1,267 @@
+"""
+Process metrics in the Prometheus text format, served at /metrics.
+
+Averages in the stats files hide the slow tail that stalls live games, so
+LLM latency is kept as histograms per model and per provider, next to p50,
+p95 and p99 over the most recent calls. Also counted: tokens, errors and
+429s per model, active matches, messages waiting to be sent on WebSockets
+and event-loop lag.
+
+No client library is needed; the few metric types used are defined here.
+"""
+
+import asyncio
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, List, Sequence, Tuple
+
+from config.models import get_model_by_id
+from core.llm.base import BaseLLM
+from core.llm.models import LLMResponse
+
+_lock = threading.Lock()
+
+# Seconds; LLM replies range from ~100 ms to minutes for reasoning models
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+QUANTILES = (0.5, 0.95, 0.99)
+# Observations the quantiles are computed over, per series
+QUANTILE_WINDOW = 1000
+
+Labels = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], **extra) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+    if not pairs:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric(ABC):
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        """Lines of this metric in the text exposition format."""
+        pass
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with _lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in sorted(self.values.items()):
+            lines.append(
+                f"{self.name}{_format_labels(self.label_names, labels)} "
+                f"{_format_value(value)}"
+            )
+        return lines
+
+
+class Gauge(Counter):
+    type = "gauge"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        if not labels:
+            self.values[()] = 0
+
+    def set(self, value: float, *labels: str):
+        with _lock:
+            self.values[labels] = value
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class _Series:
+    def __init__(self, n_buckets: int):
+        self.buckets = [0] * n_buckets
+        self.sum = 0.0
+        self.count = 0
+        self.recent: Deque[float] = deque(maxlen=QUANTILE_WINDOW)
+
+
+class Histogram(Metric):
+    """
+    Cumulative buckets, plus quantiles over the last QUANTILE_WINDOW
+    observations as a `<name>_recent` gauge.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.bounds = tuple(buckets)
+        self.series: Dict[Labels, _Series] = {}
+
+    def observe(self, value: float, *labels: str):
+        with _lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = _Series(len(self.bounds))
+            i = bisect.bisect_left(self.bounds, value)
+            if i < len(self.bounds):
+                series.buckets[i] += 1
+            series.sum += value
+            series.count += 1
+            series.recent.append(value)
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        quantiles = [
+            f"# HELP {self.name}_recent {self.help}, quantiles of the last "
+            f"{QUANTILE_WINDOW}",
+            f"# TYPE {self.name}_recent gauge",
+        ]
+        for labels, series in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.bounds, series.buckets):
+                cumulative += count
+                label_text = _format_labels(self.label_names, labels, le=bound)
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _format_labels(self.label_names, labels, le="+Inf")
+            lines.append(f"{self.name}_bucket{label_text} {series.count}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{label_text} {series.count}")
+
+            recent = sorted(series.recent)
+            for q in QUANTILES:
+                value = recent[min(len(recent) - 1, int(q * len(recent)))]
+                label_text = _format_labels(self.label_names, labels, quantile=q)
+                quantiles.append(
+                    f"{self.name}_recent{label_text} {_format_value(value)}"
+                )
+        return lines + quantiles
+
+
+llm_latency = Histogram(
+    "ai_games_llm_latency_seconds",
+    "Latency of LLM replies by model",
+    ["model", "provider"],
+)
+provider_latency = Histogram(
+    "ai_games_provider_latency_seconds",
+    "Latency of LLM replies by provider",
+    ["provider"],
+)
+llm_requests = Counter(
+    "ai_games_llm_requests_total", "LLM calls made", ["model", "provider"]
+)
+llm_tokens = Counter(
+    "ai_games_llm_tokens_total",
+    "Tokens used by LLM calls",
+    ["model", "provider", "kind"],
+)
+llm_errors = Counter(
+    "ai_games_llm_errors_total",
+    "LLM calls that ended in an error reply",
+    ["model", "provider"],
+)
+llm_rate_limited = Counter(
+    "ai_games_llm_rate_limited_total",
+    "Rate-limit (429) errors received, retried or not",
+    ["model", "provider"],
+)
+active_matches = Gauge("ai_games_active_matches", "Matches being played")
+websocket_pending = Gauge(
+    "ai_games_websocket_pending_messages",
+    "Messages queued for WebSocket clients and not yet sent",
+)
+event_loop_lag = Histogram(
+    "ai_games_event_loop_lag_seconds",
+    "Delay of event-loop callbacks past their scheduled time",
+    buckets=LAG_BUCKETS,
+)
+
+METRICS: List[Metric] = [
+    llm_latency,
+    provider_latency,
+    llm_requests,
+    llm_tokens,
+    llm_errors,
+    llm_rate_limited,
+    active_matches,
+    websocket_pending,
+    event_loop_lag,
+]
+
+
+def provider_of(model_name: str) -> str:
+    model = get_model_by_id(model_name)
+    return model["provider"] if model else "unknown"
+
+
+def record_llm_response(response: LLMResponse, llm: BaseLLM):
+    """
+    Counts one LLM call. Cached replies and local players (humans, engines,
+    replays) are skipped: no call was made.
+    """
+    if response.cached or not llm.is_remote:
+        return
+    model_name = llm.model_name
+    provider = provider_of(model_name)
+    llm_requests.inc(model_name, provider)
+    if response.content.startswith("ERROR:"):
+        llm_errors.inc(model_name, provider)
+        return
+    latency = response.metrics.latency_ms / 1000
+    llm_latency.observe(latency, model_name, provider)
+    provider_latency.observe(latency, provider)
+    llm_tokens.inc(
+        model_name, provider, "prompt", amount=response.metrics.prompt_tokens
+    )
+    llm_tokens.inc(
+        model_name, provider, "completion", amount=response.metrics.completion_tokens
+    )
+
+
+async def monitor_event_loop_lag(interval: float = 0.5):
+    """Measures how late a sleep on the running loop wakes up, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        event_loop_lag.observe(max(0.0, loop.time() - start - interval))
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format."""
+    with _lock:
+        lines = [line for metric in METRICS for line in metric.render()]
+    return "\n".join(lines) + "\n"
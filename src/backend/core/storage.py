@@ -192,10 +192,20 @@ class StatsManager:
                 "poker_pfr_hands": 0,
                 "poker_aggr_actions": 0,
                 "poker_call_actions": 0,
+                "poker_preflop_graded": 0,
+                "poker_preflop_played": 0,
+                "poker_preflop_played_equity": 0.0,
+                "poker_preflop_weak_entries": 0,
+                "poker_preflop_strong_folds": 0,
             }
             for p in players
         }
 
+        # Preflop decisions are graded by hand strength when the table has been built
+        from games.poker.preflop import get_preflop_table
+
+        preflop_table = get_preflop_table()
+
         # Hand state
         current_hand_stats = {p: {"vpip": False, "pfr": False} for p in players}
 
@@ -242,6 +252,20 @@ class StatsManager:
                     elif a_type == "call":
                         final_stats[player]["poker_call_actions"] += 1
 
+                if stage == "PREFLOP" and preflop_table:
+                    graded = StatsManager._preflop_equity(entry, preflop_table)
+                    if graded:
+                        equity, fair_share = graded
+                        ps = final_stats[player]
+                        ps["poker_preflop_graded"] += 1
+                        if a_type in ["call", "raise", "bet", "allin"]:
+                            ps["poker_preflop_played"] += 1
+                            ps["poker_preflop_played_equity"] += equity
+                            if equity < fair_share:
+                                ps["poker_preflop_weak_entries"] += 1
+                        elif a_type == "fold" and equity >= fair_share:
+                            ps["poker_preflop_strong_folds"] += 1
+
         # Commit last hand
         for p in players:
             final_stats[p]["poker_hands"] += 1
@@ -252,6 +276,39 @@ class StatsManager:
 
         return final_stats
 
+    @staticmethod
+    def _preflop_equity(entry: dict, preflop_table) -> tuple | None:
+        """
+        Looks up the acting player's preflop equity for a logged poker action.
+        Returns (equity vs the other dealt-in players, fair share) or None if
+        the hole cards are not visible in the logged board.
+        """
+        from games.poker.card import ids_from_strings
+        from games.poker.preflop import class_index
+
+        seats = (entry.get("board") or {}).get("players") or []
+        idx = entry.get("current_player_idx")
+        if not isinstance(idx, int) or not 0 <= idx < len(seats):
+            return None
+
+        cards = seats[idx].get("cards")
+        if not cards or len(cards) != 2:
+            return None
+        try:
+            hole = ids_from_strings(cards)
+        except ValueError:
+            return None
+
+        opponents = sum(
+            1
+            for i, seat in enumerate(seats)
+            if i != idx and seat.get("status") != "out"
+        )
+        if opponents < 1:
+            return None
+        equity = preflop_table.equity_vs_random(class_index(*hole), opponents)
+        return equity, 1.0 / (opponents + 1)
+
     @staticmethod
     def _update_model_stats(
         model_id: str,
@@ -283,6 +340,11 @@ class StatsManager:
                 "poker_pfr_hands": 0,
                 "poker_aggr_actions": 0,
                 "poker_call_actions": 0,
+                "poker_preflop_graded": 0,
+                "poker_preflop_played": 0,
+                "poker_preflop_played_equity": 0,
+                "poker_preflop_weak_entries": 0,
+                "poker_preflop_strong_folds": 0,
             }
 
         # Initialize new field if missing from old file
@@ -294,6 +356,11 @@ class StatsManager:
             "poker_pfr_hands",
             "poker_aggr_actions",
             "poker_call_actions",
+            "poker_preflop_graded",
+            "poker_preflop_played",
+            "poker_preflop_played_equity",
+            "poker_preflop_weak_entries",
+            "poker_preflop_strong_folds",
         ]:
             if k not in stats:
                 stats[k] = 0
@@ -328,6 +395,14 @@ class StatsManager:
             stats["poker_pfr_hands"] += poker_stats.get("poker_pfr_hands", 0)
             stats["poker_aggr_actions"] += poker_stats.get("poker_aggr_actions", 0)
             stats["poker_call_actions"] += poker_stats.get("poker_call_actions", 0)
+            for k in [
+                "poker_preflop_graded",
+                "poker_preflop_played",
+                "poker_preflop_played_equity",
+                "poker_preflop_weak_entries",
+                "poker_preflop_strong_folds",
+            ]:
+                stats[k] += poker_stats.get(k, 0)
 
         with open(stats_file, "w") as f:
             json.dump(stats, f, indent=2)
@@ -432,6 +507,11 @@ class StatsManager:
                                 "poker_pfr_hands": 0,
                                 "poker_aggr_actions": 0,
                                 "poker_call_actions": 0,
+                                "poker_preflop_graded": 0,
+                                "poker_preflop_played": 0,
+                                "poker_preflop_played_equity": 0,
+                                "poker_preflop_weak_entries": 0,
+                                "poker_preflop_strong_folds": 0,
                             }
 
                         ms = model_stats[model_id]
@@ -460,6 +540,14 @@ class StatsManager:
                         ms["poker_pfr_hands"] += perf.get("poker_pfr_hands", 0)
                         ms["poker_aggr_actions"] += perf.get("poker_aggr_actions", 0)
                         ms["poker_call_actions"] += perf.get("poker_call_actions", 0)
+                        for k in [
+                            "poker_preflop_graded",
+                            "poker_preflop_played",
+                            "poker_preflop_played_equity",
+                            "poker_preflop_weak_entries",
+                            "poker_preflop_strong_folds",
+                        ]:
+                            ms[k] += perf.get(k, 0)
             except Exception as e:
                 print(f"Error processing {f_path}: {e}")
                 continue
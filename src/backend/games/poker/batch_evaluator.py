@@ -0,0 +1,184 @@
+"""
+Vectorized hand evaluation with NumPy.
+
+evaluate_batch scores many hands in one pass and returns the same integer
+scores as evaluator.score_ids, so results can be mixed and compared freely.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from .card import ids_from_strings
+from .evaluator import (
+    HandStrength,
+    _KICKER_BITS,
+    _MAX_KICKERS,
+    _STRAIGHTS,
+    _STRENGTH_SHIFT,
+    _pack,
+    _top_values,
+)
+
+# Per 13-bit rank mask: index of the highest rank (-1 if empty) and the top 5
+# rank values packed like score kickers. Gathers from these replace bit loops.
+_HIGH_BIT = np.array([m.bit_length() - 1 for m in range(1 << 13)], dtype=np.int32)
+_TOP_KICKERS = np.array(
+    [_pack(0, _top_values(m, _MAX_KICKERS)) for m in range(1 << 13)], dtype=np.int32
+)
+
+
+def _split_high(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns (value 2..14 of the highest rank, mask without it); 0 if empty."""
+    top = _HIGH_BIT[mask]
+    has_bit = top >= 0
+    rest = mask & ~(1 << np.maximum(top, 0))
+    return np.where(has_bit, top + 2, 0), np.where(has_bit, rest, 0)
+
+
+def _without(mask: np.ndarray, rank_value: np.ndarray) -> np.ndarray:
+    return mask & ~(1 << np.maximum(rank_value - 2, 0))
+
+
+def _score(
+    strength: HandStrength,
+    leads: List[np.ndarray],
+    kicker_mask: np.ndarray | None = None,
+    kicker_count: int = 0,
+) -> np.ndarray:
+    """Packs leading rank values plus the top `kicker_count` ranks of a mask."""
+    score = np.int32(int(strength) << _STRENGTH_SHIFT)
+    for i, value in enumerate(leads):
+        score = score | (value << (_KICKER_BITS * (_MAX_KICKERS - 1 - i)))
+    if kicker_count:
+        kickers = _TOP_KICKERS[kicker_mask] >> (
+            _KICKER_BITS * (_MAX_KICKERS - kicker_count)
+        )
+        score = score | (
+            kickers << (_KICKER_BITS * (_MAX_KICKERS - len(leads) - kicker_count))
+        )
+    return score
+
+
+def _straight_high(mask: np.ndarray) -> np.ndarray:
+    high = np.zeros_like(mask)
+    # Walk from the weakest straight up so the best one wins
+    for straight_mask, value in reversed(_STRAIGHTS):
+        high = np.where(mask & straight_mask == straight_mask, value, high)
+    return high
+
+
+def evaluate_batch(card_ids: Any) -> np.ndarray:
+    """
+    Scores N hands at once.
+
+    Args:
+        card_ids: Array-like of shape (N, 7) with card ids 0..51 (5 or 6 columns work too).
+
+    Returns:
+        np.ndarray: int32 array of N hand scores (they fit in 24 bits),
+        comparable like evaluator.score_ids.
+    """
+    ids = np.asarray(card_ids, dtype=np.int32)
+    if ids.ndim != 2 or not 5 <= ids.shape[1] <= 7:
+        raise ValueError(f"Expected an (N, 5..7) array of card ids, got {ids.shape}")
+
+    n_hands = ids.shape[0]
+    # Column-major copies so every per-card pass reads contiguous memory
+    suits = np.ascontiguousarray((ids & 3).T)
+    rank_bits = np.ascontiguousarray((1 << (ids >> 2)).T)
+
+    # Rank histogram kept as bitmasks: at_least[k] has a bit for every rank
+    # that appears more than k times in the hand.
+    at_least = [np.zeros(n_hands, dtype=np.int32) for _ in range(4)]
+    for bit in rank_bits:
+        for k in range(3, 0, -1):
+            at_least[k] |= at_least[k - 1] & bit
+        at_least[0] |= bit
+    present, pairs, trips, quads = at_least
+
+    # Suit counts (4, N); with at most 7 cards only one suit can reach 5
+    suit_counts = np.zeros((4, n_hands), dtype=np.int32)
+    for suit in suits:
+        for s in range(4):
+            suit_counts[s] += suit == s
+    flush_suit = suit_counts.argmax(axis=0)
+    is_flush = suit_counts.max(axis=0) >= 5
+    flush_mask = np.zeros(n_hands, dtype=np.int32)
+    for suit, bit in zip(suits, rank_bits):
+        flush_mask |= np.where(suit == flush_suit, bit, 0)
+    flush_mask = np.where(is_flush, flush_mask, 0)
+
+    sf_high = _straight_high(flush_mask)
+    straight_high = _straight_high(present)
+
+    quad_value, _ = _split_high(quads)
+    trip_value, _ = _split_high(trips)
+    fh_pair_value, _ = _split_high(_without(pairs, trip_value))
+    pair_value, other_pairs = _split_high(pairs)
+    second_pair_value, _ = _split_high(other_pairs)
+
+    # Each score below is only selected where its condition holds, so rows
+    # without the relevant rank groups may compute garbage there harmlessly.
+    conditions = [
+        is_flush & (sf_high == 14),
+        is_flush & (sf_high > 0),
+        quads > 0,
+        (trips > 0) & (fh_pair_value > 0),
+        is_flush,
+        straight_high > 0,
+        trips > 0,
+        second_pair_value > 0,
+        pairs > 0,
+    ]
+    choices = [
+        _score(HandStrength.ROYAL_FLUSH, []),
+        _score(HandStrength.STRAIGHT_FLUSH, [sf_high]),
+        _score(
+            HandStrength.FOUR_OF_A_KIND,
+            [quad_value],
+            _without(present, quad_value),
+            1,
+        ),
+        _score(HandStrength.FULL_HOUSE, [trip_value, fh_pair_value]),
+        _score(HandStrength.FLUSH, [], flush_mask, 5),
+        _score(HandStrength.STRAIGHT, [straight_high]),
+        _score(
+            HandStrength.THREE_OF_A_KIND,
+            [trip_value],
+            _without(present, trip_value),
+            2,
+        ),
+        _score(
+            HandStrength.TWO_PAIR,
+            [pair_value, second_pair_value],
+            _without(_without(present, pair_value), second_pair_value),
+            1,
+        ),
+        _score(HandStrength.PAIR, [pair_value], _without(present, pair_value), 3),
+    ]
+    high_card = _score(HandStrength.HIGH_CARD, [], present, 5)
+    return np.select(conditions, choices, default=high_card)
+
+
+def showdown_card_ids(hand_result: Dict[str, Any]) -> Tuple[List[str], np.ndarray]:
+    """
+    Converts a stored `last_hand_result` into inputs for evaluate_batch.
+
+    Hands won by folds reveal no cards and may end before the river; they
+    give no rows, as do players whose hole cards are not both known.
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Player names and their (N, 7) card ids
+        (hole cards followed by the community cards).
+    """
+    board = ids_from_strings(hand_result.get("community_cards", []))
+    names = []
+    rows = []
+    if len(board) == 5:
+        for name, hole in (hand_result.get("player_hands") or {}).items():
+            cards = ids_from_strings(hole) + board
+            if len(cards) == 7:
+                names.append(name)
+                rows.append(cards)
+    return names, np.array(rows, dtype=np.int32).reshape(len(rows), 7)
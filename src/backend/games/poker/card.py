@@ -1,5 +1,5 @@
 from enum import Enum
-from dataclasses import dataclass
+from typing import List, Tuple
 
 
 class Suit(Enum):
@@ -26,24 +26,91 @@ class Rank(Enum):
 
     @property
     def value_int(self) -> int:
-        if self == Rank.ACE:
-            return 14
-        if self == Rank.KING:
-            return 13
-        if self == Rank.QUEEN:
-            return 12
-        if self == Rank.JACK:
-            return 11
-        return int(self.value)
-
-
-@dataclass
+        return _RANK_VALUES[self]
+
+
+_RANKS: Tuple[Rank, ...] = tuple(Rank)
+_SUITS: Tuple[Suit, ...] = tuple(Suit)
+_RANK_VALUES = {rank: i + 2 for i, rank in enumerate(_RANKS)}
+_RANK_INDEX = {rank: i for i, rank in enumerate(_RANKS)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(_SUITS)}
+
+DECK_SIZE = len(_RANKS) * len(_SUITS)
+
+# === CARD IDS ===
+# Every card is identified by an int 0..51: id = rank_index * 4 + suit_index,
+# where rank_index is 0..12 (TWO..ACE) and suit_index 0..3 (Suit order).
+# The tables below are indexed by card id.
+
+CARD_RANK: Tuple[int, ...] = tuple(i >> 2 for i in range(DECK_SIZE))
+CARD_SUIT: Tuple[int, ...] = tuple(i & 3 for i in range(DECK_SIZE))
+CARD_RANK_BIT: Tuple[int, ...] = tuple(1 << r for r in CARD_RANK)
+CARD_SUIT_BIT: Tuple[int, ...] = tuple(1 << s for s in CARD_SUIT)
+CARD_STR: Tuple[str, ...] = tuple(
+    f"{_RANKS[r].value}{_SUITS[s].value}" for r, s in zip(CARD_RANK, CARD_SUIT)
+)
+
+
+def card_id(rank: Rank, suit: Suit) -> int:
+    return _RANK_INDEX[rank] * 4 + _SUIT_INDEX[suit]
+
+
 class Card:
-    rank: Rank
-    suit: Suit
+    """
+    Immutable playing card. There is exactly one instance per card id, so
+    Card(rank, suit) always returns the same object and cards compare by identity.
+    """
+
+    __slots__ = ("id", "rank", "suit", "rank_index", "suit_index", "_text")
+
+    def __new__(cls, rank: Rank, suit: Suit) -> "Card":
+        return CARDS[card_id(rank, suit)]
+
+    @classmethod
+    def _create(cls, cid: int) -> "Card":
+        card = object.__new__(cls)
+        for name, value in (
+            ("id", cid),
+            ("rank", _RANKS[CARD_RANK[cid]]),
+            ("suit", _SUITS[CARD_SUIT[cid]]),
+            ("rank_index", CARD_RANK[cid]),
+            ("suit_index", CARD_SUIT[cid]),
+            ("_text", CARD_STR[cid]),
+        ):
+            object.__setattr__(card, name, value)
+        return card
+
+    @staticmethod
+    def from_id(cid: int) -> "Card":
+        return CARDS[cid]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __reduce__(self):
+        # Unpickle/deepcopy back to the interned instance
+        return (Card.from_id, (self.id,))
 
     def __str__(self):
-        return f"{self.rank.value}{self.suit.value}"
+        return self._text
 
     def __repr__(self):
-        return self.__str__()
+        return self._text
+
+
+CARDS: Tuple[Card, ...] = tuple(Card._create(i) for i in range(DECK_SIZE))
+
+
+def cards_to_ids(cards: List[Card]) -> List[int]:
+    return [c.id for c in cards]
+
+
+_CARD_IDS_BY_STR = {text: i for i, text in enumerate(CARD_STR)}
+
+
+def ids_from_strings(texts: List[str]) -> List[int]:
+    """Parses card strings as produced by str(card), e.g. ["10♣", "A♥"]."""
+    try:
+        return [_CARD_IDS_BY_STR[t] for t in texts]
+    except KeyError as e:
+        raise ValueError(f"Unknown card: {e.args[0]}") from None
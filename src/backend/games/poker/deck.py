@@ -1,26 +1,79 @@
 import random
-from typing import List
-from .card import Card, Suit, Rank
+from typing import List, Optional, Tuple
+from .card import Card, CARDS, DECK_SIZE
 
 
 class Deck:
-    def __init__(self):
-        self.cards: List[Card] = []
+    """
+    Deck of card ids (see card.py); dealing maps ids back to the interned Cards.
+
+    The id array is allocated once and reshuffled in place on every reset;
+    dealing only advances a position pointer.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None, seed: Optional[int] = None):
+        """
+        Args:
+            rng (Optional[random.Random]): Random source to shuffle with, e.g. one per match.
+            seed (Optional[int]): Seed for a private random source when `rng` is not given.
+        """
+        self.rng = rng or random.Random(seed)
+        self.card_ids: List[int] = list(range(DECK_SIZE))
+        self._pos = 0
         self.reset()
 
     def reset(self):
-        self.cards = [Card(rank, suit) for suit in Suit for rank in Rank]
-        self.shuffle()
+        self._pos = 0
+        self.rng.shuffle(self.card_ids)
 
     def shuffle(self):
-        random.shuffle(self.cards)
+        """Shuffles the cards that have not been dealt yet."""
+        tail = self.card_ids[self._pos :]
+        self.rng.shuffle(tail)
+        self.card_ids[self._pos :] = tail
 
-    def deal(self, count: int = 1) -> List[Card]:
-        if count > len(self.cards):
+    def deal_ids(self, count: int = 1) -> List[int]:
+        end = self._pos + count
+        if end > DECK_SIZE:
             raise ValueError("Not enough cards in deck")
-        dealt = self.cards[:count]
-        self.cards = self.cards[count:]
+        dealt = self.card_ids[self._pos : end]
+        self._pos = end
         return dealt
 
+    def deal_id(self) -> int:
+        if self._pos >= DECK_SIZE:
+            raise ValueError("Not enough cards in deck")
+        self._pos += 1
+        return self.card_ids[self._pos - 1]
+
+    def deal(self, count: int = 1) -> List[Card]:
+        return [CARDS[i] for i in self.deal_ids(count)]
+
+    def deal_one(self) -> Card:
+        return CARDS[self.deal_id()]
+
+    @property
+    def cards(self) -> List[Card]:
+        """Remaining cards in dealing order."""
+        return [CARDS[i] for i in self.card_ids[self._pos :]]
+
     def remaining(self) -> int:
-        return len(self.cards)
+        return DECK_SIZE - self._pos
+
+    def snapshot(self) -> Tuple[Tuple[int, ...], int]:
+        """Card order and deal position; the random source is not included."""
+        return tuple(self.card_ids), self._pos
+
+    def restore(self, state: Tuple[Tuple[int, ...], int]):
+        card_ids, self._pos = state
+        self.card_ids = list(card_ids)
+
+    @classmethod
+    def from_snapshot(
+        cls, state: Tuple[Tuple[int, ...], int], rng: random.Random
+    ) -> "Deck":
+        """Rebuilds a deck without shuffling (and so without consuming `rng`)."""
+        deck = cls.__new__(cls)
+        deck.rng = rng
+        deck.restore(state)
+        return deck
@@ -0,0 +1,247 @@
+"""
+Monte Carlo equity calculator.
+
+Estimates how often a hand wins or ties against a number of random opponent
+hands by dealing out the rest of the board many times. Sampling is split into
+fixed-size chunks with their own seeds, so a seeded run gives the same result
+no matter how many worker processes execute it.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import List, Optional, Set, Tuple
+
+from .card import Card, DECK_SIZE
+from .evaluator import BoardEvaluator
+
+# Samples per work unit sent to a worker process
+CHUNK_SIZE = 2000
+
+
+@dataclass
+class EquityResult:
+    """Outcome frequencies for the hero hand. `equity` counts split pots fractionally."""
+
+    win: float
+    tie: float
+    loss: float
+    equity: float
+    samples: int
+
+
+def _simulate_chunk(
+    hole_ids: List[int],
+    board_ids: List[int],
+    num_opponents: int,
+    samples: int,
+    seed: int,
+    deadline: Optional[float] = None,
+) -> Tuple[int, int, float, int]:
+    """
+    Runs one chunk of samples.
+
+    Returns:
+        Tuple[int, int, float, int]: (wins, ties, equity share, samples played).
+    """
+    rng = random.Random(seed)
+    dead: Set[int] = set(hole_ids) | set(board_ids)
+    live = [cid for cid in range(DECK_SIZE) if cid not in dead]
+    board_missing = 5 - len(board_ids)
+    draw_count = board_missing + 2 * num_opponents
+    # A complete board is analysed once for the whole chunk
+    fixed_board = BoardEvaluator(board_ids) if not board_missing else None
+
+    wins = ties = played = 0
+    share = 0.0
+    for i in range(samples):
+        # Checking the clock every sample would cost more than the sampling itself
+        if deadline is not None and i % 256 == 0 and time.monotonic() >= deadline:
+            break
+
+        drawn = rng.sample(live, draw_count)
+        board = fixed_board or BoardEvaluator(board_ids + drawn[:board_missing])
+        hero = board.score(hole_ids)
+
+        best_villain = 0
+        tied = 0
+        for j in range(board_missing, draw_count, 2):
+            villain = board.score(drawn[j : j + 2])
+            if villain > best_villain:
+                best_villain = villain
+                tied = 1
+            elif villain == best_villain:
+                tied += 1
+
+        played += 1
+        if hero > best_villain:
+            wins += 1
+            share += 1.0
+        elif hero == best_villain:
+            ties += 1
+            share += 1.0 / (tied + 1)
+
+    return wins, ties, share, played
+
+
+class EquityCalculator:
+    """
+    Multi-process equity service. The worker pool is created on first use
+    and reused for later calls; use as a context manager or call close().
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        Args:
+            workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+                With 1 worker everything runs in the calling process.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "EquityCalculator":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._executor:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def calculate(
+        self,
+        hole_cards: List[Card],
+        board: List[Card],
+        num_opponents: int,
+        samples: Optional[int] = 10000,
+        time_budget: Optional[float] = None,
+        seed: Optional[int] = None,
+    ) -> EquityResult:
+        """
+        Estimate equity of `hole_cards` against `num_opponents` random hands.
+
+        Args:
+            hole_cards (List[Card]): The hero's two hole cards.
+            board (List[Card]): Known community cards (0-5).
+            num_opponents (int): Number of live opponents.
+            samples (Optional[int]): Number of boards to deal. None to rely on time_budget only.
+            time_budget (Optional[float]): Wall-clock limit in seconds.
+            seed (Optional[int]): Seed for reproducible sampling.
+
+        Returns:
+            EquityResult: Win/tie/loss probabilities and the overall equity.
+        """
+        if len(hole_cards) != 2:
+            raise ValueError("Equity needs exactly two hole cards")
+        if len(board) > 5:
+            raise ValueError("Board cannot have more than 5 cards")
+        if num_opponents < 1:
+            raise ValueError("Equity needs at least one opponent")
+        if 7 + 2 * num_opponents > DECK_SIZE:
+            raise ValueError("Not enough cards for that many opponents")
+        if samples is None and time_budget is None:
+            raise ValueError("Either samples or time_budget must be set")
+
+        hole_ids = [c.id for c in hole_cards]
+        board_ids = [c.id for c in board]
+        deadline = time.monotonic() + time_budget if time_budget else None
+        seeds = random.Random(seed)
+
+        def chunk_args(size: int):
+            return (
+                hole_ids,
+                board_ids,
+                num_opponents,
+                size,
+                seeds.getrandbits(64),
+                deadline,
+            )
+
+        remaining = samples
+        totals = [0, 0, 0.0, 0]
+
+        def add(result: Tuple[int, int, float, int]):
+            for i, value in enumerate(result):
+                totals[i] += value
+
+        def next_size() -> int:
+            nonlocal remaining
+            if remaining is None:
+                return CHUNK_SIZE
+            size = min(CHUNK_SIZE, remaining)
+            remaining -= size
+            return size
+
+        def has_work() -> bool:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            return remaining is None or remaining > 0
+
+        if self.workers == 1:
+            while has_work():
+                add(_simulate_chunk(*chunk_args(next_size())))
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+            # Keep every worker busy with two queued chunks
+            pending: Set[Future] = set()
+            while has_work() and len(pending) < 2 * self.workers:
+                pending.add(
+                    self._executor.submit(_simulate_chunk, *chunk_args(next_size()))
+                )
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    add(future.result())
+                    if has_work():
+                        pending.add(
+                            self._executor.submit(
+                                _simulate_chunk, *chunk_args(next_size())
+                            )
+                        )
+
+        wins, ties, share, played = totals
+        if not played:
+            return EquityResult(win=0.0, tie=0.0, loss=0.0, equity=0.0, samples=0)
+        return EquityResult(
+            win=wins / played,
+            tie=ties / played,
+            loss=(played - wins - ties) / played,
+            equity=share / played,
+            samples=played,
+        )
+
+    def for_player(self, game, player_idx: int, **kwargs) -> EquityResult:
+        """
+        Equity of a seat in a running PokerGame against the other live
+        (active or all-in) players, given the current community cards.
+
+        Args:
+            game (PokerGame): The game to read hole cards and board from.
+            player_idx (int): Seat to evaluate.
+            **kwargs: Passed through to calculate (samples, time_budget, seed).
+        """
+        player = game.players[player_idx]
+        opponents = sum(
+            1
+            for i, p in enumerate(game.players)
+            if i != player_idx and p["status"] in ["active", "allin"]
+        )
+        return self.calculate(player["hand"], game.community_cards, opponents, **kwargs)
+
+
+def calculate_equity(
+    hole_cards: List[Card],
+    board: List[Card],
+    num_opponents: int,
+    workers: Optional[int] = None,
+    **kwargs,
+) -> EquityResult:
+    """One-off equity calculation with a temporary worker pool."""
+    with EquityCalculator(workers) as calculator:
+        return calculator.calculate(hole_cards, board, num_opponents, **kwargs)
@@ -1,7 +1,6 @@
 from enum import IntEnum
-from typing import List, Tuple
-from collections import Counter
-from .card import Card
+from typing import Dict, List, Tuple
+from .card import Card, CARD_RANK, CARD_RANK_BIT, CARD_STR, CARD_SUIT
 
 
 class HandStrength(IntEnum):
@@ -17,6 +16,330 @@ class HandStrength(IntEnum):
     ROYAL_FLUSH = 10
 
 
+# === LOOKUP TABLES ===
+# Ranks are indexed 0..12 (TWO..ACE) and suits 0..3 inside the tables.
+# A hand score is a single comparable int: the HandStrength in the top bits
+# followed by up to 5 kicker rank values (2..14), 4 bits each.
+
+# Each rank owns a 3-bit counter inside the rank-pattern key, so summing the
+# weights of all cards gives a unique key for the multiset of ranks.
+_RANK_WEIGHT = tuple(1 << (3 * i) for i in range(13))
+
+_KICKER_BITS = 4
+_MAX_KICKERS = 5
+_STRENGTH_SHIFT = _KICKER_BITS * _MAX_KICKERS
+
+# Number of kickers encoded in the score for each strength
+_KICKER_COUNT = {
+    HandStrength.HIGH_CARD: 5,
+    HandStrength.PAIR: 4,
+    HandStrength.TWO_PAIR: 3,
+    HandStrength.THREE_OF_A_KIND: 3,
+    HandStrength.STRAIGHT: 1,
+    HandStrength.FLUSH: 5,
+    HandStrength.FULL_HOUSE: 2,
+    HandStrength.FOUR_OF_A_KIND: 2,
+    HandStrength.STRAIGHT_FLUSH: 1,
+    HandStrength.ROYAL_FLUSH: 0,
+}
+
+# (rank mask, high card value) for every straight, best first. The wheel
+# (A-2-3-4-5) plays as a 5-high straight.
+_STRAIGHTS = tuple((0b11111 << low, low + 6) for low in range(8, -1, -1)) + (
+    (0b1000000001111, 5),
+)
+
+
+def _pack(strength: HandStrength, kickers: List[int]) -> int:
+    score = int(strength)
+    for k in kickers:
+        score = (score << _KICKER_BITS) | k
+    return score << (_KICKER_BITS * (_MAX_KICKERS - len(kickers)))
+
+
+def _unpack(score: int) -> Tuple[HandStrength, List[int]]:
+    strength = HandStrength(score >> _STRENGTH_SHIFT)
+    kickers = []
+    for i in range(_KICKER_COUNT[strength]):
+        shift = _KICKER_BITS * (_MAX_KICKERS - 1 - i)
+        kickers.append((score >> shift) & 0xF)
+    return strength, kickers
+
+
+def decode_score(score: int) -> Tuple[HandStrength, List[int]]:
+    """Splits a hand score back into (HandStrength, kickers)."""
+    return _unpack(score)
+
+
+def _top_values(mask: int, count: int) -> List[int]:
+    """Rank values (2..14) of the `count` highest bits set in a rank mask."""
+    values = []
+    while mask and len(values) < count:
+        top = mask.bit_length() - 1
+        values.append(top + 2)
+        mask &= ~(1 << top)
+    return values
+
+
+def _straight_high(mask: int) -> int:
+    for straight_mask, high in _STRAIGHTS:
+        if mask & straight_mask == straight_mask:
+            return high
+    return 0
+
+
+def _score_flush(mask: int) -> int:
+    """Score the best hand that can be made from the ranks of a single suit."""
+    high = _straight_high(mask)
+    if high == 14:
+        return _pack(HandStrength.ROYAL_FLUSH, [])
+    if high:
+        return _pack(HandStrength.STRAIGHT_FLUSH, [high])
+    return _pack(HandStrength.FLUSH, _top_values(mask, 5))
+
+
+def _score_rank_pattern(counts: List[int]) -> int:
+    """Score the best non-flush hand for a multiset of ranks (count per rank index)."""
+    present = pairs = trips = quads = 0
+    for i, n in enumerate(counts):
+        bit = 1 << i
+        if n >= 1:
+            present |= bit
+        if n >= 2:
+            pairs |= bit
+        if n >= 3:
+            trips |= bit
+        if n == 4:
+            quads |= bit
+
+    if quads:
+        quad = quads.bit_length() - 1
+        kicker = _top_values(present & ~(1 << quad), 1)
+        return _pack(HandStrength.FOUR_OF_A_KIND, [quad + 2] + kicker)
+
+    if trips:
+        trip = trips.bit_length() - 1
+        rest_pairs = pairs & ~(1 << trip)
+        if rest_pairs:
+            return _pack(
+                HandStrength.FULL_HOUSE, [trip + 2] + _top_values(rest_pairs, 1)
+            )
+
+    high = _straight_high(present)
+    if high:
+        return _pack(HandStrength.STRAIGHT, [high])
+
+    if trips:
+        trip = trips.bit_length() - 1
+        kickers = _top_values(present & ~(1 << trip), 2)
+        return _pack(HandStrength.THREE_OF_A_KIND, [trip + 2] + kickers)
+
+    if pairs and pairs & (pairs - 1):
+        top_pairs = _top_values(pairs, 2)
+        rest = present & ~(1 << (top_pairs[0] - 2)) & ~(1 << (top_pairs[1] - 2))
+        return _pack(HandStrength.TWO_PAIR, top_pairs + _top_values(rest, 1))
+
+    if pairs:
+        pair = pairs.bit_length() - 1
+        kickers = _top_values(present & ~(1 << pair), 3)
+        return _pack(HandStrength.PAIR, [pair + 2] + kickers)
+
+    return _pack(HandStrength.HIGH_CARD, _top_values(present, 5))
+
+
+def _build_flush_table() -> List[int]:
+    return [_score_flush(m) if m.bit_count() >= 5 else 0 for m in range(1 << 13)]
+
+
+def _build_rank_table() -> Dict[int, int]:
+    """Enumerate every 5, 6 and 7 card rank multiset (max 4 cards per rank)."""
+    table: Dict[int, int] = {}
+    counts = [0] * 13
+
+    def fill(rank_idx: int, used: int, key: int):
+        if rank_idx == 13:
+            if used >= 5:
+                table[key] = _score_rank_pattern(counts)
+            return
+        for n in range(min(4, 7 - used) + 1):
+            counts[rank_idx] = n
+            fill(rank_idx + 1, used + n, key + n * _RANK_WEIGHT[rank_idx])
+        counts[rank_idx] = 0
+
+    fill(0, 0, 0)
+    return table
+
+
+_FLUSH_TABLE = _build_flush_table()
+_RANK_TABLE = _build_rank_table()
+
+
+# === EVALUATION ===
+# The evaluator works on card ids (see card.py); Card lists are converted once.
+
+_CARD_WEIGHT = tuple(_RANK_WEIGHT[r] for r in CARD_RANK)
+
+
+def _score_with_flush_suit(card_ids: List[int]) -> Tuple[int, int]:
+    """Returns (score, flush suit index or -1) for a hand of 5-7 card ids."""
+    key = 0
+    suit_masks = [0, 0, 0, 0]
+    for cid in card_ids:
+        key += _CARD_WEIGHT[cid]
+        suit_masks[CARD_SUIT[cid]] |= CARD_RANK_BIT[cid]
+
+    # With at most 7 cards a flush rules out quads and full houses,
+    # so a flush suit always decides the hand on its own.
+    for s, mask in enumerate(suit_masks):
+        if mask.bit_count() >= 5:
+            return _FLUSH_TABLE[mask], s
+    return _RANK_TABLE[key], -1
+
+
+def score_ids(card_ids: List[int]) -> int:
+    """
+    Scores the best 5-card hand from 5-7 card ids as a single comparable integer.
+    Higher is better; equal scores split the pot.
+    """
+    return _score_with_flush_suit(card_ids)[0]
+
+
+def score_hand(cards: List[Card]) -> int:
+    """Same as score_ids, for Card objects."""
+    return _score_with_flush_suit([c.id for c in cards])[0]
+
+
+class BoardEvaluator:
+    """
+    Community cards analysed once, so many hole card pairs can be scored
+    against the same board with two table additions and one lookup each.
+    Accepts a board of 3-5 cards.
+    """
+
+    __slots__ = ("board_ids", "key", "flush_suit", "flush_mask")
+
+    def __init__(self, board_ids: List[int]):
+        if not 3 <= len(board_ids) <= 5:
+            raise ValueError("Board must have 3 to 5 cards")
+        self.board_ids = list(board_ids)
+
+        # Rank-pattern key of the board alone; hole cards add their weights.
+        # Straights are part of the rank table, so no separate masks are needed.
+        self.key = 0
+        suit_masks = [0, 0, 0, 0]
+        for cid in board_ids:
+            self.key += _CARD_WEIGHT[cid]
+            suit_masks[CARD_SUIT[cid]] |= CARD_RANK_BIT[cid]
+
+        # Two hole cards can only complete a flush in a suit with 3+ board
+        # cards, and a board of at most 5 cards has at most one such suit.
+        self.flush_suit = -1
+        self.flush_mask = 0
+        for s, mask in enumerate(suit_masks):
+            if mask.bit_count() >= 3:
+                self.flush_suit = s
+                self.flush_mask = mask
+
+    def _score(self, first: int, second: int) -> Tuple[int, int]:
+        fs = self.flush_suit
+        if fs >= 0:
+            mask = self.flush_mask
+            if CARD_SUIT[first] == fs:
+                mask |= CARD_RANK_BIT[first]
+            if CARD_SUIT[second] == fs:
+                mask |= CARD_RANK_BIT[second]
+            if mask.bit_count() >= 5:
+                return _FLUSH_TABLE[mask], fs
+        return _RANK_TABLE[self.key + _CARD_WEIGHT[first] + _CARD_WEIGHT[second]], -1
+
+    def score(self, hole_ids: List[int]) -> int:
+        """Same as score_ids(hole_ids + board_ids)."""
+        return self._score(hole_ids[0], hole_ids[1])[0]
+
+    def evaluate(
+        self, hole_ids: List[int]
+    ) -> Tuple[HandStrength, List[int], List[str], List[str]]:
+        """Same as evaluate_ids(hole_ids + board_ids)."""
+        score, flush_suit = self._score(hole_ids[0], hole_ids[1])
+        return _describe(hole_ids + self.board_ids, score, flush_suit)
+
+
+def _split_core(
+    card_ids: List[int], strength: HandStrength, kickers: List[int], flush_suit: int
+) -> Tuple[List[int], List[int]]:
+    """Pick the concrete cards that form the winning combination and its kickers."""
+
+    def take(rank_value: int, count: int, used: List[int]) -> List[int]:
+        picked = []
+        for cid in card_ids:
+            if len(picked) == count:
+                break
+            if CARD_RANK[cid] + 2 == rank_value and cid not in used:
+                if flush_suit < 0 or CARD_SUIT[cid] == flush_suit:
+                    picked.append(cid)
+        return picked
+
+    core: List[int] = []
+    if strength in (
+        HandStrength.ROYAL_FLUSH,
+        HandStrength.STRAIGHT_FLUSH,
+        HandStrength.STRAIGHT,
+    ):
+        high = kickers[0] if kickers else 14
+        for value in range(high, high - 5, -1):
+            core += take(value if value > 1 else 14, 1, core)
+        return core, []
+
+    if strength == HandStrength.FLUSH:
+        for value in kickers:
+            core += take(value, 1, core)
+        return core, []
+
+    # Paired hands: leading kickers are the rank groups, the rest are singles
+    group_sizes = {
+        HandStrength.FOUR_OF_A_KIND: [4],
+        HandStrength.FULL_HOUSE: [3, 2],
+        HandStrength.THREE_OF_A_KIND: [3],
+        HandStrength.TWO_PAIR: [2, 2],
+        HandStrength.PAIR: [2],
+        HandStrength.HIGH_CARD: [1],
+    }[strength]
+
+    for value, size in zip(kickers, group_sizes):
+        core += take(value, size, core)
+
+    kicker_cards: List[int] = []
+    for value in kickers[len(group_sizes) :]:
+        kicker_cards += take(value, 1, core + kicker_cards)
+
+    return core, kicker_cards
+
+
+def _describe(
+    card_ids: List[int], score: int, flush_suit: int
+) -> Tuple[HandStrength, List[int], List[str], List[str]]:
+    strength, kickers = _unpack(score)
+    core, kicker_cards = _split_core(card_ids, strength, kickers, flush_suit)
+    return (
+        strength,
+        kickers,
+        [CARD_STR[cid] for cid in core],
+        [CARD_STR[cid] for cid in kicker_cards],
+    )
+
+
+def evaluate_ids(
+    card_ids: List[int],
+) -> Tuple[HandStrength, List[int], List[str], List[str]]:
+    """Same as evaluate_hand, for card ids."""
+    if len(card_ids) < 5:
+        ranks = sorted([CARD_RANK[cid] + 2 for cid in card_ids], reverse=True)
+        # All cards are core for high card < 5
+        return (HandStrength.HIGH_CARD, ranks, [CARD_STR[cid] for cid in card_ids], [])
+
+    return _describe(card_ids, *_score_with_flush_suit(card_ids))
+
+
 def evaluate_hand(
     cards: List[Card],
 ) -> Tuple[HandStrength, List[int], List[str], List[str]]:
@@ -24,109 +347,4 @@ def evaluate_hand(
     Evaluates the best 5-card poker hand from a list of 5-7 cards.
     Returns (HandStrength, Kickers, CoreCardsStrings, KickerCardsStrings) tuple.
     """
-    if len(cards) < 5:
-        ranks = sorted([c.rank.value_int for c in cards], reverse=True)
-        # All cards are core for high card < 5
-        return (HandStrength.HIGH_CARD, ranks, [str(c) for c in cards], [])
-
-    import itertools
-
-    best_score = (-1, [])
-    best_core_str = []
-    best_kicker_str = []
-
-    for five_cards in itertools.combinations(cards, 5):
-        strength, kicks, core_cards_objs = _evaluate_five(list(five_cards))
-        current_score = (strength, kicks)
-
-        if current_score > best_score:
-            best_score = current_score
-            best_core_str = [str(c) for c in core_cards_objs]
-            # Identify kickers by excluding core
-            # Safe because core_cards_objs are subset of five_cards list objects
-            best_kicker_str = [str(c) for c in five_cards if c not in core_cards_objs]
-
-    return (*best_score, best_core_str, best_kicker_str)
-
-
-def _evaluate_five(cards: List[Card]) -> Tuple[HandStrength, List[int], List[Card]]:
-    # Helper to find cards by rank
-    def get_cards_by_rank(r: int) -> List[Card]:
-        return [c for c in cards if c.rank.value_int == r]
-
-    ranks = sorted([c.rank.value_int for c in cards], reverse=True)
-    suits = [c.suit for c in cards]
-    is_flush = len(set(suits)) == 1
-
-    # Check straight
-    is_straight = False
-    straight_high = 0
-    unique_ranks = sorted(list(set(ranks)), reverse=True)
-
-    # Straight detection cards
-    straight_cards = []
-
-    if len(unique_ranks) >= 5:
-        for i in range(len(unique_ranks) - 4):
-            window = unique_ranks[i : i + 5]
-            if window[0] - window[4] == 4:
-                is_straight = True
-                straight_high = window[0]
-                # Collect cards matching these ranks
-                # Note: If multiple cards have same rank (impossible in 5 cards unless pair, but straight has distinct ranks), works fine.
-                straight_cards = [c for c in cards if c.rank.value_int in window]
-                break
-
-        # Wheel straight (A, 5, 4, 3, 2)
-        if not is_straight and set([14, 5, 4, 3, 2]).issubset(set(unique_ranks)):
-            is_straight = True
-            straight_high = 5
-            straight_cards = [c for c in cards if c.rank.value_int in [14, 5, 4, 3, 2]]
-
-    if is_straight and is_flush:
-        if set(ranks) == {14, 13, 12, 11, 10}:
-            return (HandStrength.ROYAL_FLUSH, [], cards)  # All 5 are core
-
-        # Sort cards to ensure correct order if needed, but for highlight set is enough.
-        return (HandStrength.STRAIGHT_FLUSH, [ranks[0]], cards)
-
-    rank_counts = Counter(ranks)
-    counts = rank_counts.most_common()
-
-    if counts[0][1] == 4:
-        core = get_cards_by_rank(counts[0][0])
-        return (HandStrength.FOUR_OF_A_KIND, [counts[0][0], counts[1][0]], core)
-
-    if counts[0][1] == 3 and counts[1][1] == 2:
-        # Full house: All 5 are core
-        return (HandStrength.FULL_HOUSE, [counts[0][0], counts[1][0]], cards)
-
-    if is_flush:
-        return (HandStrength.FLUSH, ranks, cards)
-
-    if is_straight:
-        return (HandStrength.STRAIGHT, [straight_high], straight_cards)
-
-    if counts[0][1] == 3:
-        core = get_cards_by_rank(counts[0][0])
-        kicks = [counts[0][0]] + sorted([k for k, v in counts if v == 1], reverse=True)
-        return (HandStrength.THREE_OF_A_KIND, kicks, core)
-
-    if counts[0][1] == 2 and counts[1][1] == 2:
-        # Two Pair: 4 cards are core
-        core = get_cards_by_rank(counts[0][0]) + get_cards_by_rank(counts[1][0])
-        return (HandStrength.TWO_PAIR, [counts[0][0], counts[1][0], counts[2][0]], core)
-
-    if counts[0][1] == 2:
-        core = get_cards_by_rank(counts[0][0])
-        kicks = [counts[0][0]] + sorted([k for k, v in counts if v == 1], reverse=True)
-        return (HandStrength.PAIR, kicks, core)
-
-    # High Card: Only the highest card is technically the "core" winner?
-    # Or just top 1? Or all 5?
-    # Usually "High Card Ace" means Ace is the thing.
-    # User says "only the winning combination".
-    # For High Card, the "combination" is just the high card.
-    core = get_cards_by_rank(ranks[0])  # Start with highest
-    # If tie, we look at next... but standard view is just highlighting the High Card.
-    return (HandStrength.HIGH_CARD, ranks, core)
+    return evaluate_ids([c.id for c in cards])
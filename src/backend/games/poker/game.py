@@ -1,10 +1,14 @@
 import random
-from typing import List, Dict, Any
+from collections.abc import MutableMapping
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple
 from core.game.base import BaseGame
-from .card import Card
+from .card import Card, CARD_STR
 from .deck import Deck
-from .evaluator import evaluate_hand, HandStrength
+from .evaluator import BoardEvaluator, HandStrength
 from core.constants import PLAYER_COLOR_NAMES
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
 
 # Game Stages
 PREFLOP = "PREFLOP"
@@ -14,6 +18,131 @@ RIVER = "RIVER"
 SHOWDOWN = "SHOWDOWN"
 HAND_OVER = "HAND_OVER"
 
+# Player status codes, stored per seat in PokerGame.status
+ACTIVE = 0
+FOLDED = 1
+ALLIN = 2
+OUT = 3
+STATUS_NAMES = ("active", "folded", "allin", "out")
+_STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
+class PlayerSeat(MutableMapping):
+    """
+    Dict-like view of one seat in a PokerGame's player table.
+
+    Keeps `game.players[i]["chips"]` style access working for match loops and
+    tools while the state itself lives in the game's per-field lists.
+    Per-hand showdown details (final_hand_rank, ...) are kept in `extra`.
+    """
+
+    __slots__ = ("_game", "_idx", "extra")
+
+    _FIELDS = (
+        "name",
+        "chips",
+        "hand",
+        "status",
+        "current_round_bet",
+        "total_bet",
+        "has_acted",
+        "is_eliminated",
+    )
+
+    def __init__(self, game: "PokerGame", idx: int):
+        self._game = game
+        self._idx = idx
+        self.extra: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        g, i = self._game, self._idx
+        if key == "name":
+            return g.player_names[i]
+        if key == "chips":
+            return g.chips[i]
+        if key == "hand":
+            return g.hands[i]
+        if key == "status":
+            return STATUS_NAMES[g.status[i]]
+        if key == "current_round_bet":
+            return g.round_bets[i]
+        if key == "total_bet":
+            return g.total_bets[i]
+        if key == "has_acted":
+            return g.has_acted[i]
+        if key == "is_eliminated":
+            return g.eliminated[i]
+        return self.extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        g, i = self._game, self._idx
+        if key == "name":
+            raise KeyError("Player names are fixed for the game")
+        if key == "chips":
+            g.chips[i] = value
+        elif key == "hand":
+            g.hands[i] = value
+        elif key == "status":
+            g._set_status(i, _STATUS_CODES[value])
+        elif key == "current_round_bet":
+            g.round_bets[i] = value
+            g._refresh_max_bet()
+        elif key == "total_bet":
+            g.total_bets[i] = value
+        elif key == "has_acted":
+            g.has_acted[i] = value
+        elif key == "is_eliminated":
+            g.eliminated[i] = value
+        else:
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._FIELDS:
+            raise KeyError(f"Cannot delete player field '{key}'")
+        del self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._FIELDS
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(self._FIELDS) + len(self.extra)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class PokerSnapshot(NamedTuple):
+    """Immutable copy of a PokerGame's state, see PokerGame.snapshot()."""
+
+    player_names: Tuple[str, ...]
+    starting_chips: int
+    rng_state: Any
+    deck: Tuple[Tuple[int, ...], int]
+    community_cards: Tuple[Card, ...]
+    pot: int
+    dealer_idx: int
+    current_player_idx: int
+    stage: str
+    wins: Tuple[Tuple[str, int], ...]
+    chips: Tuple[int, ...]
+    hands: Tuple[List[Card], ...]
+    status: Tuple[int, ...]
+    round_bets: Tuple[int, ...]
+    total_bets: Tuple[int, ...]
+    has_acted: Tuple[bool, ...]
+    eliminated: Tuple[bool, ...]
+    extras: Tuple[Tuple[Tuple[str, Any], ...], ...]
+    max_bet: int
+    active_count: int
+    allin_count: int
+    small_blind: int
+    big_blind: int
+    min_raise: int
+    last_raiser_idx: int
+    last_hand_result: Optional[Dict[str, Any]]
+    force_end: bool
+
 
 class PokerGame(BaseGame):
     """
@@ -21,33 +150,54 @@ class PokerGame(BaseGame):
     Manages the deck, community cards, player states, betting rounds, and hand evaluation.
     """
 
-    def __init__(self, player_names: List[str], starting_chips: int = 1000):
+    def __init__(
+        self,
+        player_names: List[str],
+        starting_chips: int = 1000,
+        seed: Optional[int] = None,
+    ):
         """
         Initialize the Poker game.
 
         Args:
             player_names (List[str]): List of player names participating in the game.
             starting_chips (int): Initial chip count for each player. Defaults to 1000.
+            seed (Optional[int]): Seed for this game's private random source, so whole
+                matches (dealer choice and every shuffle) can be replayed.
         """
         self.player_names = player_names
         self.starting_chips = starting_chips
-        self.deck = Deck()
+        self.rng = random.Random(seed)
+        self.deck = Deck(self.rng)
         self.community_cards: List[Card] = []
         self.pot = 0
 
         # Randomize starting dealer position
         # We set it effectively to (Target - 1) so that the first call to start_new_hand()
         # (which increments dealer_idx) lands exactly on our random Target.
-        target_dealer = random.randint(0, len(player_names) - 1)
+        target_dealer = self.rng.randint(0, len(player_names) - 1)
         self.dealer_idx = (target_dealer - 1) % len(player_names)
 
         self.current_player_idx = 0
         self.stage = PREFLOP
         self.wins = {name: 0 for name in player_names}
 
-        # Player State: index -> dict
-        # keys: name, chips, hand, status ('active', 'folded', 'allin'), current_round_bet, total_bet, has_acted, final_hand_rank
-        self.players: List[Dict[str, Any]] = []
+        # Player table: one list per field, indexed by seat. `players` exposes
+        # the same data as dict-like PlayerSeat views.
+        self.chips: List[int] = []
+        self.hands: List[List[Card]] = []
+        self.status: List[int] = []
+        self.round_bets: List[int] = []
+        self.total_bets: List[int] = []
+        self.has_acted: List[bool] = []
+        self.eliminated: List[bool] = []
+        self.players: List[PlayerSeat] = []
+
+        # Kept up to date on every status change and bet
+        self.max_bet = 0  # Highest current_round_bet among active/all-in players
+        self.active_count = 0
+        self.allin_count = 0
+
         self._init_players()
 
         self.small_blind = 25
@@ -61,19 +211,58 @@ class PokerGame(BaseGame):
         """
         Reset player structures for a completely new game session.
         """
-        self.players = []
-        for name in self.player_names:
-            self.players.append(
-                {
-                    "name": name,
-                    "chips": self.starting_chips,
-                    "hand": [],
-                    "status": "active",
-                    "current_round_bet": 0,
-                    "total_bet": 0,
-                    "has_acted": False,
-                }
-            )
+        n = len(self.player_names)
+        self.chips = [self.starting_chips] * n
+        self.hands = [[] for _ in range(n)]
+        self.status = [ACTIVE] * n
+        self.round_bets = [0] * n
+        self.total_bets = [0] * n
+        self.has_acted = [False] * n
+        self.eliminated = [False] * n
+        self.players = [PlayerSeat(self, i) for i in range(n)]
+        self.max_bet = 0
+        self.active_count = n
+        self.allin_count = 0
+
+    def _set_status(self, idx: int, code: int):
+        """Changes a seat's status and keeps the live-player counters in sync."""
+        old = self.status[idx]
+        if old == code:
+            return
+        self.status[idx] = code
+        if old == ACTIVE:
+            self.active_count -= 1
+        elif old == ALLIN:
+            self.allin_count -= 1
+        if code == ACTIVE:
+            self.active_count += 1
+        elif code == ALLIN:
+            self.allin_count += 1
+
+        # Dropping out of the hand can only lower the max bet if this seat held it
+        if code in (FOLDED, OUT) and self.round_bets[idx] == self.max_bet:
+            self._refresh_max_bet()
+        elif code in (ACTIVE, ALLIN) and self.round_bets[idx] > self.max_bet:
+            self.max_bet = self.round_bets[idx]
+
+    def _refresh_max_bet(self):
+        self.max_bet = max(
+            (
+                bet
+                for bet, code in zip(self.round_bets, self.status)
+                if code == ACTIVE or code == ALLIN
+            ),
+            default=0,
+        )
+
+    def _next_active(self, start_idx: int) -> int:
+        """First active seat after `start_idx`, or `start_idx` if there is none."""
+        n = len(self.status)
+        for i in range(1, n + 1):
+            idx = (start_idx + i) % n
+            if self.status[idx] == ACTIVE:
+                return idx
+        return start_idx
 
     def start_new_hand(self):
         """
@@ -91,50 +280,44 @@ class PokerGame(BaseGame):
         self.dealer_idx = (self.dealer_idx + 1) % len(self.players)
 
         # Reset player round states
-        for p in self.players:
-            if p["chips"] > 0 and not p.get("is_eliminated"):
-                p["status"] = "active"
-                p["hand"] = self.deck.deal(2)
-                p["current_round_bet"] = 0
-                p["total_bet"] = 0
-                p["has_acted"] = False
-                if "final_hand_rank" in p:
-                    del p["final_hand_rank"]
+        for i, seat in enumerate(self.players):
+            if self.chips[i] > 0 and not self.eliminated[i]:
+                self.status[i] = ACTIVE
+                self.hands[i] = self.deck.deal(2)
+                self.round_bets[i] = 0
+                self.total_bets[i] = 0
+                self.has_acted[i] = False
+                seat.extra.pop("final_hand_rank", None)
             else:
-                p["status"] = "out"
-                p["hand"] = []
-
-        # Helper to find next active player
-        def get_next_active(start_idx):
-            for i in range(1, len(self.players) + 1):
-                idx = (start_idx + i) % len(self.players)
-                if self.players[idx]["status"] == "active":
-                    return idx
-            return start_idx
+                self.status[i] = OUT
+                self.hands[i] = []
+        self.active_count = self.status.count(ACTIVE)
+        self.allin_count = 0
+        self.max_bet = 0
 
         # Calculate Blinds Indices (skipping out/eliminated players)
         # Assuming at least 2 active players
-        sb_idx = get_next_active(self.dealer_idx)
-        bb_idx = get_next_active(sb_idx)
+        sb_idx = self._next_active(self.dealer_idx)
+        bb_idx = self._next_active(sb_idx)
 
-        print(
-            f"[GAME] Posting Blinds: Dealer={self.dealer_idx}, SB={sb_idx}, BB={bb_idx}"
+        logger.debug(
+            "Posting blinds: dealer=%d, SB=%d, BB=%d", self.dealer_idx, sb_idx, bb_idx
         )
 
         self._post_blind(sb_idx, self.small_blind)
         self._post_blind(bb_idx, self.big_blind)
 
         # Action starts after BB (UTG)
-        start_offset = get_next_active(bb_idx)  # Actually UTG is the one AFTER BB
+        start_offset = self._next_active(bb_idx)  # Actually UTG is the one AFTER BB
 
         # Find first active player starting from UTG
         for i in range(len(self.players)):
             idx = (start_offset + i) % len(self.players)
-            if self.players[idx]["status"] == "active":
+            if self.status[idx] == ACTIVE:
                 self.current_player_idx = idx
                 break
 
-        print(f"[GAME] Hand Started. Current Player: {self.current_player_idx} (UTG)")
+        logger.debug("Hand started, current player %d (UTG)", self.current_player_idx)
         self.last_raiser_idx = bb_idx
         self.min_raise = self.big_blind
 
@@ -143,17 +326,14 @@ class PokerGame(BaseGame):
         Permanently remove a player from the game (e.g. due to API rate limits).
         Treats them as folded for the current hand and marks them to stay 'out' in future hands.
         """
-        p = self.players[player_idx]
-        p["status"] = "folded"
-        p["is_eliminated"] = True
+        self._set_status(player_idx, FOLDED)
+        self.eliminated[player_idx] = True
 
         # Advance to next active player to keep game moving
         # Need to be careful not to create infinite loop if everyone eliminated
-        for i in range(1, len(self.players) + 1):
-            next_idx = (player_idx + i) % len(self.players)
-            if self.players[next_idx]["status"] == "active":
-                self.current_player_idx = next_idx
-                break
+        next_idx = self._next_active(player_idx)
+        if self.status[next_idx] == ACTIVE:
+            self.current_player_idx = next_idx
 
         self._check_round_completion()
 
@@ -166,12 +346,7 @@ class PokerGame(BaseGame):
             player_idx (int): Index of the player posting the blind.
             amount (int): Amount of the blind (Small Blind or Big Blind).
         """
-        player = self.players[player_idx]
-        actual_bet = min(player["chips"], amount)
-        player["chips"] -= actual_bet
-        player["current_round_bet"] += actual_bet
-        player["total_bet"] += actual_bet
-        self.pot += actual_bet
+        self._bet_chips(player_idx, min(self.chips[player_idx], amount))
 
     def get_board_state(self) -> Dict[str, Any]:
         """
@@ -179,34 +354,27 @@ class PokerGame(BaseGame):
         This provides a rich state for the UI to render the poker table.
         """
         # Visibility Logic
-        has_human = any("human" in p["name"].lower() for p in self.players)
+        is_human = ["human" in name.lower() for name in self.player_names]
+        has_human = any(is_human)
+        # Count humans to detect "Hotseat" (multi-human) vs "Single Player"
+        is_hotseat = sum(is_human) > 1
 
         players_data = []
-        for i, p in enumerate(self.players):
-            is_human_player = "human" in p["name"].lower()
+        for i, seat in enumerate(self.players):
+            status = self.status[i]
 
             # Determine visibility
             show_cards = False
 
-            # Count humans to detect "Hotseat" (multi-human) vs "Single Player"
-            human_indices = [
-                idx
-                for idx, pl in enumerate(self.players)
-                if "human" in pl["name"].lower()
-            ]
-            is_hotseat = len(human_indices) > 1
-
             if self.stage in [SHOWDOWN, HAND_OVER]:
                 show_cards = True
-            elif p["status"] == "show":
-                show_cards = True
-            elif p["status"] == "folded":
+            elif status == FOLDED:
                 # Reveal folded cards for spectator interest (gives info advantage but acceptable for AI games)
                 show_cards = True
             elif not has_human:
                 # Spectator Mode: No humans in game, show all cards
                 show_cards = True
-            elif is_human_player:
+            elif is_human[i]:
                 if is_hotseat:
                     # Hotseat: Only show cards if it is THIS player's turn
                     # This prevents Player A from seeing Player B's cards in 4x Human mode
@@ -218,15 +386,17 @@ class PokerGame(BaseGame):
 
             players_data.append(
                 {
-                    "name": p["name"],
-                    "chips": p["chips"],
-                    "bet": p["current_round_bet"],
-                    "total_bet": p["total_bet"],
-                    "status": p["status"],
-                    "has_acted": p["has_acted"],
+                    "name": self.player_names[i],
+                    "chips": self.chips[i],
+                    "bet": self.round_bets[i],
+                    "total_bet": self.total_bets[i],
+                    "status": STATUS_NAMES[status],
+                    "has_acted": self.has_acted[i],
                     "is_dealer": i == self.dealer_idx,
-                    "cards": [str(c) for c in p["hand"]] if show_cards else None,
-                    "hand_rank": p.get("final_hand_rank"),
+                    "cards": (
+                        [CARD_STR[c.id] for c in self.hands[i]] if show_cards else None
+                    ),
+                    "hand_rank": seat.extra.get("final_hand_rank"),
                 }
             )
 
@@ -254,14 +424,9 @@ class PokerGame(BaseGame):
     def _cards_to_text(self, cards: List[Card]) -> str:
         if not cards:
             return "[]"
-        parts = []
-        for c in cards:
-            r = c.rank.value
-            s = c.suit.value
-            # Use symbols directly for cleaner prompt and better LLM parsing
-            # e.g. "A♥", "10♣"
-            parts.append(f"{r}{s}")
-        return "[" + ", ".join(parts) + "]"
+        # Use symbols directly for cleaner prompt and better LLM parsing
+        # e.g. "A♥", "10♣"
+        return "[" + ", ".join(CARD_STR[c.id] for c in cards) + "]"
 
     def _render_state_text(self, player_idx: int) -> str:
         """
@@ -320,48 +485,36 @@ class PokerGame(BaseGame):
 
     def force_fold(self, player_idx: int):
         """Force a player to fold (used when they make an invalid move)."""
-        p = self.players[player_idx]
-        p["status"] = "folded"
+        self._set_status(player_idx, FOLDED)
 
         # Advance to next active player BEFORE checking round completion
         # This is needed so that if no stage change occurs, the game engine
         # has the correct current_player_idx for the match loop to sync with
-        for i in range(1, len(self.players) + 1):
-            next_idx = (player_idx + i) % len(self.players)
-            if self.players[next_idx]["status"] == "active":
-                self.current_player_idx = next_idx
-                break
+        next_idx = self._next_active(player_idx)
+        if self.status[next_idx] == ACTIVE:
+            self.current_player_idx = next_idx
 
         self._check_round_completion()
 
     def make_move(self, move: str, player_symbol: str) -> bool:
         p_idx = self.current_player_idx
         # Safety: Ensure current player is valid
-        if self.players[p_idx]["status"] != "active":
+        if self.status[p_idx] != ACTIVE:
             # This happens if match loop tries to move a folded player.
             return False
 
-        p = self.players[p_idx]
-
         move = move.lower().strip()
         parts = move.split()
         if not parts:
             return False
         action = parts[0]
 
-        current_max_bet = max(
-            [
-                pl["current_round_bet"]
-                for pl in self.players
-                if pl["status"] in ["active", "allin"]
-            ]
-            or [0]
-        )
-        to_call = current_max_bet - p["current_round_bet"]
+        current_max_bet = self.max_bet
+        to_call = current_max_bet - self.round_bets[p_idx]
 
         valid = False
         if action == "fold":
-            p["status"] = "folded"
+            self._set_status(p_idx, FOLDED)
             valid = True
 
         elif action == "check":
@@ -369,11 +522,11 @@ class PokerGame(BaseGame):
                 valid = True
 
         elif action == "call":
-            amount = min(to_call, p["chips"])
-            self._bet_chips(p, amount)
+            amount = min(to_call, self.chips[p_idx])
+            self._bet_chips(p_idx, amount)
             # If we called and ran out of chips, we are all-in
-            if p["chips"] == 0:
-                p["status"] = "allin"
+            if self.chips[p_idx] == 0:
+                self._set_status(p_idx, ALLIN)
             valid = True
 
         elif action == "raise":
@@ -383,72 +536,70 @@ class PokerGame(BaseGame):
                 # "RAISE X" -> I put in Call + X.
                 total_needed = to_call + add_amt
 
-                if total_needed <= p["chips"] and add_amt >= self.min_raise:
-                    self._bet_chips(p, total_needed)
+                if total_needed <= self.chips[p_idx] and add_amt >= self.min_raise:
+                    self._bet_chips(p_idx, total_needed)
                     self.min_raise = add_amt
                     self.last_raiser_idx = p_idx
                     # Reset acted flags for others to reopen action
-                    for pl in self.players:
-                        if pl["status"] == "active":
-                            pl["has_acted"] = False
+                    self._reopen_action()
                     valid = True
 
         elif action == "allin":
-            amt = p["chips"]
-            self._bet_chips(p, amt)
-            p["status"] = "allin"
+            self._bet_chips(p_idx, self.chips[p_idx])
+            self._set_status(p_idx, ALLIN)
 
             # Raise logic for All-in
-            if p["current_round_bet"] > current_max_bet:
-                raise_amt = p["current_round_bet"] - current_max_bet
+            if self.round_bets[p_idx] > current_max_bet:
+                raise_amt = self.round_bets[p_idx] - current_max_bet
                 # Only reopen action if it's a "full" raise?
                 # For simplified rules: always reopen if it raises max bet
                 if raise_amt > self.min_raise:
                     self.min_raise = raise_amt
 
                 self.last_raiser_idx = p_idx
-                for pl in self.players:
-                    if pl["status"] == "active":
-                        pl["has_acted"] = False
+                self._reopen_action()
             valid = True
 
         if not valid:
             return False
 
-        p["has_acted"] = True
+        self.has_acted[p_idx] = True
 
         # Advance to next active player BEFORE checking round completion
         # Game engine is the source of truth for turn order
-        for i in range(1, len(self.players) + 1):
-            next_idx = (p_idx + i) % len(self.players)
-            if self.players[next_idx]["status"] == "active":
-                self.current_player_idx = next_idx
-                break
+        next_idx = self._next_active(p_idx)
+        if self.status[next_idx] == ACTIVE:
+            self.current_player_idx = next_idx
 
         self._check_round_completion()
         return True
 
-    def _bet_chips(self, p, amount):
-        p["chips"] -= amount
-        p["current_round_bet"] += amount
-        p["total_bet"] += amount
+    def _reopen_action(self):
+        for i, code in enumerate(self.status):
+            if code == ACTIVE:
+                self.has_acted[i] = False
+
+    def _bet_chips(self, player_idx: int, amount: int):
+        self.chips[player_idx] -= amount
+        self.round_bets[player_idx] += amount
+        self.total_bets[player_idx] += amount
         self.pot += amount
+        if self.round_bets[player_idx] > self.max_bet:
+            self.max_bet = self.round_bets[player_idx]
 
     def _check_round_completion(self):
-        # Check standard round end
-        active = [p for p in self.players if p["status"] == "active"]
-        allin = [p for p in self.players if p["status"] == "allin"]
-        not_folded = active + allin
-
         # If only 1 player remains not folded, they win immediately (no showdown needed)
-        if len(not_folded) == 1:
-            winner = not_folded[0]
-            winner["chips"] += self.pot
-            self.wins[winner["name"]] = self.wins.get(winner["name"], 0) + 1
+        if self.active_count + self.allin_count == 1:
+            winner_idx = next(
+                i for i, code in enumerate(self.status) if code in (ACTIVE, ALLIN)
+            )
+            winner_name = self.player_names[winner_idx]
+            self.chips[winner_idx] += self.pot
+            self.wins[winner_name] = self.wins.get(winner_name, 0) + 1
             self.last_hand_result = {
-                "winners": [winner["name"]],
+                "winners": [winner_name],
                 "winner_indices": [
-                    i for i, p in enumerate(self.players) if p["name"] == winner["name"]
+                    i for i, name in enumerate(self.player_names) if name == winner_name
                 ],
                 "pot": self.pot,
                 "community_cards": [str(c) for c in self.community_cards],
@@ -461,32 +612,26 @@ class PokerGame(BaseGame):
             return
 
         # If 0 active players (all remaining are all-in or folded)
-        if len(active) == 0:
+        if self.active_count == 0:
             self._to_showdown_auto()
             return
 
-        # Max bet on table
-        max_bet = max(
-            [
-                pl["current_round_bet"]
-                for pl in self.players
-                if pl["status"] in ["active", "allin"]
-            ]
-            or [0]
-        )
-        bets = [p["current_round_bet"] for p in active]
-
-        all_matched = all(b == max_bet for b in bets)
-        all_acted = all(p.get("has_acted", False) for p in active)
+        # Every active player must have acted and matched the max bet on table
+        max_bet = self.max_bet
+        for i, code in enumerate(self.status):
+            if code == ACTIVE and (
+                not self.has_acted[i] or self.round_bets[i] != max_bet
+            ):
+                return
 
-        if all_matched and all_acted:
-            self._next_stage()
+        self._next_stage()
 
     def _next_stage(self):
         # Clean up round bets
-        for p in self.players:
-            p["current_round_bet"] = 0
-            p["has_acted"] = False
+        n = len(self.player_names)
+        self.round_bets = [0] * n
+        self.has_acted = [False] * n
+        self.max_bet = 0
 
         curr_stage_idx = [PREFLOP, FLOP, TURN, RIVER, SHOWDOWN].index(self.stage)
         if self.stage == SHOWDOWN:
@@ -499,39 +644,38 @@ class PokerGame(BaseGame):
         if next_stage == FLOP:
             self.community_cards = self.deck.deal(3)
         elif next_stage in [TURN, RIVER]:
-            self.community_cards.append(self.deck.deal(1)[0])
+            self.community_cards.append(self.deck.deal_one())
         elif next_stage == SHOWDOWN:
             self._resolve_hand_winner()
             return
 
         # Start of new stage: Action starts at first active player after Dealer
         self.min_raise = self.big_blind  # Reset min raise
-        active_indices = [
-            i for i, p in enumerate(self.players) if p["status"] == "active"
-        ]
-        if not active_indices:
+        if not self.active_count:
             return
 
         # Find first active index after Dealer
-        offset = (self.dealer_idx + 1) % len(self.players)
-        for i in range(len(self.players)):
-            idx = (offset + i) % len(self.players)
-            if self.players[idx]["status"] == "active":
-                self.current_player_idx = idx
-                print(
-                    f"[GAME] _next_stage: dealer_idx={self.dealer_idx}, setting current_player_idx={idx} ({self.players[idx]['name']})"
-                )
-                break
+        idx = self._next_active(self.dealer_idx)
+        self.current_player_idx = idx
+        logger.debug(
+            "%s: dealer_idx=%d, current_player_idx=%d (%s)",
+            self.stage,
+            self.dealer_idx,
+            idx,
+            self.player_names[idx],
+        )
 
     def _to_showdown_auto(self):
         # Deal remaining cards
         while len(self.community_cards) < 5:
-            self.community_cards.append(self.deck.deal(1)[0])
+            self.community_cards.append(self.deck.deal_one())
         self.stage = SHOWDOWN
         self._resolve_hand_winner()
 
     def _resolve_hand_winner(self):
-        contestants = [p for p in self.players if p["status"] in ["active", "allin"]]
+        contestants = [
+            p for i, p in enumerate(self.players) if self.status[i] in (ACTIVE, ALLIN)
+        ]
         if not contestants:
             return
 
@@ -542,11 +686,12 @@ class PokerGame(BaseGame):
             winners = [winner_p]
         else:
             best_rank = (-1, [])
+            # Analyse the shared board once; each player only adds hole cards
+            board = BoardEvaluator([c.id for c in self.community_cards])
 
             for p in contestants:
-                full_hand = p["hand"] + self.community_cards
-                # New evaluator returns (rank, kickers, core_str, kicker_str)
-                eval_result = evaluate_hand(full_hand)
+                # Evaluator returns (rank, kickers, core_str, kicker_str)
+                eval_result = board.evaluate([c.id for c in p["hand"]])
                 rank_tuple = eval_result[:2]
 
                 p["final_hand_rank"] = rank_tuple
@@ -616,8 +761,7 @@ class PokerGame(BaseGame):
 
     def is_game_over(self) -> bool:
         # Game over if only 1 player has chips
-        active = [p for p in self.players if p["chips"] > 0]
-        return len(active) <= 1
+        return sum(1 for chips in self.chips if chips > 0) <= 1
 
     def get_winner(self) -> str | None:
         if self.is_game_over() or getattr(self, "force_end", False):
@@ -643,3 +787,82 @@ class PokerGame(BaseGame):
                 if p["name"] == winner_name:
                     return i
         return None
+
+    def snapshot(self) -> PokerSnapshot:
+        """
+        Capture the game state, including the random source, so a restored game
+        deals exactly the same cards. Hands, showdown details and the last hand
+        result are never mutated in place, so they are shared rather than copied.
+        """
+        return PokerSnapshot(
+            player_names=tuple(self.player_names),
+            starting_chips=self.starting_chips,
+            rng_state=self.rng.getstate(),
+            deck=self.deck.snapshot(),
+            community_cards=tuple(self.community_cards),
+            pot=self.pot,
+            dealer_idx=self.dealer_idx,
+            current_player_idx=self.current_player_idx,
+            stage=self.stage,
+            wins=tuple(self.wins.items()),
+            chips=tuple(self.chips),
+            hands=tuple(self.hands),
+            status=tuple(self.status),
+            round_bets=tuple(self.round_bets),
+            total_bets=tuple(self.total_bets),
+            has_acted=tuple(self.has_acted),
+            eliminated=tuple(self.eliminated),
+            extras=tuple(tuple(seat.extra.items()) for seat in self.players),
+            max_bet=self.max_bet,
+            active_count=self.active_count,
+            allin_count=self.allin_count,
+            small_blind=self.small_blind,
+            big_blind=self.big_blind,
+            min_raise=self.min_raise,
+            last_raiser_idx=self.last_raiser_idx,
+            last_hand_result=self.last_hand_result,
+            force_end=getattr(self, "force_end", False),
+        )
+
+    def restore(self, state: PokerSnapshot) -> None:
+        """Reset the game to a snapshot. Also works on an uninitialised instance (clone)."""
+        self.player_names = list(state.player_names)
+        self.starting_chips = state.starting_chips
+
+        # Reuse the random source and deck when restoring in place
+        if getattr(self, "rng", None) is None:
+            # Fixed seed skips the OS entropy read; setstate() below overwrites it
+            self.rng = random.Random(0)
+            self.deck = Deck.from_snapshot(state.deck, self.rng)
+        else:
+            self.deck.restore(state.deck)
+        self.rng.setstate(state.rng_state)
+
+        self.community_cards = list(state.community_cards)
+        self.pot = state.pot
+        self.dealer_idx = state.dealer_idx
+        self.current_player_idx = state.current_player_idx
+        self.stage = state.stage
+        self.wins = dict(state.wins)
+
+        self.chips = list(state.chips)
+        self.hands = list(state.hands)
+        self.status = list(state.status)
+        self.round_bets = list(state.round_bets)
+        self.total_bets = list(state.total_bets)
+        self.has_acted = list(state.has_acted)
+        self.eliminated = list(state.eliminated)
+        if len(getattr(self, "players", ())) != len(state.chips):
+            self.players = [PlayerSeat(self, i) for i in range(len(state.chips))]
+        for seat, extra in zip(self.players, state.extras):
+            seat.extra = dict(extra)
+
+        self.max_bet = state.max_bet
+        self.active_count = state.active_count
+        self.allin_count = state.allin_count
+        self.small_blind = state.small_blind
+        self.big_blind = state.big_blind
+        self.min_raise = state.min_raise
+        self.last_raiser_idx = state.last_raiser_idx
+        self.last_hand_result = state.last_hand_result
+        self.force_end = state.force_end
@@ -1,27 +1,61 @@
-from core.game.match import Match
+from core.game.match import Match, MatchLoop, MoveRequest
 from core.game.base import BaseGame
-from typing import List, Callable, Optional
+from typing import Any, List, Callable, NamedTuple, Optional
 from core.game.player import Player
 from utils.logger import setup_logger
+import asyncio
 import queue
 
 logger = setup_logger(__name__)
 
 
+class CommandRequest(NamedTuple):
+    """Wait up to `timeout` seconds for a command; raises queue.Empty if none comes."""
+
+    timeout: float
+
+
 class PokerMatch(Match):
     def __init__(self, game: BaseGame, players: List[Player], system_prompt: str):
         super().__init__(game, players, system_prompt)
         self.command_queue = queue.Queue()  # type: ignore
+        # Set while run_async waits for a command
+        self._command_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def process_command(self, cmd: str):
         """Thread-safe method to receive commands from outside (e.g. WebSocket)."""
         logger.info(f"PokerMatch received command: {cmd}")
         self.command_queue.put(cmd)
-
-    def run(self, on_update: Optional[Callable[[dict], None]] = None):
+        if self._command_event is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._command_event.set)
+
+    def _serve(self, request: Any) -> Any:
+        if isinstance(request, CommandRequest):
+            return self.command_queue.get(timeout=request.timeout)
+        return super()._serve(request)
+
+    async def _aserve(self, request: Any) -> Any:
+        if not isinstance(request, CommandRequest):
+            return await super()._aserve(request)
+        try:
+            return self.command_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._loop = asyncio.get_running_loop()
+        self._command_event = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._command_event.wait(), request.timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._command_event = None
+        return self.command_queue.get_nowait()
+
+    def _play(self, on_update: Optional[Callable[[dict], None]]) -> MatchLoop:
         """
         Runs the poker game loop.
-        Overrides Match.run to handle:
+        Overrides Match._play to handle:
         1. Skipping folded/out players
         2. Dynamic turn order (if needed, though standard poker is rotation)
         3. Potentially different end-game conditions
@@ -58,7 +92,7 @@ class PokerMatch(Match):
             if hasattr(self.game, "stage") and self.game.stage == "HAND_OVER":  # type: ignore
                 # Non-blocking check for commands
                 try:
-                    cmd = self.command_queue.get(timeout=0.5)
+                    cmd = yield CommandRequest(timeout=0.5)
                     logger.info(f"PokerMatch HAND_OVER processing command: '{cmd}'")
 
                     if cmd.strip() == "next":
@@ -147,7 +181,7 @@ class PokerMatch(Match):
             # 2. Get move
             state = self.game.get_state_for_player(self.current_player_idx)
             try:
-                response = current_player.get_move(state, self.system_prompt)
+                response = yield MoveRequest(current_player, state)
                 move_raw = self._extract_action(response.content)
                 metrics = response.metrics
 
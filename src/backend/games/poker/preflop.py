@@ -0,0 +1,237 @@
+"""
+Precomputed preflop equity tables.
+
+All 1326 starting hands collapse into 169 canonical classes (13 pairs, 78
+suited and 78 offsuit hands). The build step estimates, by simulation, the
+equity of every class against every other class and against 1..N random
+opponents, and writes the results to a flat binary file. At runtime the file
+is memory-mapped, so every lookup is a single array read.
+
+Build the table with:
+    python -m games.poker.preflop --samples 2000
+"""
+
+import argparse
+import mmap
+import os
+import random
+import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from .card import CARD_RANK, CARD_SUIT, DECK_SIZE, Card
+from .equity import _simulate_chunk
+from .evaluator import BoardEvaluator
+
+NUM_CLASSES = 169
+DEFAULT_MAX_OPPONENTS = 8
+DEFAULT_TABLE_PATH = Path(__file__).parent / "data" / "preflop_equity.bin"
+
+# File layout: header, then float32 values in native byte order:
+#   [NUM_CLASSES * NUM_CLASSES]  equity of class i vs class j
+#   [NUM_CLASSES * max_opponents] equity of class i vs n random hands (n = 1..max)
+_MAGIC = b"PFEQ"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHH")
+
+_RANK_CHARS = "23456789TJQKA"
+
+
+# === CANONICAL HANDS ===
+# Classes form the usual 13x13 grid over rank indices: pairs on the diagonal,
+# suited hands at (high, low) and offsuit hands at (low, high).
+
+
+def class_index(card_a: int, card_b: int) -> int:
+    """Canonical class 0..168 of two hole card ids."""
+    hi, lo = CARD_RANK[card_a], CARD_RANK[card_b]
+    if hi < lo:
+        hi, lo = lo, hi
+    if CARD_SUIT[card_a] == CARD_SUIT[card_b]:
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+def hand_class(hole_cards: List[Card]) -> int:
+    """Canonical class 0..168 of two hole cards."""
+    return class_index(hole_cards[0].id, hole_cards[1].id)
+
+
+def class_name(idx: int) -> str:
+    """Short name of a class, e.g. "AA", "AKs", "72o"."""
+    row, col = divmod(idx, 13)
+    if row == col:
+        return _RANK_CHARS[row] * 2
+    if row > col:
+        return f"{_RANK_CHARS[row]}{_RANK_CHARS[col]}s"
+    return f"{_RANK_CHARS[col]}{_RANK_CHARS[row]}o"
+
+
+@lru_cache(maxsize=None)
+def class_combos(idx: int) -> Tuple[Tuple[int, int], ...]:
+    """All concrete hole card id pairs belonging to a class."""
+    return tuple(
+        (a, b)
+        for a in range(DECK_SIZE)
+        for b in range(a + 1, DECK_SIZE)
+        if class_index(a, b) == idx
+    )
+
+
+# === BUILD ===
+
+
+def _build_row(
+    idx: int, samples: int, max_opponents: int, seed: int
+) -> Tuple[int, List[float], List[float]]:
+    """Equities of one class vs classes idx..168 and vs 1..max_opponents random hands."""
+    rng = random.Random(seed)
+    deck = list(range(DECK_SIZE))
+
+    vs_class = []
+    for other in range(idx, NUM_CLASSES):
+        share = 0.0
+        played = 0
+        while played < samples:
+            hero = rng.choice(class_combos(idx))
+            villain = rng.choice(class_combos(other))
+            if hero[0] in villain or hero[1] in villain:
+                continue
+            dead = set(hero) | set(villain)
+            board = BoardEvaluator(rng.sample([c for c in deck if c not in dead], 5))
+            hero_score = board.score(hero)
+            villain_score = board.score(villain)
+            if hero_score > villain_score:
+                share += 1.0
+            elif hero_score == villain_score:
+                share += 0.5
+            played += 1
+        vs_class.append(share / samples)
+
+    # Every concrete combo of a class has the same equity vs random hands
+    hole = list(class_combos(idx)[0])
+    vs_random = []
+    for opponents in range(1, max_opponents + 1):
+        _, _, share, played = _simulate_chunk(
+            hole, [], opponents, samples, rng.getrandbits(64)
+        )
+        vs_random.append(share / played)
+
+    return idx, vs_class, vs_random
+
+
+def build_preflop_table(
+    path: Path = DEFAULT_TABLE_PATH,
+    samples: int = 2000,
+    max_opponents: int = DEFAULT_MAX_OPPONENTS,
+    workers: Optional[int] = None,
+    seed: int = 0,
+):
+    """
+    Simulate all preflop equities and write them to `path`.
+
+    Args:
+        path (Path): Output file.
+        samples (int): Simulated boards per matchup.
+        max_opponents (int): Largest number of random opponents to tabulate.
+        workers (Optional[int]): Worker processes. Defaults to the CPU count.
+        seed (int): Seed for reproducible tables.
+    """
+    seeds = random.Random(seed)
+    tasks = [
+        (idx, samples, max_opponents, seeds.getrandbits(64))
+        for idx in range(NUM_CLASSES)
+    ]
+
+    vs_class = array("f", [0.0] * (NUM_CLASSES * NUM_CLASSES))
+    vs_random = array("f", [0.0] * (NUM_CLASSES * max_opponents))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        rows = executor.map(_build_row, *zip(*tasks))
+        for idx, row, random_row in rows:
+            for offset, equity in enumerate(row):
+                other = idx + offset
+                vs_class[idx * NUM_CLASSES + other] = equity
+                if other != idx:
+                    vs_class[other * NUM_CLASSES + idx] = 1.0 - equity
+            for n, equity in enumerate(random_row):
+                vs_random[idx * max_opponents + n] = equity
+            print(f"[PREFLOP] {class_name(idx)} done")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, NUM_CLASSES, max_opponents))
+        vs_class.tofile(f)
+        vs_random.tofile(f)
+
+
+# === RUNTIME LOOKUP ===
+
+
+class PreflopTable:
+    """Read-only, memory-mapped view of a table written by build_preflop_table."""
+
+    def __init__(self, path: Path = DEFAULT_TABLE_PATH):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, classes, max_opponents = _HEADER.unpack_from(self._mm)
+        if magic != _MAGIC or version != _VERSION or classes != NUM_CLASSES:
+            raise ValueError(f"{path} is not a preflop equity table (v{_VERSION})")
+
+        self.max_opponents = max_opponents
+        self._values = memoryview(self._mm)[_HEADER.size :].cast("f")
+        self._random_offset = NUM_CLASSES * NUM_CLASSES
+
+    def equity_vs_class(self, idx: int, other: int) -> float:
+        """Equity of class `idx` heads-up against class `other`."""
+        return self._values[idx * NUM_CLASSES + other]
+
+    def equity_vs_random(self, idx: int, opponents: int = 1) -> float:
+        """Equity of class `idx` against `opponents` random hands (capped at the table size)."""
+        n = min(max(opponents, 1), self.max_opponents)
+        return self._values[self._random_offset + idx * self.max_opponents + n - 1]
+
+    def hand_equity(self, hole_cards: List[Card], opponents: int = 1) -> float:
+        return self.equity_vs_random(hand_class(hole_cards), opponents)
+
+
+_table: Optional[PreflopTable] = None
+
+
+def get_preflop_table() -> Optional[PreflopTable]:
+    """Shared table from the default location, or None if it has not been built."""
+    global _table
+    if _table is None and DEFAULT_TABLE_PATH.exists():
+        _table = PreflopTable(DEFAULT_TABLE_PATH)
+    return _table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build preflop equity tables")
+    parser.add_argument("--samples", type=int, default=2000, help="Boards per matchup")
+    parser.add_argument(
+        "--opponents", type=int, default=DEFAULT_MAX_OPPONENTS, help="Max opponents"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--output", type=Path, default=DEFAULT_TABLE_PATH, help="Output file"
+    )
+    args = parser.parse_args()
+
+    build_preflop_table(
+        args.output,
+        args.samples,
+        args.opponents,
+        args.workers or os.cpu_count(),
+        args.seed,
+    )
+    print(f"Preflop table written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Headless poker simulation.
+
+Drives PokerGame directly with in-process policies: no LLM calls, no match
+loop notifications and no waiting for the UI between hands. When a game
+ends (one player left with chips) a fresh one is started, so a run can go
+on for millions of hands.
+
+Run with:
+    python -m games.poker.simulator --hands 100000 --policies random call strength
+"""
+
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from .evaluator import BoardEvaluator, HandStrength, _STRENGTH_SHIFT
+from .game import ACTIVE, HAND_OVER, PREFLOP, PokerGame
+
+# A policy picks a move string ("fold", "call", "raise 100", ...) for the
+# seat to act. It gets the game, the seat index and the simulation's RNG.
+Policy = Callable[[PokerGame, int, random.Random], str]
+
+
+def _to_call(game: PokerGame, idx: int) -> int:
+    return game.max_bet - game.round_bets[idx]
+
+
+def random_policy(game: PokerGame, idx: int, rng: random.Random) -> str:
+    """Uniformly random action; raises use the minimum raise."""
+    action = rng.choice(["fold", "check", "call", "raise", "allin"])
+    if action == "check" and _to_call(game, idx):
+        return "call"
+    if action == "raise":
+        return f"raise {game.min_raise}"
+    return action
+
+
+def call_policy(game: PokerGame, idx: int, rng: random.Random) -> str:
+    """Calling station: never folds, never raises."""
+    return "call" if _to_call(game, idx) else "check"
+
+
+def strength_policy(game: PokerGame, idx: int, rng: random.Random) -> str:
+    """
+    Simple made-hand player. Preflop it plays pairs and two high cards,
+    after the flop it calls with a pair and raises with two pair or better.
+    """
+    hand = game.hands[idx]
+    to_call = _to_call(game, idx)
+
+    if game.stage == PREFLOP:
+        a, b = hand[0].rank_index, hand[1].rank_index
+        if a == b or min(a, b) >= 8:  # Pair or both ten and above
+            return f"raise {game.min_raise}" if to_call <= game.big_blind else "call"
+        return "fold" if to_call else "check"
+
+    board = BoardEvaluator([c.id for c in game.community_cards])
+    strength = board.score([c.id for c in hand]) >> _STRENGTH_SHIFT
+    if strength >= HandStrength.TWO_PAIR:
+        return f"raise {game.min_raise}"
+    if strength >= HandStrength.PAIR:
+        return "call" if to_call else "check"
+    return "fold" if to_call else "check"
+
+
+POLICIES: Dict[str, Policy] = {
+    "random": random_policy,
+    "call": call_policy,
+    "strength": strength_policy,
+}
+
+
+@dataclass
+class SimulationResult:
+    hands: int = 0
+    games: int = 0
+    moves: int = 0
+    invalid_moves: int = 0
+    elapsed: float = 0.0
+    wins: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hands_per_second(self) -> float:
+        return self.hands / self.elapsed if self.elapsed else 0.0
+
+
+def simulate(
+    policies: Dict[str, Policy],
+    hands: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    seed: Optional[int] = None,
+    starting_chips: int = 1000,
+) -> SimulationResult:
+    """
+    Plays hands between in-process policies until a limit is reached.
+
+    Args:
+        policies (Dict[str, Policy]): Seat name -> policy, in seating order.
+        hands (Optional[int]): Stop after this many completed hands.
+        time_limit (Optional[float]): Stop after this many seconds.
+        seed (Optional[int]): Seed for reproducible runs (deals and policy choices).
+        starting_chips (int): Chips per player at the start of every game.
+
+    Returns:
+        SimulationResult: Counts of hands, games, moves and hand wins per seat.
+    """
+    if len(policies) < 2:
+        raise ValueError("Simulation needs at least two players")
+    if hands is None and time_limit is None:
+        raise ValueError("Either hands or time_limit must be set")
+
+    names = list(policies)
+    seat_policies = [policies[name] for name in names]
+    rng = random.Random(seed)
+    result = SimulationResult(wins={name: 0 for name in names})
+
+    def new_game() -> PokerGame:
+        return PokerGame(names, starting_chips, seed=rng.getrandbits(64))
+
+    start = time.monotonic()
+    deadline = start + time_limit if time_limit is not None else None
+    game = new_game()
+
+    while True:
+        if game.stage == HAND_OVER:
+            result.hands += 1
+            for name in game.last_hand_result["winners"]:
+                result.wins[name] += 1
+
+            if hands is not None and result.hands >= hands:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+
+            if game.is_game_over():
+                result.games += 1
+                game = new_game()
+            else:
+                game.start_new_hand()
+            continue
+
+        idx = game.current_player_idx
+        if game.status[idx] != ACTIVE:
+            idx = game._next_active(idx)
+            if game.status[idx] != ACTIVE:
+                raise RuntimeError(
+                    f"No active player to act in stage {game.stage} (hand {result.hands})"
+                )
+            game.current_player_idx = idx
+
+        move = seat_policies[idx](game, idx, rng)
+        result.moves += 1
+        if not game.make_move(move, names[idx]):
+            # Same rule as PokerMatch: an invalid move folds the hand
+            result.invalid_moves += 1
+            game.force_fold(idx)
+
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless poker simulation")
+    parser.add_argument("--hands", type=int, default=None, help="Hands to play")
+    parser.add_argument("--time", type=float, default=None, help="Time limit (s)")
+    parser.add_argument(
+        "--policies",
+        nargs="+",
+        choices=sorted(POLICIES),
+        default=["random", "call", "strength", "random"],
+        help="Policy per seat",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    parser.add_argument("--chips", type=int, default=1000, help="Starting chips")
+    args = parser.parse_args()
+
+    if args.hands is None and args.time is None:
+        args.hands = 10000
+
+    policies = {f"{name}-{i}": POLICIES[name] for i, name in enumerate(args.policies)}
+    result = simulate(policies, args.hands, args.time, args.seed, args.chips)
+
+    print(
+        f"{result.hands} hands ({result.games} finished games, {result.moves} moves, "
+        f"{result.invalid_moves} invalid) in {result.elapsed:.1f}s: "
+        f"{result.hands_per_second:.0f} hands/s"
+    )
+    for name, wins in result.wins.items():
+        print(f"  {name}: {wins} hands won ({wins / max(result.hands, 1):.1%})")
+
+
+if __name__ == "__main__":
+    main()
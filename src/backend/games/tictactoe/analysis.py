@@ -0,0 +1,210 @@
+"""
+Move-quality analysis of stored TicTacToe games.
+
+Replays every tictactoe log in data/games against the solved game
+(games.tictactoe.solver) and labels each move:
+
+- optimal: as good as the best move in the position
+- inaccuracy: keeps the outcome (win/draw/loss) but wins slower or loses faster
+- blunder: throws away the outcome, e.g. a won position becomes a draw
+
+Files are analysed in parallel, one task per file, and the counts are merged
+per model.
+
+Run with:
+    python -m games.tictactoe.analysis --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from core.storage import GAMES_DIR
+
+from .solver import canonical, has_line, solve_all
+
+OPTIMAL = "optimal"
+INACCURACY = "inaccuracy"
+BLUNDER = "blunder"
+LABELS = (OPTIMAL, INACCURACY, BLUNDER)
+
+
+@dataclass
+class ModelAccuracy:
+    moves: int = 0
+    counts: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(LABELS, 0))
+    games: int = 0
+
+    @property
+    def accuracy(self) -> float:
+        return self.counts[OPTIMAL] / self.moves if self.moves else 0.0
+
+    def merge(self, other: "ModelAccuracy") -> None:
+        self.moves += other.moves
+        self.games += other.games
+        for label, count in other.counts.items():
+            self.counts[label] += count
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+def classify_move(me: int, opp: int, bit: int) -> Optional[str]:
+    """
+    Labels placing a stone on `bit` for the player to move.
+
+    Args:
+        me (int): Bitboard of the player to move.
+        opp (int): Bitboard of the opponent.
+        bit (int): Cell index (r * 3 + c) of the move.
+
+    Returns:
+        Optional[str]: One of LABELS, or None if the position is not part of
+        a legal game (already decided or unreachable).
+    """
+    if has_line(me) or has_line(opp):
+        return None
+    table = solve_all()
+    occupied = me | opp
+    values = {}
+    for cell in range(9):
+        if occupied >> cell & 1:
+            continue
+        child = table.get(canonical(opp, me | 1 << cell))
+        if child is None:
+            return None
+        values[cell] = -child
+    if bit not in values:
+        return None
+
+    best = max(values.values())
+    played = values[bit]
+    if played == best:
+        return OPTIMAL
+    if _sign(played) == _sign(best):
+        return INACCURACY
+    return BLUNDER
+
+
+def _board_bits(board: List[List[str]]) -> Dict[str, int]:
+    bits: Dict[str, int] = {}
+    for r, row in enumerate(board):
+        for c, cell in enumerate(row):
+            if cell.strip():
+                bits[cell] = bits.get(cell, 0) | 1 << (r * 3 + c)
+    return bits
+
+
+def analyse_log(log: List[dict]) -> List[Tuple[str, str]]:
+    """
+    Labels the moves of one game log.
+
+    A move is an entry whose board has exactly one more stone than the board
+    before it; the entry's current_player made it.
+
+    Returns:
+        List[Tuple[str, str]]: (player name, label) per analysable move.
+    """
+    results = []
+    previous: Dict[str, int] = {}
+    for entry in log:
+        board = entry.get("board")
+        if not board:
+            continue
+        current = _board_bits(board)
+        added = {
+            symbol: bits & ~previous.get(symbol, 0)
+            for symbol, bits in current.items()
+            if bits != previous.get(symbol, 0)
+        }
+        if len(added) == 1:
+            symbol, new_bits = next(iter(added.items()))
+            if new_bits.bit_count() == 1:
+                me = previous.get(symbol, 0)
+                opp = 0
+                for other, bits in previous.items():
+                    if other != symbol:
+                        opp |= bits
+                label = classify_move(me, opp, new_bits.bit_length() - 1)
+                if label is not None:
+                    results.append((entry.get("current_player", "unknown"), label))
+        previous = current
+    return results
+
+
+def _analyse_file(path: Path) -> Dict[str, ModelAccuracy]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("game_type", "tictactoe") != "tictactoe":
+        return {}
+
+    stats: Dict[str, ModelAccuracy] = {}
+    for player, label in analyse_log(data.get("log", [])):
+        model = stats.setdefault(player, ModelAccuracy())
+        model.moves += 1
+        model.counts[label] += 1
+    for model in stats.values():
+        model.games = 1
+    return stats
+
+
+def analyse_archive(
+    games_dir: Path = GAMES_DIR, workers: Optional[int] = None
+) -> Dict[str, ModelAccuracy]:
+    """
+    Analyses every stored TicTacToe game.
+
+    Args:
+        games_dir (Path): Directory with saved game logs.
+        workers (Optional[int]): Worker processes (default: one per CPU).
+
+    Returns:
+        Dict[str, ModelAccuracy]: Per-model move counts and accuracy.
+    """
+    files = sorted(Path(games_dir).glob("*.json"))
+    totals: Dict[str, ModelAccuracy] = {}
+    if not files:
+        return totals
+
+    # Larger chunks keep the per-task overhead low on big archives
+    chunksize = max(1, len(files) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(_analyse_file, files, chunksize=chunksize):
+            for name, model in stats.items():
+                totals.setdefault(name, ModelAccuracy()).merge(model)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TicTacToe move-quality analysis")
+    parser.add_argument(
+        "--games-dir", type=Path, default=GAMES_DIR, help="Saved game logs"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    totals = analyse_archive(args.games_dir, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Analysed {sum(m.moves for m in totals.values())} moves in {elapsed:.1f}s")
+    ranked = sorted(totals.items(), key=lambda item: item[1].accuracy, reverse=True)
+    for name, model in ranked:
+        counts = ", ".join(f"{model.counts[label]} {label}" for label in LABELS)
+        print(
+            f"  {name}: {model.accuracy:.1%} accuracy over {model.moves} moves "
+            f"in {model.games} games ({counts})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,79 @@
+import re
 from core.game.base import BaseGame
-from typing import List
+from typing import Any, Dict, KeysView, List, Tuple
+
+# Cell (r, c) is bit r * 3 + c of a player's bitboard
+FULL_BOARD = (1 << 9) - 1
+WIN_MASKS = (
+    # Rows
+    0b000000111,
+    0b000111000,
+    0b111000000,
+    # Columns
+    0b001001001,
+    0b010010010,
+    0b100100100,
+    # Diagonals
+    0b100010001,
+    0b001010100,
+)
+# Win masks through each cell, so a move only tests the lines it touches
+_CELL_WIN_MASKS = tuple(
+    tuple(mask for mask in WIN_MASKS if mask >> bit & 1) for bit in range(9)
+)
+
+_MOVE_PATTERN = re.compile(r"\(?(\d+)[\s,]+(\d+)\)?")
 
 
 class TicTacToe(BaseGame):
     def __init__(self):
-        # 3x3 board, empty string is empty spot
-        self.board = [[" " for _ in range(3)] for _ in range(3)]
+        # One bitboard per player symbol; a cell is empty if no board has its bit
+        self.bitboards: Dict[str, int] = {}
+        self.occupied = 0
         self.winner = None
+        # Empty cells in row-major order; a dict so removal keeps the order
+        self._legal: Dict[Tuple[int, int], None] = dict.fromkeys(
+            divmod(bit, 3) for bit in range(9)
+        )
+
+    @property
+    def board(self) -> List[List[str]]:
+        return self.get_board_state()
+
+    @property
+    def legal_moves(self) -> KeysView:
+        """Set-like live view of the empty (row, col) cells."""
+        return self._legal.keys()
+
+    @property
+    def empty_cells(self) -> int:
+        return len(self._legal)
 
     def get_board_state(self) -> List[List[str]]:
-        # Return a copy to prevent mutation of history logs
-        return [row[:] for row in self.board]
+        # Fresh lists every call, so history logs never share state
+        cells = [" "] * 9
+        for symbol, bits in self.bitboards.items():
+            while bits:
+                low = bits & -bits
+                cells[low.bit_length() - 1] = symbol
+                bits ^= low
+        return [cells[0:3], cells[3:6], cells[6:9]]
 
     def _render_board_text(self) -> str:
         lines = ["Current state:"]
-        for i, row in enumerate(self.board):
+        for i, row in enumerate(self.get_board_state()):
             vis_row = [cell if cell.strip() else "_" for cell in row]
             lines.append(f"- Row {i}: {', '.join(vis_row)}")
         return "\n".join(lines)
 
     def get_available_moves(self) -> List[tuple]:
-        moves = []
-        for r in range(3):
-            for c in range(3):
-                if self.board[r][c] == " ":
-                    moves.append((r, c))
-        return moves
+        return list(self._legal)
 
     def make_move(self, move: str, player_symbol: str) -> bool:
         # Expect format "row,col" e.g. "1,1"
         try:
-            import re
-
             # Find all coordinate-like patterns (num, num) or num,num
-            matches = list(re.finditer(r"\(?(\d+)[\s,]+(\d+)\)?", move))
+            matches = list(_MOVE_PATTERN.finditer(move))
 
             if not matches:
                 return False
@@ -42,43 +82,43 @@ class TicTacToe(BaseGame):
             last_match = matches[-1]
             r, c = int(last_match.group(1)), int(last_match.group(2))
 
-            if 0 <= r < 3 and 0 <= c < 3 and self.board[r][c] == " ":
-                self.board[r][c] = player_symbol
+            if 0 <= r < 3 and 0 <= c < 3:
+                bit = r * 3 + c
+                if self.occupied >> bit & 1:
+                    return False
+                bits = self.bitboards.get(player_symbol, 0) | 1 << bit
+                self.bitboards[player_symbol] = bits
+                self.occupied |= 1 << bit
+                del self._legal[r, c]
+                if self.winner is None and any(
+                    bits & mask == mask for mask in _CELL_WIN_MASKS[bit]
+                ):
+                    self.winner = player_symbol
                 return True
             return False
         except (ValueError, IndexError):
             return False
 
     def is_game_over(self) -> bool:
-        # Check rows, columns and diagonals
-        b = self.board
-
-        # Rows and columns
-        for i in range(3):
-            if b[i][0] == b[i][1] == b[i][2] and b[i][0] != " ":
-                self.winner = b[i][0]
-                return True
-            if b[0][i] == b[1][i] == b[2][i] and b[0][i] != " ":
-                self.winner = b[0][i]
-                return True
-
-        # Diagonals
-        if b[0][0] == b[1][1] == b[2][2] and b[0][0] != " ":
-            self.winner = b[0][0]
-            return True
-        if b[0][2] == b[1][1] == b[2][0] and b[0][2] != " ":
-            self.winner = b[0][2]
-            return True
-
-        # Draw (full board)
-        if not any(" " in row for row in b):
-            return True
-
-        return False
+        # Wins are detected in make_move; a full board without one is a draw
+        return self.winner is not None or not self._legal
 
     def get_winner(self) -> str | None:
         return self.winner
 
+    def snapshot(self) -> Any:
+        return (
+            tuple(self.bitboards.items()),
+            self.occupied,
+            self.winner,
+            tuple(self._legal),
+        )
+
+    def restore(self, state: Any) -> None:
+        bitboards, self.occupied, self.winner, legal = state
+        self.bitboards = dict(bitboards)
+        self._legal = dict.fromkeys(legal)
+
     def get_state_for_player(self, player_idx: int) -> str:
         symbol = "X" if player_idx == 0 else "O"
         return f"You are playing as symbol: '{symbol}'.\nThis is a standard 3x3 Tic-Tac-Toe.\n\nCurrent game state:\n{self._render_board_text()}\n\nWhat is your next move? Please output coordinates in 'row,col' format (e.g. '1,1' for center)."
@@ -0,0 +1,142 @@
+"""
+Perfect-play solver for 3x3 TicTacToe.
+
+Every position reachable from the empty board is solved once by negamax and
+stored in a table keyed by its canonical form under the 8 board symmetries
+(765 entries). After that, picking a move is a handful of table lookups.
+
+Positions are pairs of bitboards (player to move, opponent) in the layout of
+games.tictactoe.game: cell (r, c) is bit r * 3 + c.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from .game import FULL_BOARD, WIN_MASKS
+
+# Cell permutations of the 8 symmetries: 4 rotations, each optionally mirrored
+_SYMMETRIES: List[List[int]] = []
+for _mirror in (False, True):
+    for _turns in range(4):
+        _perm = []
+        for _bit in range(9):
+            _r, _c = divmod(_bit, 3)
+            if _mirror:
+                _c = 2 - _c
+            for _ in range(_turns):
+                _r, _c = _c, 2 - _r
+            _perm.append(_r * 3 + _c)
+        _SYMMETRIES.append(_perm)
+
+# Per symmetry: bitboard -> transformed bitboard, for all 512 boards
+_TRANSFORMS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        sum(1 << perm[bit] for bit in range(9) if mask >> bit & 1)
+        for mask in range(1 << 9)
+    )
+    for perm in _SYMMETRIES
+)
+
+
+def canonical(me: int, opp: int) -> int:
+    """Smallest symmetric image of a position, packed as me << 9 | opp."""
+    return min(t[me] << 9 | t[opp] for t in _TRANSFORMS)
+
+
+def has_line(bits: int) -> bool:
+    return any(bits & mask == mask for mask in WIN_MASKS)
+
+
+@lru_cache(maxsize=1)
+def solve_all() -> Dict[int, int]:
+    """
+    Solves every reachable position.
+
+    Returns:
+        Dict[int, int]: canonical position -> value for the player to move.
+        Positive is a win, negative a loss, 0 a draw; faster wins and slower
+        losses have larger values.
+    """
+    table: Dict[int, int] = {}
+
+    def value(me: int, opp: int) -> int:
+        key = canonical(me, opp)
+        if key in table:
+            return table[key]
+
+        occupied = me | opp
+        empty = 9 - occupied.bit_count()
+        if has_line(opp):
+            # The previous move won
+            result = -(empty + 1)
+        elif occupied == FULL_BOARD:
+            result = 0
+        else:
+            result = max(
+                -value(opp, me | 1 << bit)
+                for bit in range(9)
+                if not occupied >> bit & 1
+            )
+        table[key] = result
+        return result
+
+    value(0, 0)
+    return table
+
+
+def best_move(me: int, opp: int) -> Optional[Tuple[int, int]]:
+    """
+    Optimal move for the player to move.
+
+    Returns:
+        Optional[Tuple[int, int]]: (row, col), or None if the game is already over.
+    """
+    if has_line(me) or has_line(opp):
+        return None
+    table = solve_all()
+    occupied = me | opp
+    best_bit, best_value = None, None
+    for bit in range(9):
+        if occupied >> bit & 1:
+            continue
+        child = table.get(canonical(opp, me | 1 << bit))
+        if child is None:
+            # Not reachable from a legal game (e.g. hand-edited board); skip
+            continue
+        if best_value is None or -child > best_value:
+            best_bit, best_value = bit, -child
+    return divmod(best_bit, 3) if best_bit is not None else None
+
+
+_SYMBOL_PATTERN = re.compile(r"playing as symbol: '([^']+)'")
+_ROW_PATTERN = re.compile(r"Row (\d): (.+)")
+
+
+def position_from_prompt(prompt: str) -> Tuple[str, int, int]:
+    """
+    Reads the position from TicTacToe.get_state_for_player text.
+
+    Returns:
+        Tuple[str, int, int]: (own symbol, own bitboard, opponent bitboard).
+    """
+    symbol_match = _SYMBOL_PATTERN.search(prompt)
+    if not symbol_match:
+        raise ValueError("Prompt does not say which symbol we play")
+    symbol = symbol_match.group(1)
+
+    me = opp = 0
+    rows = _ROW_PATTERN.findall(prompt)
+    if len(rows) != 3:
+        raise ValueError("Prompt does not contain a 3x3 board")
+    for r, row in rows:
+        cells = [cell.strip() for cell in row.split(",")]
+        if len(cells) != 3:
+            raise ValueError(f"Malformed board row: {row}")
+        for c, cell in enumerate(cells):
+            bit = 1 << (int(r) * 3 + c)
+            if cell == symbol:
+                me |= bit
+            elif cell not in ("_", ""):
+                opp |= bit
+    return symbol, me, opp
@@ -1,43 +1,141 @@
+import re
 from core.game.base import BaseGame
-from typing import List
+from typing import Any, Dict, KeysView, List, Optional, Tuple
+
+_MOVE_PATTERN = re.compile(r"\(?(\d+)[\s,]+(\d+)\)?")
+
+
+def has_run(bits: int, shift: int, length: int) -> bool:
+    """
+    Whether `bits` has `length` set bits in a row with the given bit stride.
+    Each step ANDs the board with itself shifted, doubling the run length it
+    tests, so a run of k costs about log2(k) big-int operations.
+    """
+    run = 1
+    while run * 2 <= length:
+        bits &= bits >> (shift * run)
+        run *= 2
+    if run < length:
+        bits &= bits >> (shift * (length - run))
+    return bits != 0
+
+
+# Boards with more cells than this are rendered sparsely by default
+SPARSE_RENDER_CELLS = 81
 
 
 class TicTacToePlus(BaseGame):
-    def __init__(self):
-        # 9x9 board, empty string is empty spot
-        self.size = 9
-        self.win_condition = 5
-        self.board = [[" " for _ in range(self.size)] for _ in range(self.size)]
+    """
+    m,n,k game: `rows` x `cols` board, `win_condition` in a row wins.
+    Defaults to Connect 5 on 9x9.
+    """
+
+    def __init__(
+        self,
+        rows: int = 9,
+        cols: Optional[int] = None,
+        win_condition: int = 5,
+        sparse: Optional[bool] = None,
+    ):
+        cols = rows if cols is None else cols
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Invalid board size {rows}x{cols}")
+        if not 1 <= win_condition <= max(rows, cols):
+            raise ValueError(
+                f"Cannot get {win_condition} in a row on a {rows}x{cols} board"
+            )
+        self.rows = rows
+        self.cols = cols
+        self.win_condition = win_condition
+        # Sparse prompts list occupied cells only; by default large boards use them
+        self.sparse = rows * cols > SPARSE_RENDER_CELLS if sparse is None else sparse
+        self._init_bitboards()
+
+    def _init_bitboards(self):
+        # Cell (r, c) is bit r * stride + c. The stride has one spare column
+        # that always stays empty, so runs cannot wrap into the next row.
+        self.stride = self.cols + 1
+        # Shifts to the next cell along -, |, \ and /
+        self.line_shifts = (1, self.stride, self.stride + 1, self.stride - 1)
+        # One bitboard per player symbol
+        self.bitboards: Dict[str, int] = {}
+        self.occupied = 0
         self.winner = None
+        # Empty cells in row-major order; a dict so removal keeps the order
+        self._legal: Dict[Tuple[int, int], None] = dict.fromkeys(
+            (r, c) for r in range(self.rows) for c in range(self.cols)
+        )
+
+    @property
+    def board(self) -> List[List[str]]:
+        return self.get_board_state()
+
+    @property
+    def legal_moves(self) -> KeysView:
+        """Set-like live view of the empty (row, col) cells."""
+        return self._legal.keys()
+
+    @property
+    def empty_cells(self) -> int:
+        return len(self._legal)
 
     def get_board_state(self) -> List[List[str]]:
-        # Return a copy to prevent mutation of history logs
-        return [row[:] for row in self.board]
+        # Fresh lists every call, so history logs never share state
+        rows = [[" "] * self.cols for _ in range(self.rows)]
+        for symbol, bits in self.bitboards.items():
+            while bits:
+                low = bits & -bits
+                r, c = divmod(low.bit_length() - 1, self.stride)
+                rows[r][c] = symbol
+                bits ^= low
+        return rows
+
+    def _grid_description(self) -> str:
+        if self.rows == self.cols:
+            return f"{self.rows}x{self.cols} grid, coordinates 0-{self.rows - 1}"
+        return (
+            f"{self.rows}x{self.cols} grid, rows 0-{self.rows - 1}, "
+            f"columns 0-{self.cols - 1}"
+        )
 
     def _render_board_text(self) -> str:
-        lines = ["Current state (9x9 grid, coordinates 0-8):"]
+        if self.sparse:
+            return self._render_sparse_text()
+        lines = [f"Current state ({self._grid_description()}):"]
         # Add column header
-        lines.append("    " + " ".join(str(i) for i in range(self.size)))
-        for i, row in enumerate(self.board):
+        lines.append("    " + " ".join(str(i) for i in range(self.cols)))
+        for i, row in enumerate(self.get_board_state()):
             vis_row = [cell if cell.strip() else "_" for cell in row]
             lines.append(f"Row {i}: {' '.join(vis_row)}")
         return "\n".join(lines)
 
+    def _render_sparse_text(self) -> str:
+        # A full grid costs rows * cols tokens whatever the position; listing
+        # the stones costs a few tokens per stone
+        lines = [
+            f"Current state ({self._grid_description()}; "
+            f"{self.rows * self.cols - self.empty_cells} stones placed, "
+            "cells not listed are empty):"
+        ]
+        for symbol in ("X", "O"):
+            bits = self.bitboards.get(symbol, 0)
+            cells = []
+            while bits:
+                low = bits & -bits
+                r, c = divmod(low.bit_length() - 1, self.stride)
+                cells.append(f"({r},{c})")
+                bits ^= low
+            lines.append(f"- {symbol}: {', '.join(cells) if cells else 'none'}")
+        return "\n".join(lines)
+
     def get_available_moves(self) -> List[tuple]:
-        moves = []
-        for r in range(self.size):
-            for c in range(self.size):
-                if self.board[r][c] == " ":
-                    moves.append((r, c))
-        return moves
+        return list(self._legal)
 
     def make_move(self, move: str, player_symbol: str) -> bool:
         # Expect format "row,col" e.g. "4,4"
         try:
-            import re
-
             # Find all coordinate-like patterns (num, num) or num,num
-            matches = list(re.finditer(r"\(?(\d+)[\s,]+(\d+)\)?", move))
+            matches = list(_MOVE_PATTERN.finditer(move))
 
             if not matches:
                 return False
@@ -46,8 +144,16 @@ class TicTacToePlus(BaseGame):
             last_match = matches[-1]
             r, c = int(last_match.group(1)), int(last_match.group(2))
 
-            if 0 <= r < self.size and 0 <= c < self.size and self.board[r][c] == " ":
-                self.board[r][c] = player_symbol
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                bit = 1 << (r * self.stride + c)
+                if self.occupied & bit:
+                    return False
+                bits = self.bitboards.get(player_symbol, 0) | bit
+                self.bitboards[player_symbol] = bits
+                self.occupied |= bit
+                del self._legal[r, c]
+                if self.winner is None and self._has_line(bits):
+                    self.winner = player_symbol
                 return True
 
             # If rejected, log why (internal log)
@@ -55,52 +161,50 @@ class TicTacToePlus(BaseGame):
         except (ValueError, IndexError):
             return False
 
+    def _has_line(self, bits: int) -> bool:
+        """Whether a player's bitboard holds `win_condition` in a row in any direction."""
+        return any(
+            has_run(bits, shift, self.win_condition) for shift in self.line_shifts
+        )
+
     def is_game_over(self) -> bool:
-        # Check rows, columns and diagonals for 5 in a row
-        b = self.board
-        s = self.size
-        w = self.win_condition
-
-        for r in range(s):
-            for c in range(s):
-                if b[r][c] == " ":
-                    continue
-
-                symbol = b[r][c]
-
-                # Check horizontal
-                if c <= s - w:
-                    if all(b[r][c + i] == symbol for i in range(w)):
-                        self.winner = symbol
-                        return True
-
-                # Check vertical
-                if r <= s - w:
-                    if all(b[r + i][c] == symbol for i in range(w)):
-                        self.winner = symbol
-                        return True
-
-                # Check diagonal (\)
-                if r <= s - w and c <= s - w:
-                    if all(b[r + i][c + i] == symbol for i in range(w)):
-                        self.winner = symbol
-                        return True
-
-                # Check anti-diagonal (/)
-                if r >= w - 1 and c <= s - w:
-                    if all(b[r - i][c + i] == symbol for i in range(w)):
-                        self.winner = symbol
-                        return True
-
-        # Draw (full board)
-        if not any(" " in row for row in b):
-            return True
-
-        return False
+        # Wins are detected in make_move; a full board without one is a draw
+        return self.winner is not None or not self._legal
 
     def get_winner(self) -> str | None:
         return self.winner
 
+    def snapshot(self) -> Any:
+        return (
+            self.rows,
+            self.cols,
+            self.win_condition,
+            self.sparse,
+            tuple(self.bitboards.items()),
+            self.occupied,
+            self.winner,
+            tuple(self._legal),
+        )
+
+    def restore(self, state: Any) -> None:
+        (
+            rows,
+            cols,
+            self.win_condition,
+            self.sparse,
+            bitboards,
+            occupied,
+            winner,
+            legal,
+        ) = state
+        if (getattr(self, "rows", None), getattr(self, "cols", None)) != (rows, cols):
+            self.rows, self.cols = rows, cols
+            self._init_bitboards()
+        self.bitboards = dict(bitboards)
+        self.occupied = occupied
+        self.winner = winner
+        self._legal = dict.fromkeys(legal)
+
     def get_state_for_player(self, player_idx: int) -> str:
         symbol = "X" if player_idx == 0 else "O"
-        return f"You are playing as symbol: '{symbol}'.\nThis is a 9x9 Tic-Tac-Toe Plus (Connect 5).\n\n{self._render_board_text()}\n\nWhat is your next move? Please output coordinates in 'row,col' format."
+        return f"You are playing as symbol: '{symbol}'.\nThis is a {self.rows}x{self.cols} Tic-Tac-Toe Plus (Connect {self.win_condition}).\n\n{self._render_board_text()}\n\nWhat is your next move? Please output coordinates in 'row,col' format."
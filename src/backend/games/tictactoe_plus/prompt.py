@@ -1,11 +1,20 @@
-PROMPT_TICTACTOE_PLUS = """You are an expert Tic-Tac-Toe player playing on a 9x9 grid.
-The grid uses coordinates: ROW (0-8) and COLUMN (0-8).
+_NUMBER_WORDS = {3: "THREE", 4: "FOUR", 5: "FIVE", 6: "SIX", 7: "SEVEN"}
 
-Objective: Win by connecting exactly FIVE of your symbols in a row (horizontally, vertically, or diagonally).
+
+def build_prompt(rows: int = 9, cols: int = 9, win_condition: int = 5) -> str:
+    """System prompt for a `rows` x `cols` board with `win_condition` in a row to win."""
+    needed = _NUMBER_WORDS.get(win_condition, str(win_condition))
+    return f"""You are an expert Tic-Tac-Toe player playing on a {rows}x{cols} grid.
+The grid uses coordinates: ROW (0-{rows - 1}) and COLUMN (0-{cols - 1}).
+
+Objective: Win by connecting exactly {needed} of your symbols in a row (horizontally, vertically, or diagonally).
 Strategy: Analyze the board and play strategically to achieve victory.
 
 Output: You can include your reasoning, but the LAST LINE of your response MUST be exactly:
 action : row,col
 
 Example:
-action : 4,4"""
+action : {rows // 2},{cols // 2}"""
+
+
+PROMPT_TICTACTOE_PLUS = build_prompt()
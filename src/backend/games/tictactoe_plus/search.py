@@ -0,0 +1,462 @@
+"""
+Search engine for TicTacToePlus (k-in-a-row on an m x n board, Connect-5 by default).
+
+The engine tracks, for every window of k consecutive cells, how many stones
+each player has in it. That gives an incremental evaluation, instant win and
+"four" (one move from winning) detection, and cheap move ordering.
+
+A move is chosen in three steps:
+1. Forced moves: win now, or block the opponent's only winning cell.
+2. Threat-space search: VCF (a chain of fours the opponent must answer) and,
+   if time allows, VCT (chains of fours and threes).
+3. Iterative deepening negamax alpha-beta with a Zobrist-hashed transposition
+   table, until the time budget runs out.
+"""
+
+import random
+import re
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+EMPTY = 0
+INF = 1 << 30
+WIN_SCORE = 1 << 24
+
+_TT_EXACT, _TT_LOWER, _TT_UPPER = 0, 1, 2
+
+# Max candidate moves searched per node below the root
+_BRANCHING = 12
+
+
+class _Timeout(Exception):
+    pass
+
+
+class Connect5Search:
+    """
+    Search state for one position. Players are 1 and 2; `load` maps the
+    player to move to 1.
+    """
+
+    def __init__(
+        self,
+        rows: int = 9,
+        cols: Optional[int] = None,
+        win_length: int = 5,
+        seed: int = 0x5EED,
+    ):
+        cols = rows if cols is None else cols
+        self.rows = rows
+        self.cols = cols
+        self.k = win_length
+        n = rows * cols
+
+        # Every k-cell window along -, |, \ and /
+        self.windows: List[Tuple[int, ...]] = []
+        for r in range(rows):
+            for c in range(cols):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r, end_c = r + dr * (win_length - 1), c + dc * (win_length - 1)
+                    if 0 <= end_r < rows and 0 <= end_c < cols:
+                        self.windows.append(
+                            tuple(
+                                (r + dr * i) * cols + c + dc * i
+                                for i in range(win_length)
+                            )
+                        )
+        self.cell_windows: List[List[int]] = [[] for _ in range(n)]
+        for w, cells in enumerate(self.windows):
+            for cell in cells:
+                self.cell_windows[cell].append(w)
+
+        # Cells within distance 2, used to generate candidate moves
+        self.neighbours: List[Tuple[int, ...]] = []
+        for cell in range(n):
+            r, c = divmod(cell, cols)
+            self.neighbours.append(
+                tuple(
+                    rr * cols + cc
+                    for rr in range(max(0, r - 2), min(rows, r + 3))
+                    for cc in range(max(0, c - 2), min(cols, c + 3))
+                    if (rr, cc) != (r, c)
+                )
+            )
+
+        # Window value by own stone count (opponent count 0)
+        self.weights = [0] + [8**i for i in range(win_length - 1)] + [WIN_SCORE]
+
+        # Zobrist keys per player and cell. The side to move follows from the
+        # stones on the board, so it needs no key of its own.
+        rng = random.Random(seed)
+        self.zobrist = [[0] * n] + [
+            [rng.getrandbits(64) for _ in range(n)] for _ in range(2)
+        ]
+
+        self.tt: Dict[int, Tuple[int, int, int, int]] = {}
+        self.reset()
+
+    # === POSITION ===
+
+    def reset(self):
+        n = self.rows * self.cols
+        self.cells = [EMPTY] * n
+        self.counts = [[0] * len(self.windows) for _ in range(3)]
+        self.fours: List[Set[int]] = [set(), set(), set()]
+        self.stones: List[int] = []
+        self.score = 0  # Evaluation from player 1's point of view
+        self.hash = 0
+
+    def load(self, board: List[List[str]], symbol: str):
+        """Sets up a board (rows of symbols, " " or "_" for empty) with `symbol` to move."""
+        self.reset()
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell.strip() and cell != "_":
+                    self.place(r * self.cols + c, 1 if cell == symbol else 2)
+
+    def _window_value(self, w: int) -> int:
+        own, other = self.counts[1][w], self.counts[2][w]
+        if other == 0:
+            return self.weights[own]
+        if own == 0:
+            return -self.weights[other]
+        return 0
+
+    def _update_four(self, w: int):
+        for p, q in ((1, 2), (2, 1)):
+            if self.counts[p][w] == self.k - 1 and self.counts[q][w] == 0:
+                self.fours[p].add(w)
+            else:
+                self.fours[p].discard(w)
+
+    def place(self, cell: int, player: int) -> bool:
+        """Puts a stone down; returns True if it completes a line."""
+        counts = self.counts[player]
+        won = False
+        for w in self.cell_windows[cell]:
+            before = self._window_value(w)
+            counts[w] += 1
+            self.score += self._window_value(w) - before
+            self._update_four(w)
+            if counts[w] == self.k:
+                won = True
+        self.cells[cell] = player
+        self.stones.append(cell)
+        self.hash ^= self.zobrist[player][cell]
+        return won
+
+    def remove(self, cell: int):
+        player = self.cells[cell]
+        counts = self.counts[player]
+        for w in self.cell_windows[cell]:
+            before = self._window_value(w)
+            counts[w] -= 1
+            self.score += self._window_value(w) - before
+            self._update_four(w)
+        self.cells[cell] = EMPTY
+        self.stones.pop()
+        self.hash ^= self.zobrist[player][cell]
+
+    # === MOVE GENERATION ===
+
+    def _empty_cell(self, w: int) -> int:
+        for cell in self.windows[w]:
+            if self.cells[cell] == EMPTY:
+                return cell
+        return -1
+
+    def winning_cells(self, player: int) -> Set[int]:
+        """Empty cells that complete a line for `player` right away."""
+        return {self._empty_cell(w) for w in self.fours[player]}
+
+    def _move_value(self, cell: int, player: int) -> int:
+        """Ordering heuristic: how much a stone here builds own lines and breaks the opponent's."""
+        own_counts, other_counts = self.counts[player], self.counts[3 - player]
+        value = 0
+        for w in self.cell_windows[cell]:
+            own, other = own_counts[w], other_counts[w]
+            if other == 0:
+                value += self.weights[own + 1]
+            if own == 0:
+                value += self.weights[other + 1] // 2
+        return value
+
+    def candidates(self, player: int) -> List[int]:
+        """Empty cells near existing stones, best first."""
+        if not self.stones:
+            return [self.rows // 2 * self.cols + self.cols // 2]
+        cells = self.cells
+        near = {
+            cell
+            for stone in self.stones
+            for cell in self.neighbours[stone]
+            if cells[cell] == EMPTY
+        }
+        return sorted(near, key=lambda cell: -self._move_value(cell, player))
+
+    def forced_moves(self, player: int) -> Optional[List[int]]:
+        """Win if possible, else the cells blocking the opponent's win, else None."""
+        wins = self.winning_cells(player)
+        if wins:
+            return [min(wins)]
+        blocks = self.winning_cells(3 - player)
+        if blocks:
+            return sorted(blocks)
+        return None
+
+    # === THREAT SPACE SEARCH ===
+
+    def _three_windows(self, player: int) -> List[int]:
+        """Windows holding k - 2 own stones and no opponent stones."""
+        own, other = self.counts[player], self.counts[3 - player]
+        target = self.k - 2
+        return [
+            w for w in range(len(self.windows)) if own[w] == target and other[w] == 0
+        ]
+
+    def _window_empties(self, windows: List[int]) -> Set[int]:
+        cells = self.cells
+        return {c for w in windows for c in self.windows[w] if cells[c] == EMPTY}
+
+    def _threatens_open_four(self, player: int) -> bool:
+        """Whether `player` has a move that creates two winning cells at once."""
+        for cell in self._window_empties(self._three_windows(player)):
+            self.place(cell, player)
+            double = len(self.winning_cells(player)) >= 2
+            self.remove(cell)
+            if double:
+                return True
+        return False
+
+    def threat_search(
+        self, player: int, depth: int, with_threes: bool
+    ) -> Optional[int]:
+        """
+        Looks for a forced win by `player` (to move) made of fours (VCF) and,
+        with `with_threes`, threes as well (VCT). Defender replies are limited
+        to blocking cells and counter-fours, so the search stays small.
+
+        Returns:
+            Optional[int]: The first move of a winning sequence, or None.
+        """
+        self._check_time()
+        wins = self.winning_cells(player)
+        if wins:
+            return min(wins)
+        if depth <= 0 or self.winning_cells(3 - player):
+            # Out of depth, or the opponent threatens to win first
+            return None
+
+        # Only moves that can create a four (or, for VCT, a three) are threats
+        min_own = self.k - (3 if with_threes else 2)
+        own, other = self.counts[player], self.counts[3 - player]
+        attack = [
+            w for w in range(len(self.windows)) if own[w] >= min_own and other[w] == 0
+        ]
+        moves = sorted(
+            self._window_empties(attack),
+            key=lambda cell: -self._move_value(cell, player),
+        )
+        for cell in moves:
+            self.place(cell, player)
+            found = self._wins_against_replies(player, depth, with_threes)
+            self.remove(cell)
+            if found:
+                return cell
+        return None
+
+    def _wins_against_replies(self, player: int, depth: int, with_threes: bool) -> bool:
+        """After an attacker move: True if it is a threat that every defence loses to."""
+        defender = 3 - player
+        win_cells = self.winning_cells(player)
+        if len(win_cells) >= 2:
+            # Open or double four: cannot block both
+            return True
+        if win_cells:
+            replies = sorted(win_cells)
+        elif with_threes and self._threatens_open_four(player):
+            # Block a cell of an attacking three, or counter with a four
+            replies = sorted(
+                self._window_empties(self._three_windows(player))
+                | self._window_empties(self._three_windows(defender))
+            )
+        else:
+            return False
+
+        for reply in replies:
+            if self.place(reply, defender):
+                self.remove(reply)
+                return False
+            follow = self.threat_search(player, depth - 1, with_threes)
+            self.remove(reply)
+            if follow is None:
+                return False
+        return True
+
+    # === ALPHA-BETA ===
+
+    def _check_time(self):
+        self.nodes += 1
+        if self.nodes & 255 == 0 and time.monotonic() >= self.deadline:
+            raise _Timeout()
+
+    def negamax(self, depth: int, alpha: int, beta: int, player: int, ply: int) -> int:
+        self._check_time()
+        alpha_orig = alpha
+
+        entry = self.tt.get(self.hash)
+        tt_move = -1
+        if entry is not None:
+            tt_depth, tt_value, tt_flag, tt_move = entry
+            if tt_depth >= depth:
+                if tt_flag == _TT_EXACT:
+                    return tt_value
+                if tt_flag == _TT_LOWER:
+                    alpha = max(alpha, tt_value)
+                elif tt_flag == _TT_UPPER:
+                    beta = min(beta, tt_value)
+                if alpha >= beta:
+                    return tt_value
+
+        if depth == 0:
+            return self.score if player == 1 else -self.score
+
+        moves = self.forced_moves(player)
+        if moves is None:
+            moves = self.candidates(player)[:_BRANCHING]
+            if not moves:
+                return 0  # Board full: draw
+        if tt_move in moves:
+            moves.remove(tt_move)
+            moves.insert(0, tt_move)
+
+        best, best_move = -INF, moves[0]
+        for cell in moves:
+            if self.place(cell, player):
+                value = WIN_SCORE - ply
+            else:
+                value = -self.negamax(depth - 1, -beta, -alpha, 3 - player, ply + 1)
+            self.remove(cell)
+            if value > best:
+                best, best_move = value, cell
+            alpha = max(alpha, value)
+            if alpha >= beta:
+                break
+
+        flag = _TT_EXACT
+        if best <= alpha_orig:
+            flag = _TT_UPPER
+        elif best >= beta:
+            flag = _TT_LOWER
+        self.tt[self.hash] = (depth, best, flag, best_move)
+        return best
+
+    # === ENTRY POINT ===
+
+    def best_move(
+        self, time_budget: float = 1.0, max_depth: int = 20
+    ) -> Tuple[int, str]:
+        """
+        Picks a move for player 1 within `time_budget` seconds.
+
+        Returns:
+            Tuple[int, str]: (cell index, short description of how it was found).
+        """
+        self.deadline = time.monotonic() + time_budget
+        self.nodes = 0
+
+        forced = self.forced_moves(1)
+        if forced is not None:
+            reason = "winning move" if self.winning_cells(1) else "forced block"
+            return forced[0], reason
+
+        candidates = self.candidates(1)
+        if not candidates:
+            raise ValueError("Board is full")
+        best = candidates[0]
+
+        try:
+            # Threat searches get a share of the budget; a timeout only ends that phase
+            for with_threes, depth in ((False, 10), (True, 4)):
+                saved_deadline = self.deadline
+                self.deadline = min(saved_deadline, time.monotonic() + time_budget / 4)
+                try:
+                    move = self.threat_search(1, depth, with_threes)
+                except _Timeout:
+                    move = None
+                finally:
+                    self.deadline = saved_deadline
+                if move is not None:
+                    return move, "VCT win" if with_threes else "VCF win"
+
+            reason = "heuristic"
+            for depth in range(1, max_depth + 1):
+                value = self.negamax(depth, -INF, INF, 1, 1)
+                entry = self.tt.get(self.hash)
+                if entry is not None:
+                    best = entry[3]
+                reason = f"alpha-beta depth {depth}, score {value}"
+                if abs(value) >= WIN_SCORE - max_depth - 1:
+                    break
+        except _Timeout:
+            pass
+        return best, reason
+
+
+_SYMBOL_PATTERN = re.compile(r"playing as symbol: '([^']+)'")
+_CONNECT_PATTERN = re.compile(r"Connect (\d+)")
+_GRID_PATTERN = re.compile(r"(\d+)x(\d+) grid")
+_ROW_PATTERN = re.compile(r"^Row (\d+): (.+)$", re.MULTILINE)
+# Sparse rendering: one "- X: (r,c), (r,c)" line per symbol
+_STONES_PATTERN = re.compile(r"^- (\S+): (.*)$", re.MULTILINE)
+_CELL_PATTERN = re.compile(r"\((\d+),(\d+)\)")
+
+
+def board_from_prompt(prompt: str) -> Tuple[str, List[List[str]], int]:
+    """
+    Reads the position from TicTacToePlus.get_state_for_player text, in
+    either the dense grid or the sparse stone-list rendering.
+
+    Returns:
+        Tuple[str, List[List[str]], int]: (own symbol, rows of cell symbols,
+        stones in a row needed to win).
+    """
+    symbol_match = _SYMBOL_PATTERN.search(prompt)
+    if not symbol_match:
+        raise ValueError("Prompt does not say which symbol we play")
+    connect_match = _CONNECT_PATTERN.search(prompt)
+    win_length = int(connect_match.group(1)) if connect_match else 5
+
+    rows = [row.split() for _, row in _ROW_PATTERN.findall(prompt)]
+    if rows:
+        if any(len(row) != len(rows[0]) for row in rows):
+            raise ValueError("Prompt contains a ragged board")
+        return symbol_match.group(1), rows, win_length
+
+    grid_match = _GRID_PATTERN.search(prompt)
+    if not grid_match:
+        raise ValueError("Prompt does not contain a board")
+    n_rows, n_cols = int(grid_match.group(1)), int(grid_match.group(2))
+    rows = [[" "] * n_cols for _ in range(n_rows)]
+    for stone_symbol, cells in _STONES_PATTERN.findall(prompt):
+        for r, c in _CELL_PATTERN.findall(cells):
+            r, c = int(r), int(c)
+            if not (0 <= r < n_rows and 0 <= c < n_cols):
+                raise ValueError(f"Stone outside the board: {r},{c}")
+            rows[r][c] = stone_symbol
+    return symbol_match.group(1), rows, win_length
+
+
+def choose_move(
+    board: List[List[str]], symbol: str, win_length: int = 5, time_budget: float = 1.0
+) -> Tuple[Tuple[int, int], str]:
+    """
+    Best move for `symbol` on a board within `time_budget` seconds.
+
+    Returns:
+        Tuple[Tuple[int, int], str]: ((row, col), how the move was found).
+    """
+    search = Connect5Search(len(board), len(board[0]), win_length)
+    search.load(board, symbol)
+    cell, reason = search.best_move(time_budget)
+    return divmod(cell, search.cols), reason
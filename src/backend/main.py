@@ -3,20 +3,11 @@ AI Games - CLI Entry Point
 Run a quick match between two LLM players.
 """
 
-from core.llm.proxy import ProxyLLM
-from core.llm.gemini import GeminiLLM
+from core.llm.factory import get_llm_instance
 from core.game.player import Player
 from core.game.match import Match
 from games.tictactoe.game import TicTacToe
 from games.tictactoe.prompt import PROMPT_TICTACTOE
-from config.models import is_gemini_model
-
-
-def get_llm_instance(model_name: str):
-    """Factory function to get appropriate LLM instance based on model name."""
-    if is_gemini_model(model_name):
-        return GeminiLLM(model_name=model_name)
-    return ProxyLLM(model_name=model_name)
 
 
 def main():
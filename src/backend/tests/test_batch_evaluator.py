@@ -0,0 +1,32 @@
+import numpy as np
+
+from games.poker.batch_evaluator import evaluate_batch, showdown_card_ids
+from games.poker.card import ids_from_strings
+from games.poker.evaluator import score_ids
+from games.poker.game import PokerGame
+
+
+def test_hand_won_by_folding_has_no_showdown():
+    game = PokerGame(["Alice", "Bob"], seed=7)
+    game.start_new_hand()
+    assert game.make_move("fold", str(game.current_player_idx))
+
+    result = game.last_hand_result
+    assert result["player_hands"] == {}
+    assert len(result["community_cards"]) < 5
+
+    names, card_ids = showdown_card_ids(result)
+    assert names == []
+    assert card_ids.shape == (0, 7)
+    assert evaluate_batch(card_ids).shape == (0,)
+
+
+def test_showdown_matches_scalar_scores():
+    board = ["A♠", "K♠", "7♦", "7♣", "2♥"]
+    hands = {"Alice": ["A♥", "A♦"], "Bob": ["Q♠", "J♠"]}
+    result = {"community_cards": board, "player_hands": hands}
+
+    names, card_ids = showdown_card_ids(result)
+    assert names == ["Alice", "Bob"]
+    expected = [score_ids(ids_from_strings(hands[n] + board)) for n in names]
+    np.testing.assert_array_equal(evaluate_batch(card_ids), expected)
@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from config.models import get_enabled_models, supports_game
+from config.settings import settings
+from games.tictactoe_plus.search import choose_move
+
+
+def empty_board(size: int = 9):
+    return [[" "] * size for _ in range(size)]
+
+
+def test_finds_immediate_win():
+    board = empty_board()
+    for c in range(4):
+        board[4][c] = "X"
+    board[0][0] = board[0][2] = board[8][8] = "O"
+    move, reason = choose_move(board, "X", 5, settings.ENGINE_TIME_BUDGET)
+    assert move == (4, 4)
+    assert reason == "winning move"
+
+
+def test_blocks_immediate_loss():
+    board = empty_board()
+    for r in range(1, 5):
+        board[r][6] = "O"
+    board[0][6] = "X"
+    board[4][4] = board[2][2] = "X"
+    move, reason = choose_move(board, "X", 5, settings.ENGINE_TIME_BUDGET)
+    assert move == (5, 6)
+    assert reason == "forced block"
+
+
+@pytest.mark.parametrize("size", [9, 15])
+def test_stays_within_time_budget(size):
+    board = empty_board(size)
+    # An open middle game with no forced moves, so the full search runs
+    stones = [(4, 4, "X"), (4, 5, "O"), (5, 5, "X"), (3, 3, "O"), (5, 3, "X")]
+    for r, c, symbol in stones:
+        board[r][c] = symbol
+
+    budget = settings.ENGINE_TIME_BUDGET
+    start = time.monotonic()
+    (r, c), _ = choose_move(board, "O", 5, budget)
+    elapsed = time.monotonic() - start
+
+    assert board[r][c] == " "
+    # Some slack for the last node and interpreter overhead
+    assert elapsed < budget * 1.25 + 0.1
+
+
+def test_engine_is_only_offered_for_tictactoe_plus():
+    assert supports_game("engine-connect5", "tictactoe_plus")
+    assert not supports_game("engine-connect5", "tictactoe")
+    assert not supports_game("engine-connect5", "poker")
+    assert "engine-connect5" not in [m["id"] for m in get_enabled_models("poker")]
@@ -0,0 +1,138 @@
+import random
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+from games.poker.card import CARD_RANK, CARD_SUIT, CARDS, DECK_SIZE, ids_from_strings
+from games.poker.evaluator import (
+    HandStrength,
+    decode_score,
+    evaluate_hand,
+    score_ids,
+)
+
+
+def rank_five(card_ids):
+    """Plain ranking of exactly five cards, as (HandStrength, kickers)."""
+    values = sorted((CARD_RANK[c] + 2 for c in card_ids), reverse=True)
+    flush = len({CARD_SUIT[c] for c in card_ids}) == 1
+    distinct = sorted(set(values), reverse=True)
+    straight_high = None
+    if len(distinct) == 5 and distinct[0] - distinct[4] == 4:
+        straight_high = distinct[0]
+    elif distinct == [14, 5, 4, 3, 2]:
+        straight_high = 5
+
+    if straight_high and flush:
+        if straight_high == 14:
+            return HandStrength.ROYAL_FLUSH, []
+        return HandStrength.STRAIGHT_FLUSH, [straight_high]
+    # Ranks by (count, value), most frequent first
+    groups = sorted(Counter(values).items(), key=lambda g: (g[1], g[0]), reverse=True)
+    counts = [n for _, n in groups]
+    ranks = [v for v, _ in groups]
+    if counts[0] == 4:
+        return HandStrength.FOUR_OF_A_KIND, ranks
+    if counts[:2] == [3, 2]:
+        return HandStrength.FULL_HOUSE, ranks
+    if flush:
+        return HandStrength.FLUSH, values
+    if straight_high:
+        return HandStrength.STRAIGHT, [straight_high]
+    if counts[0] == 3:
+        return HandStrength.THREE_OF_A_KIND, ranks
+    if counts[:2] == [2, 2]:
+        return HandStrength.TWO_PAIR, ranks
+    if counts[0] == 2:
+        return HandStrength.PAIR, ranks
+    return HandStrength.HIGH_CARD, values
+
+
+def brute_force(card_ids):
+    return max(rank_five(five) for five in combinations(card_ids, 5))
+
+
+def score(*cards):
+    return score_ids(ids_from_strings(list(cards)))
+
+
+@pytest.mark.parametrize(
+    "cards, strength, kickers",
+    [
+        (["A♠", "K♠", "Q♠", "J♠", "10♠", "2♦", "3♣"], HandStrength.ROYAL_FLUSH, []),
+        (["9♥", "8♥", "7♥", "6♥", "5♥", "A♦", "A♣"], HandStrength.STRAIGHT_FLUSH, [9]),
+        (
+            ["7♠", "7♥", "7♦", "7♣", "K♠", "Q♦", "2♣"],
+            HandStrength.FOUR_OF_A_KIND,
+            [7, 13],
+        ),
+        (["Q♠", "Q♥", "Q♦", "4♣", "4♠", "4♦", "2♣"], HandStrength.FULL_HOUSE, [12, 4]),
+        (
+            ["A♦", "J♦", "9♦", "6♦", "3♦", "2♦", "K♣"],
+            HandStrength.FLUSH,
+            [14, 11, 9, 6, 3],
+        ),
+        (["10♠", "9♥", "8♦", "7♣", "6♠", "2♦", "2♣"], HandStrength.STRAIGHT, [10]),
+        (
+            ["5♠", "5♥", "5♦", "A♣", "J♠", "9♦", "2♣"],
+            HandStrength.THREE_OF_A_KIND,
+            [5, 14, 11],
+        ),
+        (
+            ["K♠", "K♥", "8♦", "8♣", "3♠", "3♦", "Q♣"],
+            HandStrength.TWO_PAIR,
+            [13, 8, 12],
+        ),
+        (["J♠", "J♥", "A♦", "9♣", "6♠", "4♦", "2♣"], HandStrength.PAIR, [11, 14, 9, 6]),
+        (
+            ["A♠", "Q♥", "10♦", "8♣", "6♠", "4♦", "2♣"],
+            HandStrength.HIGH_CARD,
+            [14, 12, 10, 8, 6],
+        ),
+    ],
+)
+def test_categories(cards, strength, kickers):
+    assert decode_score(score(*cards)) == (strength, kickers)
+    assert evaluate_hand([CARDS[i] for i in ids_from_strings(cards)])[:2] == (
+        strength,
+        kickers,
+    )
+
+
+def test_wheel_is_a_five_high_straight():
+    wheel = score("A♠", "2♥", "3♦", "4♣", "5♠", "9♦", "K♣")
+    six_high = score("2♥", "3♦", "4♣", "5♠", "6♥", "9♦", "K♣")
+    assert decode_score(wheel) == (HandStrength.STRAIGHT, [5])
+    assert wheel < six_high
+    steel_wheel = score("A♥", "2♥", "3♥", "4♥", "5♥", "9♦", "K♣")
+    assert decode_score(steel_wheel) == (HandStrength.STRAIGHT_FLUSH, [5])
+
+
+def test_kickers_and_ties():
+    board = ["K♠", "K♦", "8♣", "5♥", "2♠"]
+    # Same pair, the kicker decides
+    assert score("A♥", "3♣", *board) > score("Q♥", "3♦", *board)
+    # Both play the board's kickers: a tie
+    assert score("7♥", "3♣", *board) == score("7♦", "4♣", *board)
+    # Fifth kicker of a flush counts
+    assert score("A♦", "9♦", "7♦", "4♦", "3♦") > score("A♣", "9♣", "7♣", "4♣", "2♣")
+    # Two pair: the sixth card never plays
+    assert score("Q♥", "Q♦", "J♣", "J♥", "9♠", "3♦", "2♣") == score(
+        "Q♠", "Q♣", "J♦", "J♠", "9♥", "8♦", "7♣"
+    )
+
+
+def test_matches_brute_force_on_random_hands():
+    rng = random.Random(2024)
+    for _ in range(3000):
+        card_ids = rng.sample(range(DECK_SIZE), rng.choice([5, 6, 7]))
+        assert decode_score(score_ids(card_ids)) == brute_force(card_ids)
+
+
+def test_orders_like_brute_force():
+    rng = random.Random(7)
+    for _ in range(1000):
+        a, b = rng.sample(range(DECK_SIZE), 7), rng.sample(range(DECK_SIZE), 7)
+        expected = (brute_force(a) > brute_force(b)) - (brute_force(a) < brute_force(b))
+        assert (score_ids(a) > score_ids(b)) - (score_ids(a) < score_ids(b)) == expected
@@ -0,0 +1,35 @@
+from config.settings import settings
+from core.llm import cache
+from core.llm.cache import CachedLLM, ResponseCache
+from core.llm.cassette import RecordingLLM, ReplayLLM
+from core.llm.engine import EngineLLM
+from core.llm.factory import get_llm_instance
+from core.llm.human import HumanLLM
+from core.llm.mock import MockLLM
+from core.llm.proxy import ProxyLLM
+
+
+def test_local_players():
+    assert isinstance(get_llm_instance("human"), HumanLLM)
+    assert isinstance(get_llm_instance("engine-tictactoe"), EngineLLM)
+    assert isinstance(get_llm_instance("mock-random"), MockLLM)
+
+
+def test_replay_replaces_providers(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_CASSETTE", "replay")
+    assert isinstance(get_llm_instance("gpt-4o"), ReplayLLM)
+    # Local players are never replayed
+    assert isinstance(get_llm_instance("human"), HumanLLM)
+
+
+def test_providers_are_wrapped(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", "http://localhost:1")
+    monkeypatch.setattr(settings, "LLM_CACHE", True)
+    monkeypatch.setattr(cache, "_cache", ResponseCache())
+    monkeypatch.setattr(settings, "LLM_CASSETTE", "record")
+
+    llm = get_llm_instance("gpt-4o")
+    assert isinstance(llm, RecordingLLM)
+    assert isinstance(llm.llm, CachedLLM)
+    assert isinstance(llm.llm.llm, ProxyLLM)
@@ -0,0 +1,39 @@
+from core import metrics
+from core.llm.engine import EngineLLM
+from core.llm.human import HumanLLM
+from core.llm.mock import MockLLM
+from core.llm.models import LLMMetrics, LLMResponse
+
+
+def make_response(model_name: str) -> LLMResponse:
+    return LLMResponse(
+        content="action : 1,1",
+        metrics=LLMMetrics(
+            latency_ms=500, prompt_tokens=10, completion_tokens=5, total_tokens=15
+        ),
+        model_name=model_name,
+    )
+
+
+def requests_of(model_name: str) -> float:
+    return sum(
+        value
+        for labels, value in metrics.llm_requests.values.items()
+        if labels[0] == model_name
+    )
+
+
+def test_local_players_are_not_counted():
+    for llm in (HumanLLM(), EngineLLM("engine-tictactoe")):
+        metrics.record_llm_response(make_response(llm.model_name), llm)
+        assert requests_of(llm.model_name) == 0
+        assert not any(
+            labels[0] == llm.model_name for labels in metrics.llm_latency.series
+        )
+
+
+def test_remote_calls_are_counted():
+    llm = MockLLM("mock-random", config={})
+    before = requests_of(llm.model_name)
+    metrics.record_llm_response(make_response(llm.model_name), llm)
+    assert requests_of(llm.model_name) == before + 1
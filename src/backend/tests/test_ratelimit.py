@@ -0,0 +1,70 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from config.settings import settings
+from core.llm.ratelimit import RateLimiter, Throttle
+
+
+class RateLimitError(Exception):
+    status_code = 429
+    response = SimpleNamespace(headers={"retry-after-ms": "1"})
+
+
+def make_throttle(rpm: float = 0, tpm: float = 0) -> Throttle:
+    throttle = Throttle("test-model", "Test")
+    throttle.limiters = [RateLimiter("test", rpm, tpm)]
+    return throttle
+
+
+def always_rate_limited():
+    raise RateLimitError("429 Too Many Requests")
+
+
+def test_failed_attempts_are_refunded(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_RETRIES", 5)
+    throttle = make_throttle(tpm=6000)
+
+    with pytest.raises(RateLimitError):
+        throttle.call(always_rate_limited, 1000, lambda _: None)
+
+    # Six attempts of 1000 tokens, none charged
+    assert throttle.limiters[0].tokens.level == pytest.approx(6000)
+
+
+def test_async_failed_attempts_are_refunded(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_RETRIES", 5)
+    throttle = make_throttle(tpm=6000)
+
+    async def fn():
+        always_rate_limited()
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(throttle.acall(fn, 1000, lambda _: None))
+
+    assert throttle.limiters[0].tokens.level == pytest.approx(6000)
+
+
+def test_cancelled_waiter_is_refunded():
+    throttle = make_throttle(rpm=60, tpm=600)
+    limiter = throttle.limiters[0]
+
+    async def fn():
+        return "ok"
+
+    async def main():
+        # The first call spends the whole token budget; the second must wait
+        await throttle.acall(fn, 600, lambda _: 600)
+        waiter = asyncio.create_task(throttle.acall(fn, 600, lambda _: 600))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    start = time.monotonic()
+    asyncio.run(main())
+    refilled = (time.monotonic() - start) * 10  # 600 tokens per minute
+    assert limiter.tokens.level == pytest.approx(refilled, abs=1)
+    assert limiter.requests.level == pytest.approx(59, abs=0.1)
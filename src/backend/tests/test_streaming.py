@@ -0,0 +1,38 @@
+from core.llm.streaming import ActionDetector, is_action_line
+
+
+def feed_all(text: str, chunk: int = 7) -> ActionDetector:
+    detector = ActionDetector()
+    for i in range(0, len(text), chunk):
+        if detector.feed(text[i : i + chunk]):
+            break
+    return detector
+
+
+def test_action_lines():
+    assert is_action_line("action : 1,1")
+    assert is_action_line("**Action:** 2, 0")
+    assert is_action_line("Action: raise 40")
+    assert not is_action_line("Action plan: block the diagonal")
+    assert not is_action_line("Actions available: 0,0 1,1")
+    assert not is_action_line("action: I will take the centre")
+
+
+def test_stops_after_action_line():
+    detector = feed_all("Centre is free.\naction : 1,1\ntrailing text")
+    assert detector.found
+    assert detector.text == "Centre is free.\naction : 1,1\n"
+
+
+def test_reasoning_line_starting_with_action_does_not_stop():
+    reply = "Action plan: block the diagonal\nMore thought.\naction : 2,0\n"
+    detector = feed_all(reply)
+    assert detector.found
+    assert detector.text == reply
+
+
+def test_reads_to_end_without_action_line():
+    reply = "Action plan: take a corner\naction : 0,0"
+    detector = feed_all(reply)
+    assert not detector.found
+    assert detector.text == reply
@@ -0,0 +1,41 @@
+import pytest
+
+from config.models import get_enabled_models, supports_game
+from games.tictactoe.game import FULL_BOARD
+from games.tictactoe.solver import best_move, has_line, solve_all
+
+
+def test_table_covers_every_position_and_empty_board_is_a_draw():
+    table = solve_all()
+    assert len(table) == 765
+    assert table[0] == 0
+
+
+def count_games(engine: int, other: int, engine_to_move: bool) -> int:
+    """Plays every opponent reply against the solver; fails on a loss."""
+    assert not has_line(other), "solver lost"
+    if has_line(engine) or engine | other == FULL_BOARD:
+        return 1
+    if engine_to_move:
+        r, c = best_move(engine, other)
+        bit = 1 << (r * 3 + c)
+        assert not (engine | other) & bit
+        return count_games(engine | bit, other, False)
+    return sum(
+        count_games(engine, other | 1 << bit, True)
+        for bit in range(9)
+        if not (engine | other) >> bit & 1
+    )
+
+
+@pytest.mark.parametrize("engine_first", [True, False])
+def test_solver_never_loses(engine_first):
+    assert count_games(0, 0, engine_first) > 0
+
+
+def test_engine_is_only_offered_for_tictactoe():
+    assert supports_game("engine-tictactoe", "tictactoe")
+    assert not supports_game("engine-tictactoe", "poker")
+    assert not supports_game("engine-tictactoe", "tictactoe_plus")
+    assert "engine-tictactoe" not in [m["id"] for m in get_enabled_models("poker")]
+    assert supports_game("gpt-4o", "poker")
@@ -19,6 +19,7 @@ export const GameBoard: React.FC<GameBoardProps> = ({
     const defaultSize = gameType === 'tictactoe_plus' ? 9 : 3;
     const board: string[][] = (gameState?.board as string[][]) || Array(defaultSize).fill(null).map(() => Array(defaultSize).fill(" "));
     const size = board.length;
+    const cols = board[0]?.length ?? size;
 
     const isHumanTurn = gameState && !gameState.game_over &&
         ((gameState.current_symbol === 'X' && p1Model?.toLowerCase() === 'human') ||
@@ -38,14 +39,14 @@ export const GameBoard: React.FC<GameBoardProps> = ({
         <div
             className={`grid gap-2 mx-auto p-4 rounded-2xl ${isHumanTurn ? 'ring-2 ring-emerald-500/50 bg-emerald-500/5' : ''}`}
             style={{
-                gridTemplateColumns: `1.5rem repeat(${size}, ${cellSize})`
+                gridTemplateColumns: `1.5rem repeat(${cols}, ${cellSize})`
             }}
         >
             {/* Top-left corner spacer */}
             <div />
 
             {/* Column Indices */}
-            {Array.from({ length: size }).map((_, i) => (
+            {Array.from({ length: cols }).map((_, i) => (
                 <div key={`col-${i}`} className="flex items-center justify-center text-[10px] font-black text-text/20 uppercase tracking-tighter">
                     {i}
                 </div>
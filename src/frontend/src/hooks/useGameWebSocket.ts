@@ -70,6 +70,12 @@ export function useGameWebSocket({
 
             if (data.message === "Session ended") return;
 
+            // Streamed reply of the thinking player: append, don't log
+            if (data.type === "thinking_delta") {
+                setGameState(prev => prev ? { ...prev, live_thinking: (prev.live_thinking || "") + data.delta } : prev);
+                return;
+            }
+
             if (data.error) {
                 alert("Error: " + data.error);
                 socket.close();
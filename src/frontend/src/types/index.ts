@@ -25,6 +25,7 @@ export interface GameState {
     thinking?: string;
     system_prompt?: string;
     user_prompt?: string;
+    live_thinking?: string;
 }
 
 export interface LogEntry {
@@ -53,6 +54,7 @@ export interface ModelConfig {
     name: string;
     provider: string;
     enabled: boolean;
+    games?: string[]; // Game types the model can play; all of them if absent
 }
 
 export interface ProviderStatus {
@@ -104,6 +104,11 @@ export const GameStatusOverlay: React.FC<GameStatusOverlayProps> = ({
                         )}
                     </div>
                 )}
+                {gameState.is_thinking && gameState.live_thinking && (
+                    <div className="mx-auto mt-2 max-w-xl px-4 py-2 rounded-lg bg-black/60 border border-white/10 text-gray-400 font-mono text-[10px] whitespace-pre-wrap break-words">
+                        {gameState.live_thinking.slice(-200)}
+                    </div>
+                )}
             </div>
         );
     }
@@ -17,6 +17,10 @@ interface GamesViewProps {
     isDebugMode?: boolean;
 }
 
+// Local engines only play their own game
+const playsGame = (model: ModelConfig, gameId: string) =>
+    !model.games || model.games.includes(gameId);
+
 export const GamesView: React.FC<GamesViewProps> = ({
     models,
     gameModels,
@@ -146,7 +150,7 @@ export const GamesView: React.FC<GamesViewProps> = ({
                                                                     }}
                                                                 >
                                                                     <option value="" disabled>Select Model</option>
-                                                                    {models.filter(m => !m.name.includes("Custom") && !m.id.includes("custom")).map(m => (
+                                                                    {models.filter(m => !m.name.includes("Custom") && !m.id.includes("custom") && playsGame(m, game.id)).map(m => (
                                                                         <option key={m.id} value={m.id}>{m.name}</option>
                                                                     ))}
                                                                 </select>
@@ -186,7 +190,7 @@ export const GamesView: React.FC<GamesViewProps> = ({
                                                     }}
                                                 >
                                                     <option value="" disabled>Select Model</option>
-                                                    {models.filter(m => !m.name.includes("Custom")).map(m => <option key={m.id} value={m.id}>{m.name}</option>)}
+                                                    {models.filter(m => !m.name.includes("Custom") && playsGame(m, game.id)).map(m => <option key={m.id} value={m.id}>{m.name}</option>)}
                                                 </select>
                                             </div>
                                         </div>
@@ -222,7 +226,7 @@ export const GamesView: React.FC<GamesViewProps> = ({
                                                     }}
                                                 >
                                                     <option value="" disabled>Select Model</option>
-                                                    {models.filter(m => !m.name.includes("Custom")).map(m => <option key={m.id} value={m.id}>{m.name}</option>)}
+                                                    {models.filter(m => !m.name.includes("Custom") && playsGame(m, game.id)).map(m => <option key={m.id} value={m.id}>{m.name}</option>)}
                                                 </select>
                                                 <div className="bg-background/50 border border-white/5 rounded-xl p-2 flex items-center justify-center shrink-0 mr-1">
                                                     <ModelIcon